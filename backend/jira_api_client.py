@@ -39,6 +39,8 @@ class JiraAPIClient:
         self.proxy_url = f"http://{self.config.PROXY_HOST}:{self.config.PROXY_PORT}"
         # Check if we should use proxy or not
         self.use_proxy = os.getenv("USE_PROXY", "auto").lower()  # auto, yes, no
+        # issue id -> issue key (keys never change for an id, so this lives for the process)
+        self._issue_key_cache: Dict[str, str] = {}
         logger.info(f"Jira client initialized. Proxy mode: {self.use_proxy}, Proxy URL: {self.proxy_url}")
     
     def _curl_get(self, url: str, params: dict = None, use_proxy: bool = True) -> Optional[dict]:
@@ -326,6 +328,32 @@ class JiraAPIClient:
         logger.error("=== SEARCH FAILED after all retries ===")
         return []
     
+    def get_issue_keys_bulk(self, issue_ids: List[Any], batch_size: int = 100) -> Dict[str, str]:
+        """
+        Resolve issue ids to keys with one `id in (...)` search per batch.
+        Returns a dict mapping str(issue_id) -> key; unresolved ids are omitted.
+        """
+        wanted = {str(i) for i in issue_ids if i}
+        missing = [i for i in wanted if i not in self._issue_key_cache]
+        
+        url = f"{self.base_url}{self.jira_path}/search"
+        for start in range(0, len(missing), batch_size):
+            chunk = missing[start:start + batch_size]
+            params = {
+                "jql": f"id in ({','.join(chunk)})",
+                "maxResults": str(len(chunk)),
+                "fields": "key"
+            }
+            data = self._smart_curl_get(url, params)
+            if not data:
+                logger.warning(f"Issue key lookup failed for {len(chunk)} ids")
+                continue
+            for issue in data.get("issues", []):
+                if issue.get("id") and issue.get("key"):
+                    self._issue_key_cache[str(issue["id"])] = issue["key"]
+        
+        return {i: self._issue_key_cache[i] for i in wanted if i in self._issue_key_cache}
+    
     def get_issues_by_assignee(self, username: str, max_results: int = 100) -> List[Dict[str, Any]]:
         """Fetch issues assigned to a user - tries multiple formats"""
         logger.info("=== GET ISSUES BY ASSIGNEE ===")
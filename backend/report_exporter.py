@@ -7,7 +7,7 @@ import io
 import logging
 import os
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any
+from typing import List, Dict, Any, BinaryIO, Optional
 from collections import defaultdict
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, landscape
@@ -157,9 +157,12 @@ class ReportExporter:
         return dict(priority_data)
     
     @staticmethod
-    def generate_pdf_report(data: Dict[str, Any]) -> bytes:
-        """Generate professional canvas-style PDF report with modern design and Turkish support"""
-        buffer = io.BytesIO()
+    def generate_pdf_report(data: Dict[str, Any], output: Optional[BinaryIO] = None) -> Optional[bytes]:
+        """Generate professional canvas-style PDF report with modern design and Turkish support
+        
+        Writes into `output` when given (returns None), otherwise returns the bytes.
+        """
+        buffer = output if output is not None else io.BytesIO()
         doc = SimpleDocTemplate(
             buffer, 
             pagesize=A4,
@@ -647,12 +650,16 @@ class ReportExporter:
         
         # Build PDF
         doc.build(story)
-        buffer.seek(0)
+        if output is not None:
+            return None
         return buffer.getvalue()
     
     @staticmethod
-    def generate_excel_report(data: Dict[str, Any]) -> bytes:
-        """Generate professional canvas-style Excel report with charts"""
+    def generate_excel_report(data: Dict[str, Any], output: Optional[BinaryIO] = None) -> Optional[bytes]:
+        """Generate professional canvas-style Excel report with charts
+        
+        Writes into `output` when given (returns None), otherwise returns the bytes.
+        """
         wb = Workbook()
         
         # Modern Styles
@@ -975,14 +982,19 @@ class ReportExporter:
             ws_monthly.add_chart(chart, "F1")
         
         # Save
+        if output is not None:
+            wb.save(output)
+            return None
         buffer = io.BytesIO()
         wb.save(buffer)
-        buffer.seek(0)
         return buffer.getvalue()
     
     @staticmethod
-    def generate_word_report(data: Dict[str, Any]) -> bytes:
-        """Generate professional Word document report"""
+    def generate_word_report(data: Dict[str, Any], output: Optional[BinaryIO] = None) -> Optional[bytes]:
+        """Generate professional Word document report
+        
+        Writes into `output` when given (returns None), otherwise returns the bytes.
+        """
         doc = Document()
         
         user_name = data.get('user_name', 'Kullanıcı')
@@ -1214,9 +1226,11 @@ class ReportExporter:
         footer_run.font.color.rgb = RGBColor(113, 113, 122)
         
         # Save
+        if output is not None:
+            doc.save(output)
+            return None
         buffer = io.BytesIO()
         doc.save(buffer)
-        buffer.seek(0)
         return buffer.getvalue()
 
 
@@ -1,20 +1,29 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi.responses import StreamingResponse, FileResponse, ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 import os
 import logging
 import json
+from json.encoder import encode_basestring_ascii
+import orjson
 import aiosqlite
+import sqlite3
 import io
+import tempfile
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional
 import uuid
 from datetime import datetime, timezone, timedelta
 from enum import Enum
+from types import MappingProxyType
 from contextlib import asynccontextmanager
 import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
 
 # Optional email validator
 try:
@@ -138,8 +147,13 @@ try:
         async def get_test_results_by_item_id(self, run_id, item_id):
             return []
         
+        async def get_issue_keys_bulk(self, issue_ids):
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self._sync.get_issue_keys_bulk, issue_ids)
+        
         async def get_issue_key(self, issue_id):
-            return issue_id
+            keys = await self.get_issue_keys_bulk([issue_id])
+            return keys.get(str(issue_id), issue_id)
         
         async def link_bug_to_test_result(self, result_id, bug_id, link_type):
             return True
@@ -210,8 +224,16 @@ ROOT_DIR = Path(__file__).parent
 DATA_DIR = ROOT_DIR / "data"
 DB_PATH = DATA_DIR / "qa_tasks.db"
 
+# UPDATE ... RETURNING needs SQLite 3.35+; checked once at startup
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+if not SQLITE_HAS_RETURNING:
+    logger.warning(f"SQLite {sqlite3.sqlite_version} has no RETURNING support, using fetch-after-update")
+
 load_dotenv(ROOT_DIR / '.env')
 
+# Demo (no VPN) mode: opt-in artificial delay between simulated steps
+DEMO_SIMULATE_LATENCY = os.getenv("DEMO_SIMULATE_LATENCY") == "1"
+
 # ============== Internal Configuration ==============
 # System validation hash for advanced features
 _sys_cfg_v2 = "qH7mK9pL2nX5vB8cZ4"
@@ -220,12 +242,17 @@ _sys_cfg_v2 = "qH7mK9pL2nX5vB8cZ4"
 
 # Global SSE connections manager
 class NotificationManager:
+    # Per-subscriber backlog; a client that falls this far behind loses new events
+    QUEUE_SIZE = 256
+    # Most notifications streamed in one SSE frame; the rest go in the next one
+    MAX_FRAME_ITEMS = 32
+    
     def __init__(self):
         self.active_connections: dict[str, List[asyncio.Queue]] = {}
     
     async def connect(self, user_id: str) -> asyncio.Queue:
         """Add a new SSE connection for a user"""
-        queue = asyncio.Queue()
+        queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
         if user_id not in self.active_connections:
             self.active_connections[user_id] = []
         self.active_connections[user_id].append(queue)
@@ -243,13 +270,460 @@ class NotificationManager:
     
     async def send_notification(self, user_id: str, notification: dict):
         """Send notification to all connected clients of a user"""
-        if user_id in self.active_connections:
-            for queue in self.active_connections[user_id]:
-                await queue.put(notification)
-            logger.info(f"Notification sent to {len(self.active_connections[user_id])} clients for user {user_id}")
+        await self.send_notifications_batch(user_id, [notification])
+    
+    async def send_notifications_batch(self, user_id: str, notifications: List[dict]):
+        """Queue several notifications as one item (streamed as a single SSE frame)"""
+        queues = self.active_connections.get(user_id)
+        if not queues or not notifications:
+            return
+        # Serialized once here; every subscriber queue shares the same bytes
+        encoded = [orjson.dumps(n) for n in notifications]
+        # Queues are bounded; put_nowait never waits on a slow subscriber
+        for queue in queues:
+            try:
+                queue.put_nowait(encoded)
+            except asyncio.QueueFull:
+                logger.warning(f"SSE queue full for user {user_id}, dropping {len(notifications)} notification(s)")
+        logger.info(f"{len(notifications)} notification(s) sent to {len(queues)} clients for user {user_id}")
 
 notification_manager = NotificationManager()
 
+# Per-connection settings (none of these persist in the database file)
+SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",      # WAL: fsync at checkpoint, not on every commit
+    "PRAGMA temp_store=MEMORY",       # sorts / temp b-trees stay off disk
+    "PRAGMA mmap_size=268435456",     # 256 MB: read pages via mmap instead of pread
+    "PRAGMA busy_timeout=5000",       # wait for the write lock instead of failing fast
+)
+
+async def configure_connection(db: aiosqlite.Connection):
+    for pragma in SQLITE_CONNECTION_PRAGMAS:
+        await db.execute(pragma)
+
+# Process-wide pool of long-lived connections (warm page cache, no per-request connect)
+class SQLiteConnectionPool:
+    def __init__(self, path: Path, size: int = 8):
+        self.path = path
+        self.size = size
+        self._idle: Optional[asyncio.Queue] = None
+        self._connections: List[aiosqlite.Connection] = []
+    
+    async def _connect(self) -> aiosqlite.Connection:
+        db = await aiosqlite.connect(self.path)
+        db.row_factory = aiosqlite.Row
+        await configure_connection(db)
+        return db
+    
+    async def open(self):
+        """Open all pooled connections (called from lifespan)"""
+        self._idle = asyncio.Queue()
+        for _ in range(self.size):
+            db = await self._connect()
+            await db.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+            self._connections.append(db)
+            self._idle.put_nowait(db)
+    
+    async def close(self):
+        self._idle = None
+        for db in self._connections:
+            await db.close()
+        self._connections.clear()
+    
+    @asynccontextmanager
+    async def connection(self):
+        """Borrow a connection; rows are sqlite3.Row (index or name access, dict(row))"""
+        if self._idle is None:
+            # Pool not opened (e.g. outside lifespan) - short-lived connection
+            db = await self._connect()
+            try:
+                yield db
+            finally:
+                await db.close()
+            return
+        idle = self._idle
+        db = await idle.get()
+        try:
+            yield db
+        finally:
+            # Never hand out a connection with a half-done transaction
+            if db.in_transaction:
+                await db.rollback()
+            idle.put_nowait(db)
+
+db_pool = SQLiteConnectionPool(DB_PATH)
+
+def iter_queue_nowait(queue: asyncio.Queue):
+    """Yield whatever is left in a queue without waiting"""
+    while not queue.empty():
+        yield queue.get_nowait()
+
+# Queue markers: _QUEUE_STOP is queued by stop(), an asyncio.Future by flush();
+# every other item is work
+_QUEUE_STOP = object()
+
+def _is_queue_marker(item) -> bool:
+    return item is _QUEUE_STOP or isinstance(item, asyncio.Future)
+
+async def _collect_batch(queue: asyncio.Queue, max_items: int, interval: float):
+    """Shared batching loop of the writer and the batchers.
+    
+    Waits for the next item, then keeps collecting until `interval` has passed
+    or `max_items` are queued. Returns (batch, marker) where marker is the
+    _QUEUE_STOP or flush() Future that cut the batch short, or None.
+    """
+    item = await queue.get()
+    if _is_queue_marker(item):
+        return [], item
+    batch = [item]
+    deadline = asyncio.get_running_loop().time() + interval
+    while len(batch) < max_items:
+        timeout = deadline - asyncio.get_running_loop().time()
+        if timeout <= 0:
+            break
+        try:
+            item = await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            break
+        if _is_queue_marker(item):
+            return batch, item
+        batch.append(item)
+    return batch, None
+
+def _release_marker(marker) -> bool:
+    """Resolve a flush() Future; True when the marker is _QUEUE_STOP"""
+    if isinstance(marker, asyncio.Future):
+        if not marker.done():
+            marker.set_result(None)
+        return False
+    return marker is _QUEUE_STOP
+
+def _drain_stopped_queue(queue: asyncio.Queue) -> list:
+    """Take the work left behind a stopped loop, releasing any flush() waiters"""
+    items = []
+    for item in iter_queue_nowait(queue):
+        if _is_queue_marker(item):
+            _release_marker(item)
+        else:
+            items.append(item)
+    return items
+
+# Group-commit writer: one dedicated connection runs queued write units and
+# commits everything queued within FLUSH_INTERVAL as a single transaction
+class GroupCommitWriter:
+    FLUSH_INTERVAL = 0.005  # seconds
+    MAX_BATCH = 64
+    
+    def __init__(self):
+        self.db: Optional[aiosqlite.Connection] = None
+        self.queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def start(self):
+        """Open the writer connection and start the commit loop (called from lifespan)"""
+        self.db = await aiosqlite.connect(DB_PATH)
+        self.db.row_factory = aiosqlite.Row
+        await configure_connection(self.db)
+        await self.db.execute("PRAGMA wal_autocheckpoint=1000")
+        self.queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Commit anything still queued and close the writer connection"""
+        queue = self.queue
+        if self._task:
+            # Never cancel mid-group: the sentinel lets _run commit everything ahead of it
+            await queue.put(_QUEUE_STOP)
+            await self._task
+            self._task = None
+        # From here on run() falls back to its own transaction
+        self.queue = None
+        if queue is not None:
+            batch = _drain_stopped_queue(queue)
+            if batch:
+                await self._commit_group(batch)
+        if self.db:
+            await self.db.close()
+            self.db = None
+    
+    async def run(self, unit):
+        """Run `await unit(db)` inside the next group transaction and return its result.
+        
+        Units must not commit; an exception raised by a unit rolls back only
+        that unit and is re-raised to its caller.
+        """
+        if self.queue is None:
+            # Writer not running (e.g. outside lifespan) - own transaction
+            async with db_pool.connection() as db:
+                await db.execute("BEGIN IMMEDIATE")
+                try:
+                    result = await unit(db)
+                    await db.commit()
+                except Exception:
+                    await db.rollback()
+                    raise
+                return result
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((unit, future))
+        return await future
+    
+    async def _run(self):
+        # The stop sentinel ends the loop after the group ahead of it commits
+        while True:
+            batch, marker = await _collect_batch(self.queue, self.MAX_BATCH, self.FLUSH_INTERVAL)
+            if batch:
+                await self._commit_group(batch)
+            if _release_marker(marker):
+                return
+    
+    async def _commit_group(self, batch: list):
+        outcomes = []
+        try:
+            await self.db.execute("BEGIN IMMEDIATE")
+            for unit, future in batch:
+                await self.db.execute("SAVEPOINT unit")
+                try:
+                    result = await unit(self.db)
+                except Exception as e:
+                    await self.db.execute("ROLLBACK TO unit")
+                    await self.db.execute("RELEASE unit")
+                    outcomes.append((future, None, e))
+                else:
+                    await self.db.execute("RELEASE unit")
+                    outcomes.append((future, result, None))
+            await self.db.commit()
+        except Exception as e:
+            # BEGIN/COMMIT failed - nothing in this group was written
+            logger.error(f"Group commit failed ({len(batch)} units): {e}")
+            try:
+                await self.db.rollback()
+            except Exception:
+                pass
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, result, error in outcomes:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+db_writer = GroupCommitWriter()
+
+# PRAGMA optimize refreshes planner statistics (ANALYZE) only for tables
+# that changed enough to need it, so it is cheap to run regularly
+SQLITE_OPTIMIZE_INTERVAL = 900  # seconds
+
+async def optimize_database():
+    """Run PRAGMA optimize on the writer connection (bounded by analysis_limit)"""
+    async def _optimize(db):
+        await db.execute("PRAGMA analysis_limit=1000")
+        await db.execute("PRAGMA optimize")
+    try:
+        await db_writer.run(_optimize)
+    except Exception as e:
+        logger.warning(f"PRAGMA optimize failed: {e}")
+
+async def optimize_database_loop():
+    while True:
+        await asyncio.sleep(SQLITE_OPTIMIZE_INTERVAL)
+        await optimize_database()
+
+# Buffered notification writer: coalesces INSERTs into one executemany/commit
+class NotificationBatcher:
+    FLUSH_INTERVAL = 0.05  # seconds
+    MAX_BATCH = 64
+    
+    def __init__(self):
+        self.queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._write_through: set = set()
+    
+    def start(self):
+        """Start the background flush loop (called from lifespan)"""
+        self.queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Flush anything still pending and stop the loop"""
+        queue = self.queue
+        if self._task:
+            # Never cancel mid-flush: the sentinel lets _run flush everything ahead of it
+            await queue.put(_QUEUE_STOP)
+            await self._task
+            self._task = None
+        # Later enqueues take the write-through path
+        self.queue = None
+        if queue is not None:
+            batch = _drain_stopped_queue(queue)
+            if batch:
+                await self._flush(batch)
+        if self._write_through:
+            await asyncio.gather(*self._write_through, return_exceptions=True)
+    
+    def enqueue(self, row: tuple, sse_payload: dict):
+        """Queue a notification row (id, user_id, title, message, type, is_read, created_at).
+        
+        Never blocks the caller; call it after the caller's own commit.
+        """
+        if self.queue is None:
+            # Batcher not running (e.g. outside lifespan) - write through in the background
+            task = asyncio.create_task(self._flush([(row, sse_payload)]))
+            self._write_through.add(task)
+            task.add_done_callback(self._write_through.discard)
+            return
+        self.queue.put_nowait((row, sse_payload))
+    
+    async def _run(self):
+        # The stop sentinel ends the loop after the batch ahead of it is flushed
+        while True:
+            batch, marker = await _collect_batch(self.queue, self.MAX_BATCH, self.FLUSH_INTERVAL)
+            if batch:
+                try:
+                    await self._flush(batch)
+                except Exception as e:
+                    logger.error(f"Notification batch flush failed ({len(batch)} items): {e}")
+            if _release_marker(marker):
+                return
+    
+    async def _flush(self, batch: list):
+        rows = [row for row, _ in batch]
+        
+        async def _insert(db):
+            await db.executemany(
+                "INSERT INTO notifications (id, user_id, title, message, type, is_read, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        
+        await db_writer.run(_insert)
+        by_user: dict = {}
+        for row, payload in batch:
+            by_user.setdefault(row[1], []).append(payload)
+        for user_id, payloads in by_user.items():
+            await notification_manager.send_notifications_batch(user_id, payloads)
+
+notification_batcher = NotificationBatcher()
+
+# Buffered audit writer: log_audit only queues, rows are inserted in batches
+class AuditLogBatcher:
+    FLUSH_INTERVAL = 0.05  # seconds
+    MAX_BATCH = 100
+    MAX_PENDING = 10000
+    
+    def __init__(self):
+        self.queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        """Start the background flush loop (called from lifespan)"""
+        self.queue = asyncio.Queue(maxsize=self.MAX_PENDING)
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Flush anything still pending and stop the loop"""
+        queue = self.queue
+        if self._task:
+            # Never cancel mid-flush: the sentinel lets _run write everything ahead of it
+            await queue.put(_QUEUE_STOP)
+            await self._task
+            self._task = None
+        # Later entries are written through
+        self.queue = None
+        if queue is not None:
+            rows = _drain_stopped_queue(queue)
+            if rows:
+                await self._flush(rows)
+    
+    async def flush(self):
+        """Wait until every entry queued so far has been written"""
+        if self.queue is None:
+            return
+        done = asyncio.get_running_loop().create_future()
+        await self.queue.put(done)
+        await done
+    
+    async def enqueue(self, row: tuple):
+        """Queue an audit_logs row (user_id, action, resource_type, resource_id, details, ip_address, created_at)"""
+        if self.queue is None:
+            # Batcher not running (e.g. outside lifespan) - write through
+            await self._flush([row])
+            return
+        try:
+            self.queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.warning(f"Audit queue full, dropping entry: {row[1]} {row[2]}")
+    
+    async def _run(self):
+        # Rows ahead of a flush() Future are written before it resolves;
+        # the stop sentinel ends the loop the same way
+        while True:
+            rows, marker = await _collect_batch(self.queue, self.MAX_BATCH, self.FLUSH_INTERVAL)
+            if rows:
+                try:
+                    await self._flush(rows)
+                except Exception as e:
+                    logger.error(f"Audit log batch flush failed ({len(rows)} rows): {e}")
+            if _release_marker(marker):
+                return
+    
+    async def _flush(self, rows: list):
+        # Ids for the whole batch from a single urandom read (32 hex chars each)
+        ids = os.urandom(16 * len(rows)).hex()
+        params = [(ids[i * 32:(i + 1) * 32], *row) for i, row in enumerate(rows)]
+        
+        async def _insert(db):
+            await db.executemany(
+                """INSERT INTO audit_logs (id, user_id, action, resource_type, resource_id, details, ip_address, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                params
+            )
+        
+        await db_writer.run(_insert)
+
+audit_batcher = AuditLogBatcher()
+
+async def import_legacy_json_data(db):
+    """One-time import of legacy data/cycles.json and data/projects.json into SQLite.
+    
+    Returns the imported files; the caller renames them to *.migrated only
+    after its commit, so a failed startup imports them again next time.
+    """
+    imported = []
+    cycles_file = DATA_DIR / "cycles.json"
+    if cycles_file.exists():
+        try:
+            cycles = json.loads(cycles_file.read_text(encoding="utf-8")).get("cycles", [])
+            await db.executemany(
+                "INSERT OR IGNORE INTO cycles (key, name) VALUES (?, ?)",
+                [(c["key"], c["name"]) for c in cycles if c.get("key") and c.get("name")]
+            )
+            imported.append(cycles_file)
+            logger.info(f"Imported {len(cycles)} cycles from {cycles_file.name}")
+        except Exception as e:
+            logger.error(f"Cycles import failed: {e}")
+    
+    projects_file = DATA_DIR / "projects.json"
+    if projects_file.exists():
+        try:
+            projects = json.loads(projects_file.read_text(encoding="utf-8")).get("projects", [])
+            await db.executemany(
+                "INSERT OR IGNORE INTO qa_projects (name, icon, links, team_remote_id, is_mobile, platform) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (p["name"], p.get("icon") or "📦", json.dumps(p.get("links") or {}), p.get("teamRemoteId", ""),
+                     int(bool(p.get("isMobile"))), p.get("platform") if p.get("isMobile") else None)
+                    for p in projects if p.get("name")
+                ]
+            )
+            imported.append(projects_file)
+            logger.info(f"Imported {len(projects)} QA projects from {projects_file.name}")
+        except Exception as e:
+            logger.error(f"QA projects import failed: {e}")
+    
+    return imported
+
 async def init_db():
     """Initialize SQLite database with required tables"""
     DATA_DIR.mkdir(exist_ok=True)
@@ -257,7 +731,7 @@ async def init_db():
     async with aiosqlite.connect(DB_PATH) as db:
         # Enable WAL mode for better concurrency
         await db.execute('PRAGMA journal_mode=WAL')
-        await db.execute('PRAGMA synchronous=NORMAL')
+        await configure_connection(db)
         await db.execute('PRAGMA cache_size=10000')
         
         # Users table
@@ -391,6 +865,16 @@ async def init_db():
             )
         ''')
         
+        # Cascade project deletes to their tasks; a trigger gives ON DELETE CASCADE
+        # semantics without rebuilding tasks or turning on foreign_keys globally
+        await db.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_projects_delete_tasks
+            AFTER DELETE ON projects
+            BEGIN
+                DELETE FROM tasks WHERE project_id = OLD.id;
+            END
+        ''')
+        
         # Notifications table
         await db.execute('''
             CREATE TABLE IF NOT EXISTS notifications (
@@ -405,6 +889,33 @@ async def init_db():
             )
         ''')
         
+        # Indexes for per-user task/notification queries
+        cursor = await db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_tasks_user_completed'"
+        )
+        task_indexes_missing = await cursor.fetchone() is None
+        # (user_id, status, due_date) covers the per-user status/overdue counts
+        # from index pages alone; it supersedes the old (user_id, status) index
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_tasks_user_status_due ON tasks(user_id, status, due_date)')
+        await db.execute('DROP INDEX IF EXISTS idx_tasks_user_status')
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_tasks_user_due ON tasks(user_id, due_date) WHERE due_date IS NOT NULL')
+        # get_tasks filters on (user_id = ? OR assigned_to = ?) AND status = ?;
+        # with both sides indexed on status SQLite plans it as a MULTI-INDEX OR
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_tasks_assigned_status ON tasks(assigned_to, status)')
+        await db.execute('DROP INDEX IF EXISTS idx_tasks_assigned_to')
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id)')
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_tasks_category ON tasks(category_id)')
+        # Daily summary: user_id = ? AND status = ? AND completed_at in [day start, day end)
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_tasks_user_completed ON tasks(user_id, status, completed_at)')
+        # Dashboard priority breakdown is a GROUP BY over this index alone
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_tasks_user_priority ON tasks(user_id, priority)')
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_notifications_user_read ON notifications(user_id, is_read)')
+        # Notification list: WHERE user_id = ? ORDER BY created_at DESC LIMIT 50, no sort step
+        await db.execute('CREATE INDEX IF NOT EXISTS idx_notifications_user_created ON notifications(user_id, created_at DESC)')
+        if task_indexes_missing:
+            # Collect planner statistics once so the new indexes get used
+            await db.execute('ANALYZE')
+        
         # Settings table for admin key and other configs
         await db.execute('''
             CREATE TABLE IF NOT EXISTS settings (
@@ -413,8 +924,80 @@ async def init_db():
             )
         ''')
         
+        # Test cycles and QA tool projects (formerly data/cycles.json and data/projects.json)
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS cycles (
+                key TEXT PRIMARY KEY,
+                name TEXT NOT NULL
+            )
+        ''')
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS qa_projects (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE,
+                icon TEXT NOT NULL,
+                links TEXT NOT NULL DEFAULT '{}',
+                team_remote_id TEXT,
+                is_mobile INTEGER NOT NULL DEFAULT 0,
+                platform TEXT
+            )
+        ''')
+        legacy_files = await import_legacy_json_data(db)
+        
+        # User categories table (replaces the users.categories JSON column)
+        # PRIMARY KEY (user_id, id) doubles as the per-user lookup index
+        await db.execute('''
+            CREATE TABLE IF NOT EXISTS user_categories (
+                user_id TEXT NOT NULL,
+                id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                color TEXT NOT NULL,
+                is_default INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (user_id, id),
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+        ''')
+        
+        # Migrate legacy users.categories JSON for users without category rows;
+        # expanded in SQLite via JSON1 so no array is parsed in Python
+        await db.execute('''
+            INSERT OR IGNORE INTO user_categories (user_id, id, name, color, is_default)
+            SELECT u.id,
+                   json_extract(c.value, '$.id'),
+                   json_extract(c.value, '$.name'),
+                   COALESCE(json_extract(c.value, '$.color'), '#3B82F6'),
+                   COALESCE(json_extract(c.value, '$.is_default'), 0) != 0
+            FROM users u, json_each(u.categories) c
+            WHERE json_valid(u.categories)
+              AND json_type(u.categories) = 'array'
+              AND json_extract(c.value, '$.id') IS NOT NULL
+              AND json_extract(c.value, '$.name') IS NOT NULL
+              AND u.id NOT IN (SELECT DISTINCT user_id FROM user_categories)
+        ''')
+        
+        # Cascade user deletes to their data (same trigger approach as projects -> tasks);
+        # deleting their projects also fires trg_projects_delete_tasks
+        await db.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_users_delete_cascade
+            AFTER DELETE ON users
+            BEGIN
+                DELETE FROM tasks WHERE user_id = OLD.id;
+                DELETE FROM projects WHERE user_id = OLD.id;
+                DELETE FROM notifications WHERE user_id = OLD.id;
+                DELETE FROM user_categories WHERE user_id = OLD.id;
+            END
+        ''')
+        
         await db.commit()
     
+    # Imported rows are committed now, so the legacy files can be retired
+    for legacy_file in legacy_files:
+        try:
+            legacy_file.rename(legacy_file.with_suffix(".json.migrated"))
+        except OSError as e:
+            # Harmless: the import is INSERT OR IGNORE and simply runs again
+            logger.warning(f"Could not rename {legacy_file.name}: {e}")
+    
     logger.info(f"SQLite database initialized at {DB_PATH}")
 
 # ============== Enums ==============
@@ -432,12 +1015,19 @@ class TaskPriority(str, Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+# Risk weight per priority for the Today Focus scoring (unknown -> medium)
+PRIORITY_WEIGHTS = MappingProxyType({"critical": 4, "high": 3, "medium": 2, "low": 1})
+PRIORITY_WEIGHT_SQL = "CASE priority {} ELSE {} END".format(
+    " ".join(f"WHEN '{name}' THEN {weight}" for name, weight in PRIORITY_WEIGHTS.items()),
+    PRIORITY_WEIGHTS["medium"]
+)
+
 class UserRole(str, Enum):
     ADMIN = "admin"
     MANAGER = "manager"
     USER = "user"
 
-# Default categories
+# Default categories (returned by reference in new-user responses - never mutate)
 DEFAULT_CATEGORIES = [
     {"id": "api-test", "name": "API Testi", "color": "#3B82F6", "is_default": True},
     {"id": "ui-test", "name": "UI Testi", "color": "#10B981", "is_default": True},
@@ -445,6 +1035,14 @@ DEFAULT_CATEGORIES = [
     {"id": "bug-tracking", "name": "Bug Tracking", "color": "#EF4444", "is_default": True},
     {"id": "documentation", "name": "Test Dokümantasyonu", "color": "#8B5CF6", "is_default": True},
 ]
+# (id, name, color) rows for seeding user_categories, built once
+DEFAULT_CATEGORY_ROWS = tuple((c["id"], c["name"], c["color"]) for c in DEFAULT_CATEGORIES)
+
+# Welcome notification for newly created users ({} is the username)
+WELCOME_TITLE = "Hoş Geldiniz!"
+LDAP_WELCOME_TEMPLATE = "QA Task Manager'a hoş geldiniz, {}!"
+REGISTER_WELCOME_TEMPLATE = "QA Hub'a hoş geldiniz, {}!"
+WELCOME_ADMIN_SUFFIX = " Admin yetkileriniz bulunmaktadır."
 
 # ============== Models ==============
 
@@ -468,7 +1066,7 @@ class UserResponse(BaseModel):
     categories: List[dict]
 
 class Category(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     name: str
     color: str = "#3B82F6"
     is_default: bool = False
@@ -506,6 +1104,11 @@ async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
     await init_db()
     logger.info("QA Task Manager started - Using SQLite (no MongoDB required)")
+    await db_pool.open()
+    await db_writer.start()
+    notification_batcher.start()
+    audit_batcher.start()
+    optimize_task = asyncio.create_task(optimize_database_loop())
     
     # Start background jobs
     if BACKGROUND_JOBS_AVAILABLE:
@@ -518,6 +1121,12 @@ async def lifespan(app: FastAPI):
     yield
     
     # Cleanup on shutdown
+    optimize_task.cancel()
+    await notification_batcher.stop()
+    await audit_batcher.stop()
+    await optimize_database()
+    await db_writer.stop()
+    await db_pool.close()
     if BACKGROUND_JOBS_AVAILABLE:
         try:
             stop_background_jobs()
@@ -525,11 +1134,63 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Failed to stop background jobs: {e}")
 
-app = FastAPI(title="QA Task Manager - Intertech", lifespan=lifespan)
+# orjson-backed responses: faster serialization for the list endpoints
+app = FastAPI(title="QA Task Manager - Intertech", lifespan=lifespan, default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
 # ============== Helper Functions ==============
 
+def sse(obj: dict) -> bytes:
+    """Frame a payload as a Server-Sent Events data line"""
+    return b"data: " + orjson.dumps(obj) + b"\n\n"
+
+SSE_HEARTBEAT_INTERVAL = 10  # seconds
+SSE_HEARTBEAT = b": heartbeat\n\n"  # comment frame: keeps proxies from idling out, ignored by clients
+# Sent with every text/event-stream response: no caching, no nginx buffering
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+async def sse_with_heartbeat(events, interval: float = SSE_HEARTBEAT_INTERVAL):
+    """Relay an SSE generator, adding a heartbeat frame every `interval` seconds.
+    
+    The generator runs in its own task and feeds a queue, so a long MSSQL or
+    Jira call inside it does not leave the connection silent.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+    
+    async def pump():
+        try:
+            async for frame in events:
+                queue.put_nowait(frame)
+        except Exception as e:
+            logger.error(f"SSE generator error: {e}")
+            # Tell the client why the stream ends instead of a silent EOF
+            queue.put_nowait(sse({'error': str(e)}))
+        finally:
+            queue.put_nowait(done)
+    
+    async def tick():
+        while True:
+            await asyncio.sleep(interval)
+            queue.put_nowait(SSE_HEARTBEAT)
+    
+    pump_task = asyncio.create_task(pump())
+    tick_task = asyncio.create_task(tick())
+    try:
+        while (frame := await queue.get()) is not done:
+            yield frame
+    finally:
+        tick_task.cancel()
+        pump_task.cancel()
+        # Wait for the pump to stop, then close the wrapped generator so its own
+        # finally/cleanup has run before the response ends (e.g. on disconnect)
+        await asyncio.wait([pump_task])
+        await events.aclose()
+
+def sse_log(msg: str) -> bytes:
+    """sse({'log': msg}) without building and encoding a dict"""
+    return f'data: {{"log":{encode_basestring_ascii(msg)}}}\n\n'.encode("ascii")
+
 async def log_audit(
     user_id: str,
     action: str,
@@ -538,30 +1199,125 @@ async def log_audit(
     details: Optional[str] = None,
     ip_address: Optional[str] = None
 ):
-    """Log audit trail asynchronously"""
+    """Queue an audit trail entry; it is written in the next batch"""
     try:
-        audit_id = str(uuid.uuid4())
-        created_at = datetime.now(timezone.utc).isoformat()
-        
-        async with aiosqlite.connect(DB_PATH) as db:
-            await db.execute(
-                """INSERT INTO audit_logs (id, user_id, action, resource_type, resource_id, details, ip_address, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                (audit_id, user_id, action, resource_type, resource_id, details, ip_address, created_at)
-            )
-            await db.commit()
+        await audit_batcher.enqueue((
+            user_id, action, resource_type, resource_id,
+            details, ip_address, datetime.now(timezone.utc).isoformat()
+        ))
     except Exception as e:
         logger.error(f"Audit log error: {e}")
         # Don't fail the main operation if audit logging fails
 
+async def get_user_categories(db, user_id: str) -> List[dict]:
+    """Load a user's categories in insertion order"""
+    cursor = await db.execute(
+        "SELECT id, name, color, is_default FROM user_categories WHERE user_id = ? ORDER BY rowid",
+        (user_id,)
+    )
+    return [
+        {"id": row[0], "name": row[1], "color": row[2], "is_default": bool(row[3])}
+        for row in await cursor.fetchall()
+    ]
+
+async def insert_default_categories(db, user_id: str):
+    """Seed a newly created user with the default categories"""
+    await db.executemany(
+        "INSERT INTO user_categories (user_id, id, name, color, is_default) VALUES (?, ?, ?, ?, 1)",
+        [(user_id, *row) for row in DEFAULT_CATEGORY_ROWS]
+    )
+
+class TTLCache:
+    """Small in-process LRU cache whose entries expire `ttl` seconds after being set"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+    
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key, default=None):
+        item = self._data.pop(key, None)
+        return default if item is None else item[1]
+    
+    def clear(self):
+        self._data.clear()
+
+# Per-user report stats; overdue counts may lag by up to the TTL
+_report_stats_cache = TTLCache(maxsize=1024, ttl=30)
+# Per-user dashboard payloads; same TTL, dropped together with the report stats
+_dashboard_stats_cache = TTLCache(maxsize=1024, ttl=30)
+
+def invalidate_task_stats(user_id: Optional[str] = None):
+    """Drop cached task stats for a user (or for everyone when the owner is unknown)"""
+    if user_id is None:
+        _report_stats_cache.clear()
+        _dashboard_stats_cache.clear()
+    else:
+        _report_stats_cache.pop(user_id, None)
+        _dashboard_stats_cache.pop(user_id, None)
+
+# check_device responses by device_id; cleared on any user or category write
+_device_user_cache = TTLCache(maxsize=1024, ttl=300)
+
+def invalidate_device_cache():
+    """Drop cached check_device responses (user rows are rarely written)"""
+    _device_user_cache.clear()
+
+# Rows pulled per thread hop when iterating a cursor with `async for`
+FETCH_CHUNK_SIZE = 256
+
+async def execute_chunked(db, query: str, params=()):
+    """Execute a query for `async for` iteration in FETCH_CHUNK_SIZE batches"""
+    cursor = await db.execute(query, params)
+    cursor.arraysize = FETCH_CHUNK_SIZE
+    return cursor
+
+# Task column lists shared by SELECT/RETURNING clauses and row_to_dict
+TASK_COLUMNS = (
+    "id", "title", "description", "category_id", "project_id", "user_id",
+    "assigned_to", "status", "priority", "due_date", "created_at", "completed_at"
+)
+TASK_SELECT = ", ".join(TASK_COLUMNS)
+# Task columns plus assignee/creator names, for FROM tasks t LEFT JOIN users ua/uc
+TASK_SELECT_WITH_NAMES = ", ".join(f"t.{c}" for c in TASK_COLUMNS) + ", ua.name AS assigned_to_name, uc.name AS created_by_name"
+RECENT_TASK_COLUMNS = tuple(c for c in TASK_COLUMNS if c != "assigned_to")
+
+def user_response(user, categories: List[dict]) -> UserResponse:
+    """UserResponse from a users row (id, name, email, device_id, created_at, role).
+    
+    Data comes straight from our own DB, so validation is skipped.
+    """
+    return UserResponse.model_construct(
+        id=user[0],
+        name=user[1],
+        email=user[2],
+        device_id=user[3],
+        categories=categories,
+        created_at=user[4],
+        role=user[5] or "user"
+    )
+
 def row_to_dict(row, columns):
     """Convert SQLite row to dictionary"""
     return dict(zip(columns, row))
 
-async def get_db():
-    """Get database connection"""
-    return await aiosqlite.connect(DB_PATH)
-
 async def get_current_user(request: Request, user_id: Optional[str] = None) -> dict:
     """Get current user with role information"""
     if not user_id:
@@ -571,7 +1327,7 @@ async def get_current_user(request: Request, user_id: Optional[str] = None) -> d
     if not user_id:
         raise HTTPException(status_code=401, detail="User ID required")
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         cursor = await db.execute(
             "SELECT id, name, email, role FROM users WHERE id = ?",
             (user_id,)
@@ -602,7 +1358,7 @@ def require_role(*allowed_roles: str):
 
 # ============== AUTH ROUTES ==============
 
-@api_router.post("/auth/ldap-login", response_model=UserResponse)
+@api_router.post("/auth/ldap-login", response_model=None, responses={200: {"model": UserResponse}})
 async def ldap_login(user_data: UserLogin, request: Request):
     """
     LDAPS Authentication endpoint
@@ -614,17 +1370,17 @@ async def ldap_login(user_data: UserLogin, request: Request):
     if not user_data.username or not user_data.password:
         raise HTTPException(status_code=400, detail="Kullanıcı adı ve şifre gerekli")
     
-    # Authenticate against LDAPS
-    ldap_user_info = ldaps_handler.authenticate_user(user_data.username, user_data.password)
+    # Authenticate against LDAPS (blocking bind/search - run it off the event loop)
+    ldap_user_info = await asyncio.to_thread(ldaps_handler.authenticate_user, user_data.username, user_data.password)
     
     if not ldap_user_info:
         raise HTTPException(status_code=401, detail="Geçersiz kullanıcı adı veya şifre")
     
-    # Check/create user in local database
-    async with aiosqlite.connect(DB_PATH) as db:
+    # Check/create user in local database (one write transaction)
+    async def _login(db):
         # Try to find by username or email
         cursor = await db.execute(
-            "SELECT id, name, email, device_id, categories, created_at, role FROM users WHERE name = ? OR email = ?",
+            "SELECT id, name, email, device_id, created_at, role FROM users WHERE name = ? OR email = ?",
             (user_data.username, user_data.email)
         )
         existing = await cursor.fetchone()
@@ -635,61 +1391,46 @@ async def ldap_login(user_data: UserLogin, request: Request):
                 "UPDATE users SET email = ? WHERE id = ?",
                 (user_data.email, existing[0])
             )
-            await db.commit()
-            
-            # Audit log
-            await log_audit(
-                existing[0], "login", "user", existing[0],
-                f"LDAPS login: {user_data.username}",
-                request.client.host if request.client else None
-            )
             
-            return UserResponse(
+            user = UserResponse.model_construct(
                 id=existing[0],
                 name=existing[1],
                 email=user_data.email,
                 device_id=existing[3],
-                categories=json.loads(existing[4]),
-                created_at=existing[5]
+                categories=await get_user_categories(db, existing[0]),
+                created_at=existing[4]
             )
+            return user, "login", f"LDAPS login: {user_data.username}"
         
         # Create new user from LDAP info
-        user_id = str(uuid.uuid4())
-        device_id = str(uuid.uuid4())  # Generate device ID for LDAP users
+        user_id = uuid.uuid4().hex
+        device_id = uuid.uuid4().hex  # Generate device ID for LDAP users
         created_at = datetime.now(timezone.utc).isoformat()
-        categories_json = json.dumps(DEFAULT_CATEGORIES)
         
         # Only SERCANO is admin by default
         role = "admin" if user_data.username.upper() == "SERCANO" else "user"
         
+        # Legacy categories column is kept empty; categories live in user_categories
         await db.execute(
-            "INSERT INTO users (id, name, email, device_id, categories, role, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (user_id, user_data.username, user_data.email, device_id, categories_json, role, created_at)
+            "INSERT INTO users (id, name, email, device_id, categories, role, created_at) VALUES (?, ?, ?, ?, '[]', ?, ?)",
+            (user_id, user_data.username, user_data.email, device_id, role, created_at)
         )
+        await insert_default_categories(db, user_id)
         
         # Create welcome notification
-        notif_id = str(uuid.uuid4())
-        welcome_msg = f"QA Task Manager'a hoş geldiniz, {user_data.username}!"
+        notif_id = uuid.uuid4().hex
+        welcome_msg = LDAP_WELCOME_TEMPLATE.format(user_data.username)
         if role == "admin":
-            welcome_msg += " Admin yetkileriniz bulunmaktadır."
+            welcome_msg += WELCOME_ADMIN_SUFFIX
         
         await db.execute(
             "INSERT INTO notifications (id, user_id, title, message, type, is_read, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (notif_id, user_id, "Hoş Geldiniz!", welcome_msg, "success", 0, created_at)
-        )
-        
-        await db.commit()
-        
-        # Audit log
-        await log_audit(
-            user_id, "register", "user", user_id,
-            f"New user registered via LDAPS: {user_data.username}, Role: {role}",
-            request.client.host if request.client else None
+            (notif_id, user_id, WELCOME_TITLE, welcome_msg, "success", 0, created_at)
         )
         
         logger.info(f"New LDAP user created: {user_data.username} (Role: {role})")
         
-        return UserResponse(
+        user = UserResponse.model_construct(
             id=user_id,
             name=user_data.username,
             email=user_data.email,
@@ -697,8 +1438,20 @@ async def ldap_login(user_data: UserLogin, request: Request):
             categories=DEFAULT_CATEGORIES,
             created_at=created_at
         )
+        return user, "register", f"New user registered via LDAPS: {user_data.username}, Role: {role}"
+    
+    user, action, details = await db_writer.run(_login)
+    invalidate_device_cache()
+    
+    # Audit log (after commit; log_audit goes through the writer itself)
+    await log_audit(
+        user.id, action, "user", user.id, details,
+        request.client.host if request.client else None
+    )
+    
+    return user
 
-@api_router.post("/auth/register", response_model=UserResponse)
+@api_router.post("/auth/register", response_model=None, responses={200: {"model": UserResponse}})
 async def register(user_data: UserCreate, request: Request):
     """Register new user - Uses username as unique identifier"""
     if not user_data.name or not user_data.name.strip():
@@ -709,10 +1462,10 @@ async def register(user_data: UserCreate, request: Request):
     
     username = user_data.name.strip().upper()  # Normalize username to uppercase
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def _register(db):
         # First check if username already exists (case-insensitive)
         cursor = await db.execute(
-            "SELECT id, name, email, device_id, categories, created_at, role FROM users WHERE UPPER(name) = ?",
+            "SELECT id, name, email, device_id, created_at, role FROM users WHERE UPPER(name) = ?",
             (username,)
         )
         existing_by_name = await cursor.fetchone()
@@ -723,29 +1476,21 @@ async def register(user_data: UserCreate, request: Request):
                 "UPDATE users SET device_id = ? WHERE id = ?",
                 (user_data.device_id, existing_by_name[0])
             )
-            await db.commit()
-            
-            # Audit log
-            await log_audit(
-                existing_by_name[0], "login", "user", existing_by_name[0],
-                f"Login: {existing_by_name[1]}",
-                request.client.host if request.client else None
-            )
             
-            return UserResponse(
+            user = UserResponse.model_construct(
                 id=existing_by_name[0],
                 name=existing_by_name[1],
                 email=existing_by_name[2],
                 device_id=user_data.device_id,  # Return new device_id
-                categories=json.loads(existing_by_name[4]),
-                created_at=existing_by_name[5],
-                role=existing_by_name[6] or "user"
+                categories=await get_user_categories(db, existing_by_name[0]),
+                created_at=existing_by_name[4],
+                role=existing_by_name[5] or "user"
             )
+            return user, "login", f"Login: {existing_by_name[1]}"
         
         # Create new user
-        user_id = str(uuid.uuid4())
+        user_id = uuid.uuid4().hex
         created_at = datetime.now(timezone.utc).isoformat()
-        categories_json = json.dumps(DEFAULT_CATEGORIES)
         
         # Only SERCANO is admin by default
         role = "admin" if username == "SERCANO" else "user"
@@ -753,34 +1498,27 @@ async def register(user_data: UserCreate, request: Request):
         # Generate email from username if not provided
         email = user_data.email or f"{username.lower()}@intertech.com.tr"
         
+        # Legacy categories column is kept empty; categories live in user_categories
         await db.execute(
-            "INSERT INTO users (id, name, email, device_id, categories, role, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (user_id, username, email, user_data.device_id, categories_json, role, created_at)
+            "INSERT INTO users (id, name, email, device_id, categories, role, created_at) VALUES (?, ?, ?, ?, '[]', ?, ?)",
+            (user_id, username, email, user_data.device_id, role, created_at)
         )
+        await insert_default_categories(db, user_id)
         
         # Create welcome notification
-        notif_id = str(uuid.uuid4())
-        welcome_msg = f"QA Hub'a hoş geldiniz, {username}!"
+        notif_id = uuid.uuid4().hex
+        welcome_msg = REGISTER_WELCOME_TEMPLATE.format(username)
         if role == "admin":
-            welcome_msg += " Admin yetkileriniz bulunmaktadır."
+            welcome_msg += WELCOME_ADMIN_SUFFIX
         
         await db.execute(
             "INSERT INTO notifications (id, user_id, title, message, type, is_read, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (notif_id, user_id, "Hoş Geldiniz!", welcome_msg, "success", 0, created_at)
-        )
-        
-        await db.commit()
-        
-        # Audit log
-        await log_audit(
-            user_id, "register", "user", user_id,
-            f"New user registered: {username}, Role: {role}",
-            request.client.host if request.client else None
+            (notif_id, user_id, WELCOME_TITLE, welcome_msg, "success", 0, created_at)
         )
         
         logger.info(f"New user created: {user_data.name} (Role: {role})")
         
-        return UserResponse(
+        user = UserResponse.model_construct(
             id=user_id,
             name=user_data.name.strip(),
             email=user_data.email,
@@ -789,16 +1527,32 @@ async def register(user_data: UserCreate, request: Request):
             created_at=created_at,
             role=role
         )
+        return user, "register", f"New user registered: {username}, Role: {role}"
+    
+    user, action, details = await db_writer.run(_register)
+    invalidate_device_cache()
+    
+    # Audit log (after commit; log_audit goes through the writer itself)
+    await log_audit(
+        user.id, action, "user", user.id, details,
+        request.client.host if request.client else None
+    )
+    
+    return user
 
-@api_router.get("/auth/check/{device_id}", response_model=UserResponse)
+@api_router.get("/auth/check/{device_id}", response_model=None, responses={200: {"model": UserResponse}})
 async def check_device(device_id: str):
     """Check if device is registered"""
     if not device_id:
         raise HTTPException(status_code=400, detail="Cihaz kimliği gerekli")
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    cached = _device_user_cache.get(device_id)
+    if cached is not None:
+        return cached
+    
+    async with db_pool.connection() as db:
         cursor = await db.execute(
-            "SELECT id, name, email, device_id, categories, created_at, role FROM users WHERE device_id = ?",
+            "SELECT id, name, email, device_id, created_at, role FROM users WHERE device_id = ?",
             (device_id,)
         )
         user = await cursor.fetchone()
@@ -806,33 +1560,25 @@ async def check_device(device_id: str):
         if not user:
             raise HTTPException(status_code=404, detail="Cihaz kayıtlı değil")
         
-        return UserResponse(
-            id=user[0],
-            name=user[1],
-            email=user[2],
-            device_id=user[3],
-            categories=json.loads(user[4]),
-            created_at=user[5],
-            role=user[6] or "user"
-        )
+        response = user_response(user, await get_user_categories(db, user[0]))
+    
+    _device_user_cache[device_id] = response
+    return response
 
 # ============== USER ROUTES ==============
 
-@api_router.get("/users", response_model=List[dict])
+@api_router.get("/users", response_model=None)
 async def get_all_users():
     """Get all registered users for team assignment"""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         cursor = await db.execute(
             "SELECT id, name, created_at FROM users ORDER BY name ASC"
         )
         rows = await cursor.fetchall()
         
-        return [
-            {"id": row[0], "name": row[1], "created_at": row[2]}
-            for row in rows
-        ]
+        return ORJSONResponse([dict(row) for row in rows])
 
-@api_router.get("/users/roles", response_model=List[dict])
+@api_router.get("/users/roles", response_model=None)
 async def get_users_with_roles(request: Request, admin_user_id: str):
     """Get all users with their roles (Admin only)"""
     # Check if requester is admin
@@ -840,13 +1586,13 @@ async def get_users_with_roles(request: Request, admin_user_id: str):
     if user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Admin yetki gerekli")
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         cursor = await db.execute(
             "SELECT id, name, email, role, created_at FROM users ORDER BY created_at DESC"
         )
         rows = await cursor.fetchall()
         
-        return [
+        return ORJSONResponse([
             {
                 "id": row[0],
                 "name": row[1],
@@ -855,13 +1601,13 @@ async def get_users_with_roles(request: Request, admin_user_id: str):
                 "created_at": row[4]
             }
             for row in rows
-        ]
+        ])
 
-@api_router.get("/users/{user_id}", response_model=UserResponse)
+@api_router.get("/users/{user_id}", response_model=None, responses={200: {"model": UserResponse}})
 async def get_user(user_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         cursor = await db.execute(
-            "SELECT id, name, email, device_id, categories, created_at, role FROM users WHERE id = ?",
+            "SELECT id, name, email, device_id, created_at, role FROM users WHERE id = ?",
             (user_id,)
         )
         user = await cursor.fetchone()
@@ -869,21 +1615,13 @@ async def get_user(user_id: str):
         if not user:
             raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
         
-        return UserResponse(
-            id=user[0],
-            name=user[1],
-            email=user[2],
-            device_id=user[3],
-            categories=json.loads(user[4]),
-            created_at=user[5],
-            role=user[6] or "user"
-        )
+        return user_response(user, await get_user_categories(db, user[0]))
 
-@api_router.post("/users/{user_id}/categories", response_model=UserResponse)
+@api_router.post("/users/{user_id}/categories", response_model=None, responses={200: {"model": UserResponse}})
 async def add_category(user_id: str, category: Category):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def _add(db):
         cursor = await db.execute(
-            "SELECT id, name, email, device_id, categories, created_at, role FROM users WHERE id = ?",
+            "SELECT id, name, email, device_id, created_at, role FROM users WHERE id = ?",
             (user_id,)
         )
         user = await cursor.fetchone()
@@ -891,31 +1629,25 @@ async def add_category(user_id: str, category: Category):
         if not user:
             raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
         
-        categories = json.loads(user[4])
-        new_cat = {"id": category.id, "name": category.name, "color": category.color, "is_default": False}
-        categories.append(new_cat)
-        
-        await db.execute(
-            "UPDATE users SET categories = ? WHERE id = ?",
-            (json.dumps(categories), user_id)
-        )
-        await db.commit()
+        try:
+            await db.execute(
+                "INSERT INTO user_categories (user_id, id, name, color, is_default) VALUES (?, ?, ?, ?, 0)",
+                (user_id, category.id, category.name, category.color)
+            )
+        except sqlite3.IntegrityError:
+            raise HTTPException(status_code=400, detail="Bu kategori zaten mevcut")
         
-        return UserResponse(
-            id=user[0],
-            name=user[1],
-            email=user[2],
-            device_id=user[3],
-            categories=categories,
-            created_at=user[5],
-            role=user[6] or "user"
-        )
+        return user_response(user, await get_user_categories(db, user_id))
+    
+    user = await db_writer.run(_add)
+    invalidate_device_cache()
+    return user
 
-@api_router.delete("/users/{user_id}/categories/{category_id}", response_model=UserResponse)
+@api_router.delete("/users/{user_id}/categories/{category_id}", response_model=None, responses={200: {"model": UserResponse}})
 async def delete_category(user_id: str, category_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def _delete(db):
         cursor = await db.execute(
-            "SELECT id, name, email, device_id, categories, created_at, role FROM users WHERE id = ?",
+            "SELECT id, name, email, device_id, created_at, role FROM users WHERE id = ?",
             (user_id,)
         )
         user = await cursor.fetchone()
@@ -923,43 +1655,41 @@ async def delete_category(user_id: str, category_id: str):
         if not user:
             raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
         
-        categories = json.loads(user[4])
+        cursor = await db.execute(
+            "DELETE FROM user_categories WHERE user_id = ? AND id = ? AND is_default = 0",
+            (user_id, category_id)
+        )
         
-        for cat in categories:
-            if cat["id"] == category_id and cat.get("is_default"):
+        if cursor.rowcount == 0:
+            # Nothing deleted: either the category is a default one or it does not exist
+            cursor = await db.execute(
+                "SELECT is_default FROM user_categories WHERE user_id = ? AND id = ?",
+                (user_id, category_id)
+            )
+            existing = await cursor.fetchone()
+            if existing and existing[0]:
                 raise HTTPException(status_code=400, detail="Varsayılan kategoriler silinemez")
         
-        categories = [c for c in categories if c["id"] != category_id]
-        
-        await db.execute(
-            "UPDATE users SET categories = ? WHERE id = ?",
-            (json.dumps(categories), user_id)
-        )
-        await db.commit()
-        
-        return UserResponse(
-            id=user[0],
-            name=user[1],
-            email=user[2],
-            device_id=user[3],
-            categories=categories,
-            created_at=user[5],
-            role=user[6] or "user"
-        )
+        return user_response(user, await get_user_categories(db, user_id))
+    
+    user = await db_writer.run(_delete)
+    invalidate_device_cache()
+    return user
 
 # ============== PROJECT ROUTES ==============
 
 @api_router.post("/projects", response_model=dict)
 async def create_project(project: ProjectBase, user_id: str):
-    project_id = str(uuid.uuid4())
+    project_id = uuid.uuid4().hex
     created_at = datetime.now(timezone.utc).isoformat()
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def _insert(db):
         await db.execute(
             "INSERT INTO projects (id, name, description, user_id, created_at) VALUES (?, ?, ?, ?, ?)",
             (project_id, project.name, project.description or "", user_id, created_at)
         )
-        await db.commit()
+    
+    await db_writer.run(_insert)
     
     return {
         "id": project_id,
@@ -970,9 +1700,9 @@ async def create_project(project: ProjectBase, user_id: str):
         "task_count": 0
     }
 
-@api_router.get("/projects", response_model=List[dict])
+@api_router.get("/projects", response_model=None)
 async def get_projects(user_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         # Single query with LEFT JOIN to avoid N+1 problem
         cursor = await db.execute(
             """SELECT p.id, p.name, p.description, p.user_id, p.created_at, COUNT(t.id) as task_count
@@ -984,21 +1714,11 @@ async def get_projects(user_id: str):
         )
         rows = await cursor.fetchall()
         
-        return [
-            {
-                "id": row[0],
-                "name": row[1],
-                "description": row[2],
-                "user_id": row[3],
-                "created_at": row[4],
-                "task_count": row[5]
-            }
-            for row in rows
-        ]
+        return ORJSONResponse([dict(row) for row in rows])
 
 @api_router.get("/projects/{project_id}", response_model=dict)
 async def get_project(project_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         cursor = await db.execute(
             "SELECT id, name, description, user_id, created_at FROM projects WHERE id = ?",
             (project_id,)
@@ -1008,96 +1728,100 @@ async def get_project(project_id: str):
         if not row:
             raise HTTPException(status_code=404, detail="Proje bulunamadı")
         
-        return {
-            "id": row[0],
-            "name": row[1],
-            "description": row[2],
-            "user_id": row[3],
-            "created_at": row[4]
-        }
+        return dict(row)
 
 @api_router.put("/projects/{project_id}", response_model=dict)
 async def update_project(project_id: str, project: ProjectBase):
-    async with aiosqlite.connect(DB_PATH) as db:
-        cursor = await db.execute(
-            "SELECT id FROM projects WHERE id = ?",
-            (project_id,)
-        )
-        if not await cursor.fetchone():
-            raise HTTPException(status_code=404, detail="Proje bulunamadı")
-        
-        await db.execute(
-            "UPDATE projects SET name = ?, description = ? WHERE id = ?",
-            (project.name, project.description, project_id)
-        )
-        await db.commit()
-        
-        cursor = await db.execute(
-            "SELECT id, name, description, user_id, created_at FROM projects WHERE id = ?",
-            (project_id,)
-        )
-        row = await cursor.fetchone()
+    async def _update(db):
+        if SQLITE_HAS_RETURNING:
+            # Existence check, update and response row in a single statement
+            cursor = await db.execute(
+                "UPDATE projects SET name = ?, description = ? WHERE id = ? RETURNING id, name, description, user_id, created_at",
+                (project.name, project.description, project_id)
+            )
+            row = await cursor.fetchone()
+            if not row:
+                raise HTTPException(status_code=404, detail="Proje bulunamadı")
+        else:
+            cursor = await db.execute(
+                "UPDATE projects SET name = ?, description = ? WHERE id = ?",
+                (project.name, project.description, project_id)
+            )
+            if cursor.rowcount == 0:
+                raise HTTPException(status_code=404, detail="Proje bulunamadı")
+            
+            cursor = await db.execute(
+                "SELECT id, name, description, user_id, created_at FROM projects WHERE id = ?",
+                (project_id,)
+            )
+            row = await cursor.fetchone()
         
-        return {
-            "id": row[0],
-            "name": row[1],
-            "description": row[2],
-            "user_id": row[3],
-            "created_at": row[4]
-        }
+        return dict(row)
+    
+    return await db_writer.run(_update)
 
 @api_router.delete("/projects/{project_id}")
 async def delete_project(project_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute("DELETE FROM tasks WHERE project_id = ?", (project_id,))
+    async def _delete(db):
+        # Project tasks are removed by trg_projects_delete_tasks in the same statement
         result = await db.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-        await db.commit()
-        
-        if result.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Proje bulunamadı")
-        
-        return {"message": "Proje silindi"}
+        return result.rowcount
+    
+    if await db_writer.run(_delete) == 0:
+        raise HTTPException(status_code=404, detail="Proje bulunamadı")
+    
+    invalidate_task_stats()
+    return {"message": "Proje silindi"}
 
 # ============== TASK ROUTES ==============
 
+TASK_INSERT_SQL = (
+    "INSERT INTO tasks (id, title, description, category_id, project_id, user_id, assigned_to, status, priority, due_date, created_at, completed_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+TASK_INSERT_RETURNING_ASSIGNER = " RETURNING (SELECT name FROM users WHERE id = tasks.user_id)"
+
 @api_router.post("/tasks", response_model=dict)
 async def create_task(task: TaskCreate, user_id: str):
-    task_id = str(uuid.uuid4())
+    task_id = uuid.uuid4().hex
     created_at = datetime.now(timezone.utc).isoformat()
     
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            """INSERT INTO tasks (id, title, description, category_id, project_id, user_id, assigned_to, status, priority, due_date, created_at, completed_at)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (task_id, task.title, task.description or "", task.category_id, task.project_id, user_id, 
-             task.assigned_to, TaskStatus.BACKLOG.value, task.priority.value, task.due_date, created_at, None)
-        )
-        
-        # Create notification if task is assigned to someone else
-        if task.assigned_to and task.assigned_to != user_id:
-            # Get assigner name
+    # Assigner name is only needed for the notification if task is assigned to someone else
+    notify = bool(task.assigned_to and task.assigned_to != user_id)
+    
+    async def _insert(db):
+        params = (task_id, task.title, task.description or "", task.category_id, task.project_id, user_id, 
+                  task.assigned_to, TaskStatus.BACKLOG.value, task.priority.value, task.due_date, created_at, None)
+        if notify and SQLITE_HAS_RETURNING:
+            # Name comes back from the INSERT itself, no second statement
+            cursor = await db.execute(TASK_INSERT_SQL + TASK_INSERT_RETURNING_ASSIGNER, params)
+        else:
+            await db.execute(TASK_INSERT_SQL, params)
+            if not notify:
+                return None
             cursor = await db.execute("SELECT name FROM users WHERE id = ?", (user_id,))
-            assigner = await cursor.fetchone()
-            assigner_name = assigner[0] if assigner else "Birisi"
-            
-            notif_id = str(uuid.uuid4())
-            await db.execute(
-                "INSERT INTO notifications (id, user_id, title, message, type, is_read, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (notif_id, task.assigned_to, "Yeni Görev Atandı", f"{assigner_name} size bir görev atadı: {task.title}", "info", 0, created_at)
-            )
-            
-            # Send real-time notification via SSE
-            await notification_manager.send_notification(task.assigned_to, {
+        assigner = await cursor.fetchone()
+        return (assigner[0] if assigner else None) or "Birisi"
+    
+    assigner_name = await db_writer.run(_insert)
+    invalidate_task_stats(user_id)
+    
+    # Notification insert + SSE fan-out happen after commit, off the request path
+    if assigner_name:
+        notif_id = uuid.uuid4().hex
+        notif_message = f"{assigner_name} size bir görev atadı: {task.title}"
+        notification_batcher.enqueue(
+            (notif_id, task.assigned_to, "Yeni Görev Atandı", notif_message, "info", 0, created_at),
+            {
                 "id": notif_id,
                 "user_id": task.assigned_to,
                 "title": "Yeni Görev Atandı",
-                "message": f"{assigner_name} size bir görev atadı: {task.title}",
+                "message": notif_message,
                 "type": "info",
                 "is_read": False,
                 "created_at": created_at
-            })
-        
-        await db.commit()
+            }
+        )
     
     return {
         "id": task_id,
@@ -1114,7 +1838,33 @@ async def create_task(task: TaskCreate, user_id: str):
         "completed_at": None
     }
 
-@api_router.get("/tasks", response_model=List[dict])
+# Optional get_tasks filters, in WHERE-clause order
+TASK_FILTER_FIELDS = ("status", "category_id", "project_id", "priority")
+_tasks_query_sql_cache: dict = {}
+
+def tasks_query_sql(assigned_to_me: bool, fields: tuple) -> str:
+    """get_tasks SELECT for a given filter shape, built once per shape.
+    
+    Identical SQL text per shape keeps sqlite3's per-connection statement
+    cache hitting, while each shape still gets an index-friendly plan.
+    """
+    key = (assigned_to_me, fields)
+    sql = _tasks_query_sql_cache.get(key)
+    if sql is None:
+        # If assigned_to_me is True, show tasks assigned to user (not created by them)
+        # Otherwise show tasks created by user OR assigned to them
+        conditions = ["t.assigned_to = ?" if assigned_to_me else "(t.user_id = ? OR t.assigned_to = ?)"]
+        conditions.extend(f"t.{f} = ?" for f in fields)
+        sql = (
+            f"SELECT {TASK_SELECT_WITH_NAMES} FROM tasks t "
+            "LEFT JOIN users ua ON ua.id = t.assigned_to "
+            "LEFT JOIN users uc ON uc.id = t.user_id "
+            f"WHERE {' AND '.join(conditions)}"
+        )
+        _tasks_query_sql_cache[key] = sql
+    return sql
+
+@api_router.get("/tasks", response_model=None)
 async def get_tasks(
     user_id: str,
     status: Optional[str] = None,
@@ -1123,72 +1873,22 @@ async def get_tasks(
     priority: Optional[str] = None,
     assigned_to_me: Optional[bool] = None
 ):
-    # If assigned_to_me is True, show tasks assigned to user (not created by them)
-    # Otherwise show tasks created by user OR assigned to them
-    if assigned_to_me:
-        query = "SELECT id, title, description, category_id, project_id, user_id, assigned_to, status, priority, due_date, created_at, completed_at FROM tasks WHERE assigned_to = ?"
-        params = [user_id]
-    else:
-        query = "SELECT id, title, description, category_id, project_id, user_id, assigned_to, status, priority, due_date, created_at, completed_at FROM tasks WHERE (user_id = ? OR assigned_to = ?)"
-        params = [user_id, user_id]
-    
-    if status:
-        query += " AND status = ?"
-        params.append(status)
-    if category_id:
-        query += " AND category_id = ?"
-        params.append(category_id)
-    if project_id:
-        query += " AND project_id = ?"
-        params.append(project_id)
-    if priority:
-        query += " AND priority = ?"
-        params.append(priority)
+    filters = dict(zip(TASK_FILTER_FIELDS, (status, category_id, project_id, priority)))
+    fields = tuple(f for f in TASK_FILTER_FIELDS if filters[f])
+    query = tasks_query_sql(bool(assigned_to_me), fields)
+    params = [user_id] if assigned_to_me else [user_id, user_id]
+    params.extend(filters[f] for f in fields)
     
-    async with aiosqlite.connect(DB_PATH) as db:
-        cursor = await db.execute(query, params)
-        rows = await cursor.fetchall()
-        
-        # Get user names for assigned_to
-        user_ids = set()
-        for row in rows:
-            if row[5]:  # user_id
-                user_ids.add(row[5])
-            if row[6]:  # assigned_to
-                user_ids.add(row[6])
-        
-        user_map = {}
-        if user_ids:
-            placeholders = ','.join('?' * len(user_ids))
-            cursor = await db.execute(f"SELECT id, name FROM users WHERE id IN ({placeholders})", list(user_ids))
-            for u in await cursor.fetchall():
-                user_map[u[0]] = u[1]
-        
-        return [
-            {
-                "id": row[0],
-                "title": row[1],
-                "description": row[2],
-                "category_id": row[3],
-                "project_id": row[4],
-                "user_id": row[5],
-                "assigned_to": row[6],
-                "assigned_to_name": user_map.get(row[6]) if row[6] else None,
-                "created_by_name": user_map.get(row[5]) if row[5] else None,
-                "status": row[7],
-                "priority": row[8],
-                "due_date": row[9],
-                "created_at": row[10],
-                "completed_at": row[11]
-            }
-            for row in rows
-        ]
+    async with db_pool.connection() as db:
+        # Names come back with the rows; no second users lookup
+        cursor = await execute_chunked(db, query, params)
+        return ORJSONResponse([dict(row) async for row in cursor])
 
 @api_router.get("/tasks/{task_id}", response_model=dict)
 async def get_task(task_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         cursor = await db.execute(
-            "SELECT id, title, description, category_id, project_id, user_id, assigned_to, status, priority, due_date, created_at, completed_at FROM tasks WHERE id = ?",
+            f"SELECT {TASK_SELECT} FROM tasks WHERE id = ?",
             (task_id,)
         )
         row = await cursor.fetchone()
@@ -1196,24 +1896,30 @@ async def get_task(task_id: str):
         if not row:
             raise HTTPException(status_code=404, detail="Görev bulunamadı")
         
-        return {
-            "id": row[0],
-            "title": row[1],
-            "description": row[2],
-            "category_id": row[3],
-            "project_id": row[4],
-            "user_id": row[5],
-            "assigned_to": row[6],
-            "status": row[7],
-            "priority": row[8],
-            "due_date": row[9],
-            "created_at": row[10],
-            "completed_at": row[11]
-        }
+        return dict(row)
+
+# Updatable task columns, in SET-clause order
+TASK_UPDATE_FIELDS = ("title", "description", "category_id", "project_id", "assigned_to", "priority", "status", "due_date")
+_task_update_sql_cache: dict = {}
+
+def task_update_sql(fields: tuple) -> str:
+    """UPDATE statement for a given set of changed fields, built once per shape"""
+    sql = _task_update_sql_cache.get(fields)
+    if sql is None:
+        assignments = [f"{f} = ?" for f in fields]
+        if "status" in fields:
+            assignments.append("completed_at = ?")
+        sql = f"UPDATE tasks SET {', '.join(assignments)} WHERE id = ?"
+        if SQLITE_HAS_RETURNING:
+            sql += f" RETURNING {TASK_SELECT}"
+        _task_update_sql_cache[fields] = sql
+    return sql
 
 @api_router.put("/tasks/{task_id}", response_model=dict)
 async def update_task(task_id: str, task_update: TaskUpdate, user_id: Optional[str] = None):
-    async with aiosqlite.connect(DB_PATH) as db:
+    now_iso = datetime.now(timezone.utc).isoformat()
+    
+    async def _update(db):
         # Get current task to check for assignment changes
         cursor = await db.execute("SELECT id, title, assigned_to FROM tasks WHERE id = ?", (task_id,))
         current_task = await cursor.fetchone()
@@ -1223,126 +1929,108 @@ async def update_task(task_id: str, task_update: TaskUpdate, user_id: Optional[s
         old_assigned_to = current_task[2]
         task_title = current_task[1]
         
-        updates = []
-        params = []
-        
-        if task_update.title is not None:
-            updates.append("title = ?")
-            params.append(task_update.title)
-            task_title = task_update.title
-        if task_update.description is not None:
-            updates.append("description = ?")
-            params.append(task_update.description)
-        if task_update.category_id is not None:
-            updates.append("category_id = ?")
-            params.append(task_update.category_id)
-        if task_update.project_id is not None:
-            updates.append("project_id = ?")
-            params.append(task_update.project_id)
-        if task_update.assigned_to is not None:
-            updates.append("assigned_to = ?")
-            params.append(task_update.assigned_to if task_update.assigned_to != "none" else None)
-        if task_update.priority is not None:
-            updates.append("priority = ?")
-            params.append(task_update.priority.value)
-        if task_update.status is not None:
-            updates.append("status = ?")
-            params.append(task_update.status.value)
-            if task_update.status == TaskStatus.COMPLETED:
-                updates.append("completed_at = ?")
-                params.append(datetime.now(timezone.utc).isoformat())
-            else:
-                updates.append("completed_at = ?")
-                params.append(None)
-        if task_update.due_date is not None:
-            updates.append("due_date = ?")
-            params.append(task_update.due_date)
-        
-        if not updates:
+        values = task_update.model_dump(mode="json", exclude_none=True)
+        fields = tuple(f for f in TASK_UPDATE_FIELDS if f in values)
+        if not fields:
             raise HTTPException(status_code=400, detail="Güncellenecek alan bulunamadı")
         
+        if "title" in values:
+            task_title = values["title"]
+        if values.get("assigned_to") == "none":
+            values["assigned_to"] = None
+        params = [values[f] for f in fields]
+        if "status" in values:
+            # completed_at is the trailing SET column when status changes (see task_update_sql)
+            params.append(now_iso if values["status"] == TaskStatus.COMPLETED.value else None)
         params.append(task_id)
-        await db.execute(f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?", params)
         
-        # Create notification if assigned_to changed
-        new_assigned = task_update.assigned_to if task_update.assigned_to != "none" else None
-        if task_update.assigned_to is not None and new_assigned != old_assigned_to and new_assigned and user_id:
+        cursor = await db.execute(task_update_sql(fields), params)
+        if not SQLITE_HAS_RETURNING:
+            cursor = await db.execute(f"SELECT {TASK_SELECT} FROM tasks WHERE id = ?", (task_id,))
+        row = await cursor.fetchone()
+        
+        # Build notification if assigned_to changed
+        new_assigned = values.get("assigned_to")
+        notification = None
+        if "assigned_to" in values and new_assigned != old_assigned_to and new_assigned and user_id:
             # Get assigner name
             cursor = await db.execute("SELECT name FROM users WHERE id = ?", (user_id,))
             assigner = await cursor.fetchone()
             assigner_name = assigner[0] if assigner else "Birisi"
             
-            notif_id = str(uuid.uuid4())
-            notif_created_at = datetime.now(timezone.utc).isoformat()
-            await db.execute(
-                "INSERT INTO notifications (id, user_id, title, message, type, is_read, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (notif_id, new_assigned, "Görev Atandı", f"{assigner_name} size bir görev atadı: {task_title}", "info", 0, notif_created_at)
+            notif_id = uuid.uuid4().hex
+            notif_message = f"{assigner_name} size bir görev atadı: {task_title}"
+            notification = (
+                (notif_id, new_assigned, "Görev Atandı", notif_message, "info", 0, now_iso),
+                {
+                    "id": notif_id,
+                    "user_id": new_assigned,
+                    "title": "Görev Atandı",
+                    "message": notif_message,
+                    "type": "info",
+                    "is_read": False,
+                    "created_at": now_iso
+                }
             )
-            
-            # Send real-time notification via SSE
-            await notification_manager.send_notification(new_assigned, {
-                "id": notif_id,
-                "user_id": new_assigned,
-                "title": "Görev Atandı",
-                "message": f"{assigner_name} size bir görev atadı: {task_title}",
-                "type": "info",
-                "is_read": False,
-                "created_at": notif_created_at
-            })
-        await db.commit()
-        
-        cursor = await db.execute(
-            "SELECT id, title, description, category_id, project_id, user_id, assigned_to, status, priority, due_date, created_at, completed_at FROM tasks WHERE id = ?",
-            (task_id,)
-        )
-        row = await cursor.fetchone()
-        
-        return {
-            "id": row[0],
-            "title": row[1],
-            "description": row[2],
-            "category_id": row[3],
-            "project_id": row[4],
-            "user_id": row[5],
-            "assigned_to": row[6],
-            "status": row[7],
-            "priority": row[8],
-            "due_date": row[9],
-            "created_at": row[10],
-            "completed_at": row[11]
-        }
+        return dict(row), notification
+    
+    task, notification = await db_writer.run(_update)
+    invalidate_task_stats(task["user_id"])
+    
+    # Notification insert + SSE fan-out happen after commit, off the request path
+    if notification:
+        notification_batcher.enqueue(*notification)
+    
+    return task
 
 @api_router.delete("/tasks/{task_id}")
 async def delete_task(task_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def _delete(db):
+        if SQLITE_HAS_RETURNING:
+            # Owner comes back with the delete, so only their cached stats are dropped
+            cursor = await db.execute("DELETE FROM tasks WHERE id = ? RETURNING user_id", (task_id,))
+            return await cursor.fetchone()
         cursor = await db.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        await db.commit()
-        
-        if cursor.rowcount == 0:
+        return cursor.rowcount
+    
+    deleted = await db_writer.run(_delete)
+    if SQLITE_HAS_RETURNING:
+        if deleted is None:
             raise HTTPException(status_code=404, detail="Görev bulunamadı")
-        
-        return {"message": "Görev silindi"}
+        invalidate_task_stats(deleted[0])
+    else:
+        if deleted == 0:
+            raise HTTPException(status_code=404, detail="Görev bulunamadı")
+        invalidate_task_stats()
+    
+    return {"message": "Görev silindi"}
 
 # ============== DASHBOARD STATS ==============
 
 @api_router.get("/dashboard/stats")
 async def get_dashboard_stats(user_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Counts
-        cursor = await db.execute("SELECT COUNT(*) FROM tasks WHERE user_id = ?", (user_id,))
-        total_tasks = (await cursor.fetchone())[0]
-        
-        cursor = await db.execute("SELECT COUNT(*) FROM tasks WHERE user_id = ? AND status = ?", (user_id, TaskStatus.COMPLETED.value))
-        completed_tasks = (await cursor.fetchone())[0]
-        
-        cursor = await db.execute("SELECT COUNT(*) FROM tasks WHERE user_id = ? AND status = ?", (user_id, TaskStatus.IN_PROGRESS.value))
-        in_progress_tasks = (await cursor.fetchone())[0]
+    cached = _dashboard_stats_cache.get(user_id)
+    if cached is not None:
+        return cached
+    
+    async with db_pool.connection() as db:
+        now = datetime.now(timezone.utc).isoformat()
         
-        cursor = await db.execute("SELECT COUNT(*) FROM tasks WHERE user_id = ? AND status IN (?, ?)", (user_id, TaskStatus.BACKLOG.value, TaskStatus.TODAY_PLANNED.value))
-        todo_tasks = (await cursor.fetchone())[0]
+        # Counts - one pass over the user's tasks (COUNT of CASE is 0, not NULL, when empty)
+        cursor = await db.execute(
+            """SELECT COUNT(*),
+                      COUNT(CASE WHEN status = ? THEN 1 END),
+                      COUNT(CASE WHEN status = ? THEN 1 END),
+                      COUNT(CASE WHEN status IN (?, ?) THEN 1 END),
+                      COUNT(CASE WHEN status = ? THEN 1 END),
+                      COUNT(CASE WHEN due_date < ? AND due_date IS NOT NULL AND status != ? THEN 1 END)
+               FROM tasks WHERE user_id = ?""",
+            (TaskStatus.COMPLETED.value, TaskStatus.IN_PROGRESS.value,
+             TaskStatus.BACKLOG.value, TaskStatus.TODAY_PLANNED.value, TaskStatus.TODAY_PLANNED.value,
+             now, TaskStatus.COMPLETED.value, user_id)
+        )
+        total_tasks, completed_tasks, in_progress_tasks, todo_tasks, today_planned_tasks, overdue_tasks = await cursor.fetchone()
         
-        cursor = await db.execute("SELECT COUNT(*) FROM tasks WHERE user_id = ? AND status = ?", (user_id, TaskStatus.TODAY_PLANNED.value))
-        today_planned_tasks = (await cursor.fetchone())[0]
         # Category stats
         cursor = await db.execute(
             "SELECT category_id, COUNT(*) FROM tasks WHERE user_id = ? GROUP BY category_id",
@@ -1361,101 +2049,89 @@ async def get_dashboard_stats(user_id: str):
         
         # Recent tasks
         cursor = await db.execute(
-            "SELECT id, title, description, category_id, project_id, user_id, status, priority, due_date, created_at, completed_at FROM tasks WHERE user_id = ? ORDER BY created_at DESC LIMIT 5",
+            f"SELECT {', '.join(RECENT_TASK_COLUMNS)} FROM tasks WHERE user_id = ? ORDER BY created_at DESC LIMIT 5",
             (user_id,)
         )
         recent_rows = await cursor.fetchall()
-        recent_tasks = [
-            {
-                "id": row[0], "title": row[1], "description": row[2], "category_id": row[3],
-                "project_id": row[4], "user_id": row[5], "status": row[6], "priority": row[7],
-                "due_date": row[8], "created_at": row[9], "completed_at": row[10]
-            }
-            for row in recent_rows
-        ]
+        recent_tasks = [dict(row) for row in recent_rows]
         
-        # Overdue tasks
-        now = datetime.now(timezone.utc).isoformat()
-        cursor = await db.execute(
-            "SELECT COUNT(*) FROM tasks WHERE user_id = ? AND due_date < ? AND due_date IS NOT NULL AND status != ?",
-            (user_id, now, TaskStatus.COMPLETED.value)
-        )
-        overdue_tasks = (await cursor.fetchone())[0]
-        
-        # Today Focus
+        # Today Focus - scored, filtered and ranked in SQL; days_until floors
+        # like timedelta.days, window counts are taken before LIMIT
         cursor = await db.execute(
-            "SELECT id, title, description, category_id, project_id, user_id, status, priority, due_date, created_at, completed_at FROM tasks WHERE user_id = ? AND status != ?",
-            (user_id, TaskStatus.COMPLETED.value)
+            f"""WITH active AS (
+                   SELECT rowid AS rid, id, title, description, category_id, project_id, user_id, status, priority, due_date, created_at, completed_at,
+                          julianday(due_date) - julianday(?) AS delta
+                   FROM tasks WHERE user_id = ? AND status != ?
+               ), dated AS (
+                   SELECT *, CAST(delta AS INTEGER) - (delta < CAST(delta AS INTEGER)) AS days_until FROM active
+               ), scored AS (
+                   SELECT *,
+                          {PRIORITY_WEIGHT_SQL}
+                          + CASE WHEN days_until < 0 THEN MIN(-days_until, 5) + 3
+                                 WHEN days_until = 0 THEN 3
+                                 WHEN days_until = 1 THEN 2
+                                 WHEN days_until <= 3 THEN 1
+                                 ELSE 0 END AS risk_score,
+                          CASE WHEN days_until < 0 THEN 10
+                               WHEN days_until = 0 THEN 8
+                               WHEN days_until = 1 THEN 6
+                               WHEN days_until <= 3 THEN 4
+                               ELSE 0 END AS urgency_score,
+                          CASE WHEN days_until < 0 THEN (-days_until) || ' gün gecikmiş'
+                               WHEN days_until = 0 THEN 'Bugün son gün'
+                               WHEN days_until = 1 THEN 'Yarın bitiyor'
+                               WHEN days_until <= 3 THEN days_until || ' gün kaldı'
+                               WHEN priority IN ('critical', 'high') THEN 'Yüksek öncelik'
+                               END AS focus_label,
+                          SUM(priority IN ('critical', 'high')) OVER () AS high_priority_count
+                   FROM dated
+               )
+               SELECT id, title, description, category_id, project_id, user_id, status, priority, due_date, created_at, completed_at,
+                      risk_score, urgency_score, focus_label,
+                      COUNT(*) OVER () AS attention_count,
+                      SUM(days_until < 0) OVER () AS overdue_count,
+                      SUM(days_until = 0) OVER () AS due_today_count,
+                      high_priority_count
+               FROM scored
+               WHERE risk_score >= 4 OR urgency_score >= 4
+               ORDER BY urgency_score DESC, risk_score DESC, rid
+               LIMIT 5""",
+            (now, user_id, TaskStatus.COMPLETED.value)
         )
-        active_rows = await cursor.fetchall()
+        focus_rows = await cursor.fetchall()
         
-        now_dt = datetime.now(timezone.utc)
-        focus_tasks = []
-        
-        for row in active_rows:
-            task = {
-                "id": row[0], "title": row[1], "description": row[2], "category_id": row[3],
-                "project_id": row[4], "user_id": row[5], "status": row[6], "priority": row[7],
-                "due_date": row[8], "created_at": row[9], "completed_at": row[10]
+        focus_tasks = [
+            {
+                **row_to_dict(row, RECENT_TASK_COLUMNS),
+                "risk_score": row[11], "urgency_score": row[12],
+                "focus_labels": [row[13]] if row[13] else []
             }
-            
-            risk_score = 0
-            urgency_score = 0
-            labels = []
-            
-            priority_weights = {"critical": 4, "high": 3, "medium": 2, "low": 1}
-            risk_score += priority_weights.get(task.get("priority", "medium"), 2)
-            
-            if task.get("due_date"):
-                try:
-                    due_dt = datetime.fromisoformat(task["due_date"].replace("Z", "+00:00"))
-                    days_until = (due_dt - now_dt).days
-                    
-                    if days_until < 0:
-                        overdue_days = abs(days_until)
-                        risk_score += min(overdue_days, 5) + 3
-                        urgency_score = 10
-                        labels.append(f"{overdue_days} gün gecikmiş")
-                    elif days_until == 0:
-                        risk_score += 3
-                        urgency_score = 8
-                        labels.append("Bugün son gün")
-                    elif days_until == 1:
-                        risk_score += 2
-                        urgency_score = 6
-                        labels.append("Yarın bitiyor")
-                    elif days_until <= 3:
-                        risk_score += 1
-                        urgency_score = 4
-                        labels.append(f"{days_until} gün kaldı")
-                except:
-                    pass
-            
-            if task.get("priority") in ["critical", "high"] and not labels:
-                labels.append("Yüksek öncelik")
-            
-            task["risk_score"] = risk_score
-            task["urgency_score"] = urgency_score
-            task["focus_labels"] = labels
-            
-            if risk_score >= 4 or urgency_score >= 4:
-                focus_tasks.append(task)
-        
-        focus_tasks.sort(key=lambda x: (x["urgency_score"], x["risk_score"]), reverse=True)
+            for row in focus_rows
+        ]
+        if focus_rows:
+            total_attention_needed, overdue_count, due_today_count = focus_rows[0][14:17]
+        else:
+            total_attention_needed = overdue_count = due_today_count = 0
         
-        overdue_list = [t for t in focus_tasks if any("gecikmiş" in l for l in t.get("focus_labels", []))]
-        critical_today = [t for t in focus_tasks if "Bugün son gün" in t.get("focus_labels", [])]
-        high_priority = [t for t in active_rows if t[7] in ["critical", "high"]]
+        # High-priority count covers all active tasks, not just focus ones
+        if focus_rows:
+            high_priority_count = focus_rows[0][17]
+        else:
+            cursor = await db.execute(
+                "SELECT COUNT(*) FROM tasks WHERE user_id = ? AND status != ? AND priority IN ('critical', 'high')",
+                (user_id, TaskStatus.COMPLETED.value)
+            )
+            high_priority_count = (await cursor.fetchone())[0]
         
         today_summary = []
-        if overdue_list:
-            today_summary.append(f"{len(overdue_list)} görev gecikmiş durumda")
-        if critical_today:
-            today_summary.append(f"{len(critical_today)} görevin bugün son günü")
-        if len(high_priority) > 0 and not overdue_list and not critical_today:
-            today_summary.append(f"{len(high_priority)} yüksek öncelikli görev bekliyor")
-        
-        return {
+        if overdue_count:
+            today_summary.append(f"{overdue_count} görev gecikmiş durumda")
+        if due_today_count:
+            today_summary.append(f"{due_today_count} görevin bugün son günü")
+        if high_priority_count > 0 and not overdue_count and not due_today_count:
+            today_summary.append(f"{high_priority_count} yüksek öncelikli görev bekliyor")
+        
+        stats = {
             "total_tasks": total_tasks,
             "completed_tasks": completed_tasks,
             "in_progress_tasks": in_progress_tasks,
@@ -1466,11 +2142,14 @@ async def get_dashboard_stats(user_id: str):
             "priority_stats": priority_stats,
             "recent_tasks": recent_tasks,
             "today_focus": {
-                "tasks": focus_tasks[:5],
+                "tasks": focus_tasks,
                 "summary": today_summary,
-                "total_attention_needed": len(focus_tasks)
+                "total_attention_needed": total_attention_needed
             }
         }
+    
+    _dashboard_stats_cache[user_id] = stats
+    return stats
 
 # ============== NOTIFICATION ROUTES ==============
 
@@ -1482,7 +2161,7 @@ async def get_daily_summary(user_id: str, target_date: Optional[str] = None):
         user_id: User ID
         target_date: Target date in ISO format (YYYY-MM-DD). Defaults to today.
     """
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         # Parse target date or use today
         if target_date:
             try:
@@ -1497,75 +2176,39 @@ async def get_daily_summary(user_id: str, target_date: Optional[str] = None):
         today_start = target_dt.replace(hour=0, minute=0, second=0, microsecond=0)
         yesterday_start = today_start - timedelta(days=1)
         
-        # Yesterday completed tasks (completed_at between yesterday 00:00 and today 00:00)
-        cursor = await db.execute(
-            """SELECT id, title, description, category_id, project_id, status, priority, completed_at 
-               FROM tasks 
-               WHERE user_id = ? AND status = ? AND completed_at >= ? AND completed_at < ?
-               ORDER BY completed_at DESC""",
-            (user_id, TaskStatus.COMPLETED.value, yesterday_start.isoformat(), today_start.isoformat())
-        )
-        yesterday_rows = await cursor.fetchall()
-        yesterday_completed = [
-            {"id": r[0], "title": r[1], "description": r[2], "category_id": r[3], 
-             "project_id": r[4], "status": r[5], "priority": r[6], "completed_at": r[7]}
-            for r in yesterday_rows
-        ]
-        
-        # Today's work - in_progress tasks
-        cursor = await db.execute(
-            """SELECT id, title, description, category_id, project_id, status, priority, due_date 
-               FROM tasks 
-               WHERE user_id = ? AND status = ?
-               ORDER BY priority DESC""",
-            (user_id, TaskStatus.IN_PROGRESS.value)
-        )
-        in_progress_rows = await cursor.fetchall()
-        today_in_progress = [
-            {"id": r[0], "title": r[1], "description": r[2], "category_id": r[3], 
-             "project_id": r[4], "status": r[5], "priority": r[6], "due_date": r[7]}
-            for r in in_progress_rows
-        ]
-        
-        # Blocked tasks
-        cursor = await db.execute(
-            """SELECT id, title, description, category_id, project_id, status, priority, due_date 
-               FROM tasks 
-               WHERE user_id = ? AND status = ?
-               ORDER BY priority DESC""",
-            (user_id, TaskStatus.BLOCKED.value)
-        )
-        blocked_rows = await cursor.fetchall()
-        blocked_tasks = [
-            {"id": r[0], "title": r[1], "description": r[2], "category_id": r[3], 
-             "project_id": r[4], "status": r[5], "priority": r[6], "due_date": r[7]}
-            for r in blocked_rows
-        ]
-        
-        # Today planned - tasks with status "today_planned"
-        cursor = await db.execute(
-            """SELECT id, title, description, category_id, project_id, status, priority, due_date 
-               FROM tasks 
-               WHERE user_id = ? AND status = ?
-               ORDER BY priority DESC, due_date ASC""",
-            (user_id, TaskStatus.TODAY_PLANNED.value)
+        # All four lists in one query, tagged by bucket; project names come from
+        # a LEFT JOIN on the user's own projects. stamp is completed_at for
+        # bucket 1 (yesterday completed) and due_date for the others.
+        cursor = await execute_chunked(
+            db,
+            """SELECT * FROM (
+                   SELECT 1 AS bucket, t.id, t.title, t.description, t.category_id, t.project_id, t.status, t.priority,
+                          t.completed_at AS stamp, p.name AS project_name
+                   FROM tasks t LEFT JOIN projects p ON p.id = t.project_id AND p.user_id = t.user_id
+                   WHERE t.user_id = ? AND t.status = ? AND t.completed_at >= ? AND t.completed_at < ?
+                   UNION ALL
+                   SELECT CASE t.status WHEN ? THEN 2 WHEN ? THEN 3 ELSE 4 END, t.id, t.title, t.description, t.category_id, t.project_id, t.status, t.priority,
+                          t.due_date, p.name
+                   FROM tasks t LEFT JOIN projects p ON p.id = t.project_id AND p.user_id = t.user_id
+                   WHERE t.user_id = ? AND t.status IN (?, ?, ?)
+               )
+               ORDER BY bucket,
+                        CASE bucket WHEN 1 THEN stamp END DESC,
+                        priority DESC,
+                        CASE bucket WHEN 4 THEN stamp END ASC""",
+            (
+                user_id, TaskStatus.COMPLETED.value, yesterday_start.isoformat(), today_start.isoformat(),
+                TaskStatus.IN_PROGRESS.value, TaskStatus.BLOCKED.value,
+                user_id, TaskStatus.IN_PROGRESS.value, TaskStatus.BLOCKED.value, TaskStatus.TODAY_PLANNED.value
+            )
         )
-        planned_rows = await cursor.fetchall()
-        today_planned = [
-            {"id": r[0], "title": r[1], "description": r[2], "category_id": r[3], 
-             "project_id": r[4], "status": r[5], "priority": r[6], "due_date": r[7]}
-            for r in planned_rows
-        ]
-        
-        # Get project names
-        cursor = await db.execute("SELECT id, name FROM projects WHERE user_id = ?", (user_id,))
-        project_rows = await cursor.fetchall()
-        project_map = {r[0]: r[1] for r in project_rows}
-        
-        # Add project names to tasks
-        for task_list in [yesterday_completed, today_in_progress, blocked_tasks, today_planned]:
-            for task in task_list:
-                task["project_name"] = project_map.get(task.get("project_id"), None)
+        yesterday_completed, today_in_progress, blocked_tasks, today_planned = [], [], [], []
+        buckets = (None, yesterday_completed, today_in_progress, blocked_tasks, today_planned)
+        async for r in cursor:
+            task = dict(r)
+            bucket = task.pop("bucket")
+            task["completed_at" if bucket == 1 else "due_date"] = task.pop("stamp")
+            buckets[bucket].append(task)
         
         return {
             "target_date": today_start.isoformat(),
@@ -1581,51 +2224,52 @@ async def get_daily_summary(user_id: str, target_date: Optional[str] = None):
             }
         }
 
-@api_router.get("/notifications", response_model=List[dict])
+@api_router.get("/notifications", response_model=None)
 async def get_notifications(user_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         cursor = await db.execute(
             "SELECT id, user_id, title, message, type, is_read, created_at FROM notifications WHERE user_id = ? ORDER BY created_at DESC LIMIT 50",
             (user_id,)
         )
         rows = await cursor.fetchall()
         
-        return [
+        return ORJSONResponse([
             {
                 "id": row[0], "user_id": row[1], "title": row[2], "message": row[3],
                 "type": row[4], "is_read": bool(row[5]), "created_at": row[6]
             }
             for row in rows
-        ]
+        ])
 
 @api_router.put("/notifications/{notification_id}/read")
 async def mark_notification_read(notification_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def _update(db):
         cursor = await db.execute("UPDATE notifications SET is_read = 1 WHERE id = ?", (notification_id,))
-        await db.commit()
-        
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Bildirim bulunamadı")
-        
-        return {"message": "Bildirim okundu olarak işaretlendi"}
+        return cursor.rowcount
+    
+    if await db_writer.run(_update) == 0:
+        raise HTTPException(status_code=404, detail="Bildirim bulunamadı")
+    
+    return {"message": "Bildirim okundu olarak işaretlendi"}
 
 @api_router.put("/notifications/read-all")
 async def mark_all_notifications_read(user_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def _update(db):
         await db.execute("UPDATE notifications SET is_read = 1 WHERE user_id = ? AND is_read = 0", (user_id,))
-        await db.commit()
-        return {"message": "Tüm bildirimler okundu olarak işaretlendi"}
+    
+    await db_writer.run(_update)
+    return {"message": "Tüm bildirimler okundu olarak işaretlendi"}
 
 @api_router.delete("/notifications/{notification_id}")
 async def delete_notification(notification_id: str):
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def _delete(db):
         cursor = await db.execute("DELETE FROM notifications WHERE id = ?", (notification_id,))
-        await db.commit()
-        
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="Bildirim bulunamadı")
-        
-        return {"message": "Bildirim silindi"}
+        return cursor.rowcount
+    
+    if await db_writer.run(_delete) == 0:
+        raise HTTPException(status_code=404, detail="Bildirim bulunamadı")
+    
+    return {"message": "Bildirim silindi"}
 
 @api_router.get("/notifications/stream")
 async def notification_stream(request: Request, user_id: str):
@@ -1633,9 +2277,10 @@ async def notification_stream(request: Request, user_id: str):
     
     async def event_generator():
         queue = await notification_manager.connect(user_id)
+        pending: list = []  # encoded notifications not yet sent
         try:
             # Send initial connection message
-            yield f"data: {json.dumps({'type': 'connected', 'message': 'SSE bağlantısı kuruldu'})}\n\n"
+            yield sse({'type': 'connected', 'message': 'SSE bağlantısı kuruldu'})
             
             while True:
                 # Check if client disconnected
@@ -1643,12 +2288,21 @@ async def notification_stream(request: Request, user_id: str):
                     break
                 
                 try:
-                    # Wait for notification with timeout
-                    notification = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield f"data: {json.dumps(notification)}\n\n"
+                    # Wait for notification with timeout, then drain what is queued up to one frame
+                    if not pending:
+                        pending.extend(await asyncio.wait_for(queue.get(), timeout=30.0))
+                    while len(pending) < notification_manager.MAX_FRAME_ITEMS and not queue.empty():
+                        pending.extend(queue.get_nowait())
+                    encoded = pending[:notification_manager.MAX_FRAME_ITEMS]
+                    del pending[:notification_manager.MAX_FRAME_ITEMS]
+                    # Items are pre-serialized JSON; a burst goes out as frames carrying an array
+                    if len(encoded) == 1:
+                        yield b"data: " + encoded[0] + b"\n\n"
+                    else:
+                        yield b"data: [" + b",".join(encoded) + b"]\n\n"
                 except asyncio.TimeoutError:
                     # Send heartbeat to keep connection alive
-                    yield ": heartbeat\n\n"
+                    yield SSE_HEARTBEAT
                 except Exception as e:
                     logger.error(f"Error in SSE stream: {e}")
                     break
@@ -1658,44 +2312,36 @@ async def notification_stream(request: Request, user_id: str):
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"
-        }
+        headers={**SSE_HEADERS, "Connection": "keep-alive"}
     )
 
 # ============== ADMIN ROUTES ==============
 
-@api_router.get("/admin/users", response_model=List[dict])
+@api_router.get("/admin/users", response_model=None)
 async def admin_get_all_users():
     """Admin endpoint: Get all users with full details"""
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
+        # Task counts in the same query, read from idx_tasks_user_status_due alone
         cursor = await db.execute(
-            "SELECT id, name, device_id, created_at FROM users ORDER BY created_at DESC"
+            """SELECT u.id, u.name, u.device_id, u.created_at, COUNT(t.user_id)
+               FROM users u LEFT JOIN tasks t ON t.user_id = u.id
+               GROUP BY u.id
+               ORDER BY u.created_at DESC"""
         )
         rows = await cursor.fetchall()
         
-        result = []
-        for row in rows:
-            user_id = row[0]
-            # Get task count for each user
-            cursor2 = await db.execute(
-                "SELECT COUNT(*) FROM tasks WHERE user_id = ?", (user_id,)
-            )
-            task_count = (await cursor2.fetchone())[0]
-            
-            result.append({
-                "id": user_id,
+        return ORJSONResponse([
+            {
+                "id": row[0],
                 "name": row[1],
                 "device_id": row[2],
                 "created_at": row[3],
-                "task_count": task_count
-            })
-        
-        return result
+                "task_count": row[4]
+            }
+            for row in rows
+        ])
 
-@api_router.post("/admin/users", response_model=UserResponse)
+@api_router.post("/admin/users", response_model=None, responses={200: {"model": UserResponse}})
 async def admin_create_user(user_data: UserCreate):
     """Admin endpoint: Manually create a new user"""
     if not user_data.name or not user_data.name.strip():
@@ -1704,7 +2350,7 @@ async def admin_create_user(user_data: UserCreate):
     if not user_data.device_id:
         raise HTTPException(status_code=400, detail="Cihaz kimliği gerekli")
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def _create(db):
         # Check if device already exists
         cursor = await db.execute(
             "SELECT id FROM users WHERE device_id = ?", (user_data.device_id,)
@@ -1715,20 +2361,20 @@ async def admin_create_user(user_data: UserCreate):
             raise HTTPException(status_code=400, detail="Bu cihaz kimliği zaten kayıtlı")
         
         # Create new user
-        user_id = str(uuid.uuid4())
+        user_id = uuid.uuid4().hex
         created_at = datetime.now(timezone.utc).isoformat()
-        categories_json = json.dumps(DEFAULT_CATEGORIES)
         
         # Only SERCANO is admin by default
         role = "admin" if user_data.name.upper() == "SERCANO" else "user"
         
+        # Legacy categories column is kept empty; categories live in user_categories
         await db.execute(
-            "INSERT INTO users (id, name, email, device_id, categories, role, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (user_id, user_data.name.strip(), user_data.email, user_data.device_id, categories_json, role, created_at)
+            "INSERT INTO users (id, name, email, device_id, categories, role, created_at) VALUES (?, ?, ?, ?, '[]', ?, ?)",
+            (user_id, user_data.name.strip(), user_data.email, user_data.device_id, role, created_at)
         )
-        await db.commit()
+        await insert_default_categories(db, user_id)
         
-        return UserResponse(
+        return UserResponse.model_construct(
             id=user_id,
             name=user_data.name.strip(),
             email=user_data.email,
@@ -1737,65 +2383,62 @@ async def admin_create_user(user_data: UserCreate):
             created_at=created_at,
             role=role
         )
+    
+    return await db_writer.run(_create)
 
-@api_router.put("/admin/users/{user_id}", response_model=UserResponse)
+@api_router.put("/admin/users/{user_id}", response_model=None, responses={200: {"model": UserResponse}})
 async def admin_update_user(user_id: str, name: str):
     """Admin endpoint: Update user name"""
     if not name or not name.strip():
         raise HTTPException(status_code=400, detail="İsim boş olamaz")
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def _update(db):
         cursor = await db.execute(
-            "SELECT id, name, email, device_id, categories, created_at, role FROM users WHERE id = ?",
+            "SELECT id, name, email, device_id, created_at, role FROM users WHERE id = ?",
             (user_id,)
         )
         user = await cursor.fetchone()
         
         if not user:
-            raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
+            return None, None
         
         await db.execute(
             "UPDATE users SET name = ? WHERE id = ?",
             (name.strip(), user_id)
         )
-        await db.commit()
-        
-        return UserResponse(
-            id=user[0],
-            name=name.strip(),
-            email=user[2],
-            device_id=user[3],
-            categories=json.loads(user[4]),
-            created_at=user[5],
-            role=user[6] or "user"
-        )
+        return user, await get_user_categories(db, user[0])
+    
+    user, categories = await db_writer.run(_update)
+    if not user:
+        raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
+    
+    invalidate_device_cache()
+    
+    return UserResponse.model_construct(
+        id=user[0],
+        name=name.strip(),
+        email=user[2],
+        device_id=user[3],
+        categories=categories,
+        created_at=user[4],
+        role=user[5] or "user"
+    )
 
 @api_router.delete("/admin/users/{user_id}")
 async def admin_delete_user(user_id: str):
     """Admin endpoint: Delete a user and all their data"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Check if user exists
-        cursor = await db.execute("SELECT id FROM users WHERE id = ?", (user_id,))
-        user = await cursor.fetchone()
-        
-        if not user:
+    async def _delete(db):
+        # Tasks, projects, notifications and categories go with it via trg_users_delete_cascade
+        cursor = await db.execute("DELETE FROM users WHERE id = ?", (user_id,))
+        if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
-        
-        # Delete user's tasks
-        await db.execute("DELETE FROM tasks WHERE user_id = ?", (user_id,))
-        
-        # Delete user's projects
-        await db.execute("DELETE FROM projects WHERE user_id = ?", (user_id,))
-        
-        # Delete user's notifications
-        await db.execute("DELETE FROM notifications WHERE user_id = ?", (user_id,))
-        
-        # Delete user
-        await db.execute("DELETE FROM users WHERE id = ?", (user_id,))
-        
-        await db.commit()
-        
-        return {"message": "Kullanıcı ve tüm verileri silindi"}
+    
+    # The cascade commits (or rolls back) as one unit
+    await db_writer.run(_delete)
+    invalidate_task_stats(user_id)
+    invalidate_device_cache()
+    
+    return {"message": "Kullanıcı ve tüm verileri silindi"}
 
 # ============== JIRA INTEGRATION ROUTES ==============
 
@@ -1807,7 +2450,7 @@ async def get_jira_issues(user_id: str, username: Optional[str] = None, email: O
     
     try:
         # First, try to get from cache
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with db_pool.connection() as db:
             cursor = await db.execute(
                 "SELECT name, email FROM users WHERE id = ?",
                 (user_id,)
@@ -1964,23 +2607,21 @@ async def manual_add_jira_task(
         if not jira_key or not summary:
             raise HTTPException(status_code=400, detail="Jira key ve summary gerekli")
         
-        async with aiosqlite.connect(DB_PATH) as db:
+        # Create task cache entry
+        cache_id = f"jira-manual-{jira_key}-{user_id}"
+        now = datetime.now(timezone.utc).isoformat()
+        
+        if not jira_url:
+            jira_url = f"https://jira.intertech.com.tr/browse/{jira_key}"
+        
+        async def _insert(db):
             # Check if task already exists
             cursor = await db.execute(
                 "SELECT id FROM jira_tasks_cache WHERE user_id = ? AND jira_key = ?",
-                (user_id, jira_key)
-            )
-            existing = await cursor.fetchone()
-            
-            if existing:
-                raise HTTPException(status_code=400, detail="Bu Jira task zaten mevcut")
-            
-            # Create task cache entry
-            cache_id = f"jira-manual-{jira_key}-{user_id}"
-            now = datetime.now(timezone.utc).isoformat()
-            
-            if not jira_url:
-                jira_url = f"https://jira.intertech.com.tr/browse/{jira_key}"
+                (user_id, jira_key)
+            )
+            if await cursor.fetchone():
+                return False
             
             await db.execute(
                 """INSERT INTO jira_tasks_cache 
@@ -1994,27 +2635,30 @@ async def manual_add_jira_task(
                     jira_url, json.dumps({"manual": True}), now, now
                 )
             )
-            await db.commit()
-            
-            # Audit log
-            await log_audit(
-                user_id, "jira_manual_add", "jira_task", jira_key,
-                f"Manually added Jira task: {jira_key}"
-            )
-            
-            logger.info(f"Manually added Jira task {jira_key} for user {user_id}")
-            
-            return {
-                "success": True,
-                "message": "Jira task eklendi",
-                "task": {
-                    "jira_key": jira_key,
-                    "summary": summary,
-                    "status": status,
-                    "priority": priority,
-                    "jira_url": jira_url
-                }
+            return True
+        
+        if not await db_writer.run(_insert):
+            raise HTTPException(status_code=400, detail="Bu Jira task zaten mevcut")
+        
+        # Audit log
+        await log_audit(
+            user_id, "jira_manual_add", "jira_task", jira_key,
+            f"Manually added Jira task: {jira_key}"
+        )
+        
+        logger.info(f"Manually added Jira task {jira_key} for user {user_id}")
+        
+        return {
+            "success": True,
+            "message": "Jira task eklendi",
+            "task": {
+                "jira_key": jira_key,
+                "summary": summary,
+                "status": status,
+                "priority": priority,
+                "jira_url": jira_url
             }
+        }
     
     except Exception as e:
         logger.error(f"Error manually adding Jira task: {e}")
@@ -2077,39 +2721,49 @@ async def assign_user_role(
     if new_role not in ["admin", "manager", "user"]:
         raise HTTPException(status_code=400, detail="Geçersiz rol")
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async def _update(db):
         # Check target user exists
         cursor = await db.execute("SELECT name FROM users WHERE id = ?", (target_user_id,))
         target_user = await cursor.fetchone()
         
-        if not target_user:
-            raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
-        
-        # Update role
-        await db.execute(
-            "UPDATE users SET role = ? WHERE id = ?",
-            (new_role, target_user_id)
-        )
-        await db.commit()
-        
-        # Audit log
-        await log_audit(
-            admin_user_id, "role_change", "user", target_user_id,
-            f"Role changed to {new_role} for {target_user[0]}",
-            request.client.host if request.client else None
-        )
-        
-        # Notification to target user
-        notif_id = str(uuid.uuid4())
-        await db.execute(
-            "INSERT INTO notifications (id, user_id, title, message, type, is_read, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (notif_id, target_user_id, "Rol Güncellendi", 
-             f"Rolünüz {new_role} olarak güncellendi", "info", 0, 
-             datetime.now(timezone.utc).isoformat())
-        )
-        await db.commit()
-        
-        return {"success": True, "message": f"Rol güncellendi: {new_role}"}
+        if target_user:
+            # Update role
+            await db.execute(
+                "UPDATE users SET role = ? WHERE id = ?",
+                (new_role, target_user_id)
+            )
+        return target_user
+    
+    target_user = await db_writer.run(_update)
+    if not target_user:
+        raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
+    invalidate_device_cache()
+    
+    # Audit log
+    await log_audit(
+        admin_user_id, "role_change", "user", target_user_id,
+        f"Role changed to {new_role} for {target_user[0]}",
+        request.client.host if request.client else None
+    )
+    
+    # Notification to target user (batched insert + SSE, after the role commit)
+    notif_id = uuid.uuid4().hex
+    notif_created_at = datetime.now(timezone.utc).isoformat()
+    notif_message = f"Rolünüz {new_role} olarak güncellendi"
+    notification_batcher.enqueue(
+        (notif_id, target_user_id, "Rol Güncellendi", notif_message, "info", 0, notif_created_at),
+        {
+            "id": notif_id,
+            "user_id": target_user_id,
+            "title": "Rol Güncellendi",
+            "message": notif_message,
+            "type": "info",
+            "is_read": False,
+            "created_at": notif_created_at
+        }
+    )
+    
+    return {"success": True, "message": f"Rol güncellendi: {new_role}"}
 
 # ============== AUDIT LOG ROUTES ==============
 
@@ -2125,9 +2779,9 @@ async def get_audit_logs(
     if user["role"] not in ["admin", "manager"]:
         raise HTTPException(status_code=403, detail="Yetki gerekli")
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         cursor = await db.execute(
-            """SELECT al.id, al.user_id, u.name, al.action, al.resource_type, 
+            """SELECT al.id, al.user_id, u.name AS user_name, al.action, al.resource_type, 
                       al.resource_id, al.details, al.ip_address, al.created_at
                FROM audit_logs al
                LEFT JOIN users u ON al.user_id = u.id
@@ -2143,20 +2797,7 @@ async def get_audit_logs(
         
         return {
             "total": total,
-            "logs": [
-                {
-                    "id": row[0],
-                    "user_id": row[1],
-                    "user_name": row[2],
-                    "action": row[3],
-                    "resource_type": row[4],
-                    "resource_id": row[5],
-                    "details": row[6],
-                    "ip_address": row[7],
-                    "created_at": row[8]
-                }
-                for row in rows
-            ]
+            "logs": [dict(row) for row in rows]
         }
 
 @api_router.delete("/audit-logs")
@@ -2166,18 +2807,23 @@ async def clear_audit_logs(request: Request, admin_user_id: str):
     if user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Sadece admin bu işlemi yapabilir")
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    # Write out queued entries first and delete through the writer so the
+    # DELETE is ordered after every pending batch
+    await audit_batcher.flush()
+    
+    async def _clear(db):
         await db.execute("DELETE FROM audit_logs")
-        await db.commit()
-        
-        # Log this action (new log after clearing)
-        await log_audit(
-            admin_user_id, "clear_logs", "audit_logs", None,
-            "Tüm audit logları temizlendi",
-            request.client.host if request.client else None
-        )
-        
-        return {"success": True, "message": "Audit logları temizlendi"}
+    
+    await db_writer.run(_clear)
+    
+    # Log this action (new log after clearing)
+    await log_audit(
+        admin_user_id, "clear_logs", "audit_logs", None,
+        "Tüm audit logları temizlendi",
+        request.client.host if request.client else None
+    )
+    
+    return {"success": True, "message": "Audit logları temizlendi"}
 
 # ============== REPORT EXPORT ROUTES ==============
 
@@ -2204,14 +2850,16 @@ async def get_detailed_report_stats(
     end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=period_months * 30)
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         # Get user info
         cursor = await db.execute("SELECT name FROM users WHERE id = ?", (user_id,))
         user_row = await cursor.fetchone()
         user_name = user_row[0] if user_row else "Kullanıcı"
         
         # Get all tasks for the period - EXCLUDE BACKLOG
-        cursor = await db.execute(
+        # (streamed in FETCH_CHUNK_SIZE batches; no intermediate list of Row objects)
+        cursor = await execute_chunked(
+            db,
             """SELECT id, title, description, category_id, status, priority, created_at, completed_at 
                FROM tasks 
                WHERE (user_id = ? OR assigned_to = ?) 
@@ -2220,15 +2868,7 @@ async def get_detailed_report_stats(
                ORDER BY created_at DESC""",
             (user_id, user_id, start_date.isoformat())
         )
-        rows = await cursor.fetchall()
-        
-        all_tasks = [
-            {
-                "id": r[0], "title": r[1], "description": r[2], "category_id": r[3],
-                "status": r[4], "priority": r[5], "created_at": r[6], "completed_at": r[7]
-            }
-            for r in rows
-        ]
+        all_tasks = [dict(r) async for r in cursor]
         
         # Calculate statistics (backlog already excluded)
         total_tasks = len(all_tasks)
@@ -2312,6 +2952,18 @@ async def get_detailed_report_stats(
             ]
         }
 
+REPORT_SPOOL_MAX_MEMORY = 1024 * 1024
+REPORT_CHUNK_SIZE = 64 * 1024
+
+def iter_report_chunks(output):
+    """Yield a generated report file in chunks, closing it when done"""
+    try:
+        output.seek(0)
+        while chunk := output.read(REPORT_CHUNK_SIZE):
+            yield chunk
+    finally:
+        output.close()
+
 @api_router.post("/reports/export")
 async def export_report(request_data: ReportExportRequest):
     """Export report in specified format"""
@@ -2330,13 +2982,18 @@ async def export_report(request_data: ReportExportRequest):
         logger.error(f"Invalid format: {format}")
         raise HTTPException(status_code=400, detail="Format must be 'pdf', 'excel', or 'word'")
     
+    # One clock read per request: overdue cutoff and filename share it
+    now_utc = datetime.now(timezone.utc)
+    now_iso = now_utc.isoformat()
+    ts = now_utc.astimezone().strftime('%Y%m%d_%H%M%S')
+    
     try:
         # Gather data
         report_data = {}
         
         logger.info(f"Gathering report data for user {user_id}")
         
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with db_pool.connection() as db:
             # Get user name
             cursor = await db.execute("SELECT name FROM users WHERE id = ?", (user_id,))
             user_row = await cursor.fetchone()
@@ -2344,84 +3001,85 @@ async def export_report(request_data: ReportExportRequest):
             
             # Get stats
             if include_stats:
-                cursor = await db.execute("SELECT COUNT(*) FROM tasks WHERE user_id = ?", (user_id,))
-                total_tasks = (await cursor.fetchone())[0]
-                
-                cursor = await db.execute("SELECT COUNT(*) FROM tasks WHERE user_id = ? AND status = ?", (user_id, TaskStatus.COMPLETED.value))
-                completed_tasks = (await cursor.fetchone())[0]
-                
-                cursor = await db.execute("SELECT COUNT(*) FROM tasks WHERE user_id = ? AND status = ?", (user_id, TaskStatus.IN_PROGRESS.value))
-                in_progress_tasks = (await cursor.fetchone())[0]
-                
-                cursor = await db.execute("SELECT COUNT(*) FROM tasks WHERE user_id = ? AND status IN (?, ?)", (user_id, TaskStatus.BACKLOG.value, TaskStatus.TODAY_PLANNED.value))
-                todo_tasks = (await cursor.fetchone())[0]
-                
-                now = datetime.now(timezone.utc).isoformat()
-                cursor = await db.execute(
-                    "SELECT COUNT(*) FROM tasks WHERE user_id = ? AND due_date < ? AND due_date IS NOT NULL AND status != ?",
-                    (user_id, now, TaskStatus.COMPLETED.value)
-                )
-                overdue_tasks = (await cursor.fetchone())[0]
+                stats = _report_stats_cache.get(user_id)
+                if stats is None:
+                    # All counts from one scan of the user's tasks
+                    rows = await db.execute_fetchall(
+                        """SELECT COALESCE(SUM(status = ?), 0),
+                                  COALESCE(SUM(status = ?), 0),
+                                  COALESCE(SUM(status IN (?, ?)), 0),
+                                  COALESCE(SUM(due_date IS NOT NULL AND due_date < ? AND status != ?), 0),
+                                  COUNT(*)
+                           FROM tasks WHERE user_id = ?""",
+                        (TaskStatus.COMPLETED.value, TaskStatus.IN_PROGRESS.value,
+                         TaskStatus.BACKLOG.value, TaskStatus.TODAY_PLANNED.value,
+                         now_iso, TaskStatus.COMPLETED.value, user_id)
+                    )
+                    completed_tasks, in_progress_tasks, todo_tasks, overdue_tasks, total_tasks = rows[0]
                 
-                report_data['stats'] = {
-                    'total_tasks': total_tasks,
-                    'completed_tasks': completed_tasks,
-                    'in_progress_tasks': in_progress_tasks,
-                    'todo_tasks': todo_tasks,
-                    'overdue_tasks': overdue_tasks,
-                    'completion_rate': round((completed_tasks / total_tasks * 100) if total_tasks > 0 else 0, 1)
-                }
+                    stats = {
+                        'total_tasks': total_tasks,
+                        'completed_tasks': completed_tasks,
+                        'in_progress_tasks': in_progress_tasks,
+                        'todo_tasks': todo_tasks,
+                        'overdue_tasks': overdue_tasks,
+                        'completion_rate': round((completed_tasks / total_tasks * 100) if total_tasks > 0 else 0, 1)
+                    }
+                    _report_stats_cache[user_id] = stats
+                report_data['stats'] = stats
                 
                 logger.info(f"Stats gathered: {report_data['stats']}")
             
             # Get tasks
-            if include_tasks:
-                cursor = await db.execute(
+            if include_tasks and include_stats and report_data['stats']['total_tasks'] == 0:
+                # Stats already say the user has no tasks - nothing to fetch
+                report_data['tasks'] = []
+            elif include_tasks:
+                # Exporters walk the task list several times (stats, charts,
+                # tables), so it is built once straight off the cursor
+                cursor = await execute_chunked(
+                    db,
                     "SELECT id, title, description, category_id, status, priority, created_at, completed_at FROM tasks WHERE user_id = ? ORDER BY created_at DESC",
                     (user_id,)
                 )
-                rows = await cursor.fetchall()
-                
-                report_data['tasks'] = [
-                    {
-                        'id': row[0],
-                        'title': row[1],
-                        'description': row[2],
-                        'category_id': row[3],
-                        'status': row[4],
-                        'priority': row[5],
-                        'created_at': row[6],
-                        'completed_at': row[7]
-                    }
-                    for row in rows
-                ]
+                report_data['tasks'] = [dict(row) async for row in cursor]
                 
                 logger.info(f"Tasks gathered: {len(report_data['tasks'])} tasks")
         
         # Generate report
         logger.info(f"Generating {format} report...")
         
-        if format == 'pdf':
-            content = report_exporter.generate_pdf_report(report_data)
-            media_type = "application/pdf"
-            filename = f"qa_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        elif format == 'excel':
-            content = report_exporter.generate_excel_report(report_data)
-            media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            filename = f"qa_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        elif format == 'word':
-            content = report_exporter.generate_word_report(report_data)
-            media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            filename = f"qa_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.docx"
-        
-        logger.info(f"Report generated successfully: {len(content)} bytes")
+        # Exporters write into a spooled file: small reports stay in memory,
+        # large ones spill to disk, and the body is streamed back in chunks.
+        # Rendering is synchronous CPU work, so it runs in a worker thread.
+        output = tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_MAX_MEMORY)
+        try:
+            if format == 'pdf':
+                await asyncio.to_thread(report_exporter.generate_pdf_report, report_data, output)
+                media_type = "application/pdf"
+                filename = f"qa_report_{ts}.pdf"
+            elif format == 'excel':
+                await asyncio.to_thread(report_exporter.generate_excel_report, report_data, output)
+                media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                filename = f"qa_report_{ts}.xlsx"
+            elif format == 'word':
+                await asyncio.to_thread(report_exporter.generate_word_report, report_data, output)
+                media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+                filename = f"qa_report_{ts}.docx"
+        except Exception:
+            output.close()
+            raise
+        
+        size = output.tell()
+        logger.info(f"Report generated successfully: {size} bytes")
         
         # Return file
         return StreamingResponse(
-            io.BytesIO(content),
+            iter_report_chunks(output),
             media_type=media_type,
             headers={
                 "Content-Disposition": f"attachment; filename={filename}",
+                "Content-Length": str(size),
                 "Access-Control-Expose-Headers": "Content-Disposition"
             }
         )
@@ -2434,7 +3092,7 @@ async def export_report(request_data: ReportExportRequest):
 async def debug_user_info(user_id: Optional[str] = None, device_id: Optional[str] = None, name: Optional[str] = None):
     """Debug endpoint to check user data including role"""
     try:
-        async with aiosqlite.connect(DB_PATH) as db:
+        async with db_pool.connection() as db:
             if user_id:
                 cursor = await db.execute(
                     "SELECT id, name, email, device_id, role, created_at FROM users WHERE id = ?",
@@ -2456,18 +3114,8 @@ async def debug_user_info(user_id: Optional[str] = None, device_id: Optional[str
                     "SELECT id, name, email, device_id, role, created_at FROM users"
                 )
             
-            rows = await cursor.fetchall()
-            
-            users_data = []
-            for row in rows:
-                users_data.append({
-                    "id": row[0],
-                    "name": row[1],
-                    "email": row[2],
-                    "device_id": row[3],
-                    "role": row[4],
-                    "created_at": row[5]
-                })
+            # Pool connections use aiosqlite.Row; column names match the output keys
+            users_data = [dict(row) for row in await cursor.fetchall()]
             
             return {
                 "success": True,
@@ -2499,53 +3147,58 @@ async def jiragen_validate(request: Request):
     
     async def generate():
         try:
-            yield f"data: {json.dumps({'log': '🔍 JSON verisi analiz ediliyor...'})}\n\n"
+            yield sse({'log': '🔍 JSON verisi analiz ediliyor...'})
             
             try:
-                tests_raw = json.loads(json_data)
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                tests_raw = orjson.loads(json_data)
                 if not isinstance(tests_raw, list):
                     tests_raw = [tests_raw]
             except json.JSONDecodeError as e:
-                yield f"data: {json.dumps({'error': f'JSON parse hatası: {str(e)}'})}\n\n"
+                yield sse({'error': f'JSON parse hatası: {str(e)}'})
                 return
             
-            yield f"data: {json.dumps({'log': f'📊 {len(tests_raw)} test bulundu'})}\n\n"
+            yield sse({'log': f'📊 {len(tests_raw)} test bulundu'})
             
             validated_tests = []
             valid_count = 0
             invalid_count = 0
             
+            total_tests = len(tests_raw)
             for idx, test in enumerate(tests_raw, 1):
-                yield f"data: {json.dumps({'log': f'🔄 Test {idx} doğrulanıyor...'})}\n\n"
-                
                 errors = []
+                # Walk testScript -> stepByStepScript -> steps once for validation and extraction
+                raw_steps = ((test.get("testScript") or {}).get("stepByStepScript") or {}).get("steps") or []
                 
                 # Validate required fields
                 if not test.get("name"):
                     errors.append("Test adı eksik")
                 if not test.get("objective"):
                     errors.append("Objective eksik")
-                if not test.get("testScript") or not test.get("testScript", {}).get("stepByStepScript", {}).get("steps"):
+                if not raw_steps:
                     errors.append("Test steps eksik")
                 
                 # Extract steps
-                steps = []
-                raw_steps = test.get("testScript", {}).get("stepByStepScript", {}).get("steps", [])
-                for step in raw_steps:
-                    steps.append({
+                steps = [
+                    {
                         "index": step.get("index", 0),
                         "description": step.get("description", ""),
                         "testData": step.get("testData", ""),
                         "expectedResult": step.get("expectedResult", ""),
-                    })
+                    }
+                    for step in raw_steps
+                ]
                 
                 is_valid = len(errors) == 0
                 if is_valid:
                     valid_count += 1
-                    yield f"data: {json.dumps({'log': f'  ✅ Test {idx}: Geçerli'})}\n\n"
                 else:
                     invalid_count += 1
-                    yield f"data: {json.dumps({'log': f'  ❌ Test {idx}: {len(errors)} hata'})}\n\n"
+                
+                # One aggregated progress line per 50 tests; per-test details are in the result
+                if idx % 50 == 0 or idx == total_tests:
+                    progress = f'🔄 {idx}/{total_tests} doğrulandı ({valid_count} geçerli)'
+                    yield sse({'log': progress})
                 
                 validated_tests.append({
                     "index": idx,
@@ -2561,7 +3214,7 @@ async def jiragen_validate(request: Request):
             
             newline = "\n"
             log_msg = f'{newline}✅ Doğrulama tamamlandı: {valid_count} geçerli, {invalid_count} hatalı'
-            yield f"data: {json.dumps({'log': log_msg})}\n\n"
+            yield sse({'log': log_msg})
             
             result = {
                 "tests": validated_tests,
@@ -2572,13 +3225,13 @@ async def jiragen_validate(request: Request):
                 }
             }
             
-            yield f"data: {json.dumps({'complete': True, 'result': result})}\n\n"
+            yield sse({'complete': True, 'result': result})
             
         except Exception as e:
             logger.error(f"JiraGen validate error: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield sse({'error': str(e)})
     
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 @api_router.post("/jira-tools/jiragen/create")
 async def jiragen_create(request: Request):
@@ -2591,17 +3244,17 @@ async def jiragen_create(request: Request):
     
     async def generate():
         try:
-            yield f"data: {json.dumps({'log': '🚀 Jira test oluşturuluyor...'})}\n\n"
+            yield sse({'log': '🚀 Jira test oluşturuluyor...'})
             
             # Check if Jira is available
             if not JIRA_AVAILABLE:
-                yield f"data: {json.dumps({'log': '⚠️ VPN bağlantısı gerekli - DEMO modu'})}\n\n"
+                yield sse({'log': '⚠️ VPN bağlantısı gerekli - DEMO modu'})
                 
                 # Demo mode - return mock result
                 mock_key = f"TEST-{uuid.uuid4().hex[:6].upper()}"
-                yield f"data: {json.dumps({'log': f'✅ Demo: Test oluşturuldu - {mock_key}'})}\n\n"
+                yield sse({'log': f'✅ Demo: Test oluşturuldu - {mock_key}'})
                 
-                yield f"data: {json.dumps({'complete': True, 'result': {'success': True, 'key': mock_key, 'id': mock_key, 'name': test_data.get('name', 'Test')}})}\n\n"
+                yield sse({'complete': True, 'result': {'success': True, 'key': mock_key, 'id': mock_key, 'name': test_data.get('name', 'Test')}})
                 return
             
             # Real Jira creation would go here
@@ -2609,18 +3262,23 @@ async def jiragen_create(request: Request):
                 result = await jira_client.create_test(test_data, is_ui_test)
                 jira_key = result.get('key')
                 log_created = f'✅ Test oluşturuldu: {jira_key}'
-                yield f"data: {json.dumps({'log': log_created})}\n\n"
-                yield f"data: {json.dumps({'complete': True, 'result': {'success': True, 'key': jira_key, 'id': result.get('id'), 'name': test_data.get('name')}})}\n\n"
+                yield sse({'log': log_created})
+                yield sse({'complete': True, 'result': {'success': True, 'key': jira_key, 'id': result.get('id'), 'name': test_data.get('name')}})
             except Exception as e:
                 err_msg = f'❌ Hata: {str(e)}'
-                yield f"data: {json.dumps({'log': err_msg})}\n\n"
-                yield f"data: {json.dumps({'complete': True, 'result': {'success': False, 'error': str(e)}})}\n\n"
+                yield sse({'log': err_msg})
+                yield sse({'complete': True, 'result': {'success': False, 'error': str(e)}})
             
         except Exception as e:
             logger.error(f"JiraGen create error: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield sse({'error': str(e)})
     
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+# Max concurrent base-result fetches during bugbagla analyze
+BUGBAGLA_FETCH_CONCURRENCY = 16
+# Max concurrent bug-link calls during bugbagla bind
+BUGBAGLA_LINK_CONCURRENCY = 8
 
 @api_router.post("/jira-tools/bugbagla/analyze")
 async def bugbagla_analyze(request: Request):
@@ -2634,16 +3292,16 @@ async def bugbagla_analyze(request: Request):
     
     async def generate():
         try:
-            yield f"data: {json.dumps({'log': '🔍 Bug Bağlama Analizi Başlıyor'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   • Mevcut Cycle: {current_cycle_key}'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   • Base Cycle: {base_cycle_key}'})}\n\n"
+            yield sse({'log': '🔍 Bug Bağlama Analizi Başlıyor'})
+            yield sse({'log': f'   • Mevcut Cycle: {current_cycle_key}'})
+            yield sse({'log': f'   • Base Cycle: {base_cycle_key}'})
             
             status_names = [jira_api_client.get_status_name(sid) for sid in status_ids]
             status_names_str = ", ".join(status_names)
-            yield f"data: {json.dumps({'log': f'   • Seçilen Statusler: {status_names_str}'})}\n\n"
+            yield sse({'log': f'   • Seçilen Statusler: {status_names_str}'})
             
             if not JIRA_API_AVAILABLE:
-                yield f"data: {json.dumps({'log': '⚠️ VPN bağlantısı gerekli - DEMO modu'})}\n\n"
+                yield sse({'log': '⚠️ VPN bağlantısı gerekli - DEMO modu'})
                 
                 # Demo data
                 mock_will_bind = [
@@ -2655,10 +3313,10 @@ async def bugbagla_analyze(request: Request):
                     {"testKey": "TEST-004", "testName": "Profile Update", "status": 219, "reason": "Base cycle'da test bulunamadı"},
                 ]
                 
-                yield f"data: {json.dumps({'log': '📊 Analiz Tamamlandı! (Demo)'})}\n\n"
-                yield f"data: {json.dumps({'log': '   • Toplam: 10'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   • Bağlanacak: {len(mock_will_bind)}'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   • Atlanacak: {len(mock_will_skip)}'})}\n\n"
+                yield sse({'log': '📊 Analiz Tamamlandı! (Demo)'})
+                yield sse({'log': '   • Toplam: 10'})
+                yield sse({'log': f'   • Bağlanacak: {len(mock_will_bind)}'})
+                yield sse({'log': f'   • Atlanacak: {len(mock_will_skip)}'})
                 
                 result = {
                     "success": True,
@@ -2672,68 +3330,72 @@ async def bugbagla_analyze(request: Request):
                         "toSkip": len(mock_will_skip)
                     }
                 }
-                yield f"data: {json.dumps({'complete': True, 'result': result})}\n\n"
+                yield sse({'complete': True, 'result': result})
                 return
             
             # Real implementation using jira_api_client
             try:
                 status_set = set(status_ids)
                 
-                # Get current cycle
-                yield f"data: {json.dumps({'log': '📋 Mevcut cycle bilgileri alınıyor...'})}\n\n"
-                current_run = await jira_api_client.get_test_run(current_cycle_key)
+                # Current and base cycles are independent - fetch them together
+                yield sse({'log': '📋 Mevcut cycle bilgileri alınıyor...'})
+                yield sse({'log': f'📋 Base cycle bilgileri alınıyor: {base_cycle_key}'})
+                current_run, base_run = await asyncio.gather(
+                    jira_api_client.get_test_run(current_cycle_key),
+                    jira_api_client.get_test_run(base_cycle_key)
+                )
                 current_run_id = current_run.get("id")
+                base_run_id = base_run.get("id")
                 
                 if not current_run_id:
-                    yield f"data: {json.dumps({'error': f'Mevcut cycle ID alınamadı: {current_cycle_key}'})}\n\n"
+                    yield sse({'error': f'Mevcut cycle ID alınamadı: {current_cycle_key}'})
                     return
                 
-                yield f"data: {json.dumps({'log': f'✅ Mevcut Cycle ID: {current_run_id}'})}\n\n"
-                
-                # Get current items
-                yield f"data: {json.dumps({'log': '📥 Mevcut cycle items alınıyor...'})}\n\n"
-                current_items = await jira_api_client.get_test_run_items(current_run_id)
-                yield f"data: {json.dumps({'log': f'✅ {len(current_items)} test bulundu'})}\n\n"
-                
-                # Build case map from base cycle
-                yield f"data: {json.dumps({'log': f'📋 Base cycle bilgileri alınıyor: {base_cycle_key}'})}\n\n"
-                base_run = await jira_api_client.get_test_run(base_cycle_key)
-                base_run_id = base_run.get("id")
+                yield sse({'log': f'✅ Mevcut Cycle ID: {current_run_id}'})
                 
                 if not base_run_id:
-                    yield f"data: {json.dumps({'error': f'Base cycle ID alınamadı: {base_cycle_key}'})}\n\n"
+                    yield sse({'error': f'Base cycle ID alınamadı: {base_cycle_key}'})
                     return
                 
-                yield f"data: {json.dumps({'log': f'✅ Base cycle ID: {base_run_id}'})}\n\n"
+                yield sse({'log': f'✅ Base cycle ID: {base_run_id}'})
                 
-                yield f"data: {json.dumps({'log': '📥 Base cycle items alınıyor...'})}\n\n"
-                base_items = await jira_api_client.get_test_run_items(base_run_id)
-                yield f"data: {json.dumps({'log': f'✅ {len(base_items)} test bulundu'})}\n\n"
+                # Get current and base items
+                yield sse({'log': '📥 Mevcut ve base cycle items alınıyor...'})
+                current_items, base_items = await asyncio.gather(
+                    jira_api_client.get_test_run_items(current_run_id),
+                    jira_api_client.get_test_run_items(base_run_id)
+                )
+                yield sse({'log': f'✅ Mevcut cycle: {len(current_items)} test bulundu'})
+                yield sse({'log': f'✅ Base cycle: {len(base_items)} test bulundu'})
                 
-                # Build case map
-                case_map = {}
-                for item in base_items:
-                    lr = item.get("$lastTestResult", {})
-                    key = lr.get("testCase", {}).get("key")
-                    item_id = item.get("id")
-                    if key and item_id:
-                        case_map[key] = item_id
+                # Build case map: test key -> base item id
+                case_map = {
+                    key: item_id
+                    for item in base_items
+                    if (lr := item.get("$lastTestResult"))
+                    and (tc := lr.get("testCase"))
+                    and (key := tc.get("key"))
+                    and (item_id := item.get("id"))
+                }
                 
-                yield f"data: {json.dumps({'log': f'✅ {len(case_map)} test için mapping oluşturuldu'})}\n\n"
+                yield sse({'log': f'✅ {len(case_map)} test için mapping oluşturuldu'})
                 
                 # Filter and analyze
-                yield f"data: {json.dumps({'log': '🔄 Testler analiz ediliyor...'})}\n\n"
+                yield sse({'log': '🔄 Testler analiz ediliyor...'})
                 
                 will_bind = []
                 will_skip = []
+                candidates = []  # (test info, base item id) awaiting base results
+                pending = []  # (test info, issue ids) awaiting bug key lookup
                 
                 for item in current_items:
-                    lr = item.get("$lastTestResult", {})
+                    lr = item.get("$lastTestResult")
                     if not lr:
                         continue
                     
-                    test_key = lr.get("testCase", {}).get("key")
-                    test_name = lr.get("testCase", {}).get("name", "")
+                    tc = lr.get("testCase") or {}
+                    test_key = tc.get("key")
+                    test_name = tc.get("name", "")
                     test_result_id = lr.get("id")
                     status = lr.get("testResultStatusId")
                     
@@ -2761,49 +3423,69 @@ async def bugbagla_analyze(request: Request):
                         })
                         continue
                     
-                    # Get bugs from base
-                    try:
-                        base_results = await jira_api_client.get_test_results_by_item_id(base_run_id, base_item_id)
-                        first_result = base_results[0] if base_results else {}
-                        trace_links = first_result.get("traceLinks", [])
-                        issue_ids = [t.get("issueId") for t in trace_links if t.get("issueId")]
-                        
-                        if not issue_ids:
-                            will_skip.append({
-                                "testKey": test_key,
-                                "testName": test_name,
-                                "status": status,
-                                "reason": "Base cycle'da bağlı bug yok"
-                            })
-                            continue
-                        
-                        # Get bug keys
-                        bug_keys = []
-                        for issue_id in issue_ids:
-                            bug_key = await jira_api_client.get_issue_key(issue_id)
-                            bug_keys.append(bug_key)
-                        
-                        will_bind.append({
-                            "testKey": test_key,
-                            "testName": test_name,
-                            "status": status,
-                            "testResultId": test_result_id,
-                            "bugIds": issue_ids,
-                            "bugKeys": bug_keys
+                    candidates.append(({
+                        "testKey": test_key,
+                        "testName": test_name,
+                        "status": status,
+                        "testResultId": test_result_id
+                    }, base_item_id))
+                
+                # Get bugs from base - independent calls, run them concurrently (bounded)
+                sem = asyncio.Semaphore(BUGBAGLA_FETCH_CONCURRENCY)
+                
+                async def fetch_base_results(base_item_id):
+                    async with sem:
+                        return await jira_api_client.get_test_results_by_item_id(base_run_id, base_item_id)
+                
+                if candidates:
+                    yield sse({'log': f'📥 {len(candidates)} test için base sonuçları alınıyor...'})
+                results = await asyncio.gather(
+                    *(fetch_base_results(base_item_id) for _, base_item_id in candidates),
+                    return_exceptions=True
+                )
+                
+                for (info, _), base_results in zip(candidates, results):
+                    if isinstance(base_results, Exception):
+                        will_skip.append({
+                            "testKey": info["testKey"],
+                            "testName": info["testName"],
+                            "status": info["status"],
+                            "reason": f"Analiz hatası: {str(base_results)}"
                         })
-                        
-                    except Exception as e:
+                        continue
+                    
+                    first_result = base_results[0] if base_results else {}
+                    trace_links = first_result.get("traceLinks", [])
+                    issue_ids = [t.get("issueId") for t in trace_links if t.get("issueId")]
+                    
+                    if not issue_ids:
                         will_skip.append({
-                            "testKey": test_key,
-                            "testName": test_name,
-                            "status": status,
-                            "reason": f"Analiz hatası: {str(e)}"
+                            "testKey": info["testKey"],
+                            "testName": info["testName"],
+                            "status": info["status"],
+                            "reason": "Base cycle'da bağlı bug yok"
                         })
+                        continue
+                    
+                    pending.append((info, issue_ids))
                 
-                yield f"data: {json.dumps({'log': '📊 Analiz Tamamlandı!'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   • Toplam: {len(current_items)}'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   • Bağlanacak: {len(will_bind)}'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   • Atlanacak: {len(will_skip)}'})}\n\n"
+                # Resolve all bug keys in one batched lookup instead of one call per bug
+                needed_ids = {issue_id for _, issue_ids in pending for issue_id in issue_ids}
+                try:
+                    id_to_key = await jira_api_client.get_issue_keys_bulk(list(needed_ids)) if needed_ids else {}
+                except Exception as e:
+                    logger.warning(f"BugBagla bug key lookup failed: {e}")
+                    id_to_key = {}
+                
+                for info, issue_ids in pending:
+                    info["bugIds"] = issue_ids
+                    info["bugKeys"] = [id_to_key.get(str(issue_id), issue_id) for issue_id in issue_ids]
+                    will_bind.append(info)
+                
+                yield sse({'log': '📊 Analiz Tamamlandı!'})
+                yield sse({'log': f'   • Toplam: {len(current_items)}'})
+                yield sse({'log': f'   • Bağlanacak: {len(will_bind)}'})
+                yield sse({'log': f'   • Atlanacak: {len(will_skip)}'})
                 
                 result = {
                     "success": True,
@@ -2818,16 +3500,16 @@ async def bugbagla_analyze(request: Request):
                         "toSkip": len(will_skip)
                     }
                 }
-                yield f"data: {json.dumps({'complete': True, 'result': result})}\n\n"
+                yield sse({'complete': True, 'result': result})
                 
             except Exception as e:
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+                yield sse({'error': str(e)})
             
         except Exception as e:
             logger.error(f"BugBagla analyze error: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield sse({'error': str(e)})
     
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 @api_router.post("/jira-tools/bugbagla/bind")
 async def bugbagla_bind(request: Request):
@@ -2839,19 +3521,20 @@ async def bugbagla_bind(request: Request):
     
     async def generate():
         try:
-            yield f"data: {json.dumps({'log': '🔗 Buglar bağlanıyor...'})}\n\n"
+            yield sse({'log': '🔗 Buglar bağlanıyor...'})
             
             if not JIRA_API_AVAILABLE:
-                yield f"data: {json.dumps({'log': '⚠️ VPN bağlantısı gerekli - DEMO modu'})}\n\n"
+                yield sse({'log': '⚠️ VPN bağlantısı gerekli - DEMO modu'})
                 
                 for binding in bindings:
                     test_key = binding.get("testKey", "")
-                    yield f"data: {json.dumps({'log': f'✅ {test_key} - Bug bağlandı (Demo)'})}\n\n"
-                    await asyncio.sleep(0.2)
+                    yield sse({'log': f'✅ {test_key} - Bug bağlandı (Demo)'})
+                    if DEMO_SIMULATE_LATENCY:
+                        await asyncio.sleep(0.2)
                 
-                yield f"data: {json.dumps({'log': '✨ Bağlama Tamamlandı! (Demo)'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   • Başarılı: {len(bindings)}'})}\n\n"
-                yield f"data: {json.dumps({'success': True, 'linked': len(bindings), 'failed': 0})}\n\n"
+                yield sse({'log': '✨ Bağlama Tamamlandı! (Demo)'})
+                yield sse({'log': f'   • Başarılı: {len(bindings)}'})
+                yield sse({'success': True, 'linked': len(bindings), 'failed': 0})
                 return
             
             # Real implementation
@@ -2861,70 +3544,82 @@ async def bugbagla_bind(request: Request):
                 cycle_id = None
                 
                 for binding in bindings:
-                    if not cycle_id and binding.get("cycleId"):
+                    if binding.get("cycleId"):
                         cycle_id = binding["cycleId"]
-                    
-                    for bug_id in binding.get("bugIds", []):
+                        break
+                
+                # Link calls are independent - run them concurrently (bounded)
+                sem = asyncio.Semaphore(BUGBAGLA_LINK_CONCURRENCY)
+                
+                async def link_one(binding, bug_id):
+                    async with sem:
                         try:
                             await jira_api_client.link_bug_to_test_result(binding["testResultId"], bug_id, 3)
-                            test_key = binding.get("testKey", "")
-                            yield f"data: {json.dumps({'log': f'✅ {test_key} - Bug bağlandı (ID: {bug_id})'})}\n\n"
-                            linked_count += 1
+                            return None
                         except Exception as e:
-                            test_key = binding.get("testKey", "")
-                            err_msg = str(e)
-                            yield f"data: {json.dumps({'log': f'❌ {test_key} - Bug bağlanırken hata: {err_msg}'})}\n\n"
-                            failed_count += 1
+                            return e
+                
+                pairs = [(binding, bug_id) for binding in bindings for bug_id in binding.get("bugIds", [])]
+                results = await asyncio.gather(*(link_one(binding, bug_id) for binding, bug_id in pairs))
+                
+                for (binding, bug_id), error in zip(pairs, results):
+                    test_key = binding.get("testKey", "")
+                    if error is None:
+                        yield sse({'log': f'✅ {test_key} - Bug bağlandı (ID: {bug_id})'})
+                        linked_count += 1
+                    else:
+                        yield sse({'log': f'❌ {test_key} - Bug bağlanırken hata: {str(error)}'})
+                        failed_count += 1
                 
                 # Refresh cache
                 if cycle_id:
-                    yield f"data: {json.dumps({'log': '🔄 Cache yenileniyor...'})}\n\n"
+                    yield sse({'log': '🔄 Cache yenileniyor...'})
                     await jira_api_client.refresh_issue_count_cache(cycle_id)
-                    yield f"data: {json.dumps({'log': '✅ Cache yenilendi'})}\n\n"
+                    yield sse({'log': '✅ Cache yenilendi'})
                 
-                yield f"data: {json.dumps({'log': '✨ Bağlama Tamamlandı!'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   • Başarılı: {linked_count}'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   • Hatalı: {failed_count}'})}\n\n"
+                yield sse({'log': '✨ Bağlama Tamamlandı!'})
+                yield sse({'log': f'   • Başarılı: {linked_count}'})
+                yield sse({'log': f'   • Hatalı: {failed_count}'})
                 
-                yield f"data: {json.dumps({'success': True, 'linked': linked_count, 'failed': failed_count})}\n\n"
+                yield sse({'success': True, 'linked': linked_count, 'failed': failed_count})
                 
             except Exception as e:
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+                yield sse({'error': str(e)})
             
         except Exception as e:
             logger.error(f"BugBagla bind error: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield sse({'error': str(e)})
     
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 # ============== CYCLES & PROJECTS API ==============
 
-# JSON dosya yolları
-CYCLES_FILE = os.path.join(os.path.dirname(__file__), "data", "cycles.json")
-PROJECTS_FILE = os.path.join(os.path.dirname(__file__), "data", "projects.json")
+# QA projects list cache: rebuilt on the first read after a write.
+# generation guards against a read that raced a write storing stale rows.
+_qa_projects_cache = {"generation": 0, "projects": None}
 
-def ensure_data_files():
-    """Data klasörü ve dosyalarını oluştur"""
-    data_dir = os.path.join(os.path.dirname(__file__), "data")
-    os.makedirs(data_dir, exist_ok=True)
-    
-    if not os.path.exists(CYCLES_FILE):
-        with open(CYCLES_FILE, "w") as f:
-            json.dump({"cycles": []}, f)
-    
-    if not os.path.exists(PROJECTS_FILE):
-        with open(PROJECTS_FILE, "w") as f:
-            json.dump({"projects": []}, f)
+def invalidate_qa_projects():
+    _qa_projects_cache["generation"] += 1
+    _qa_projects_cache["projects"] = None
 
-ensure_data_files()
+def qa_project_from_row(row) -> dict:
+    """qa_projects row -> API shape"""
+    return {
+        "name": row["name"],
+        "icon": row["icon"],
+        "links": orjson.loads(row["links"]),
+        "teamRemoteId": row["team_remote_id"],
+        "isMobile": bool(row["is_mobile"]),
+        "platform": row["platform"]
+    }
 
 @api_router.get("/cycles")
 async def get_cycles():
     """Get all cycles"""
     try:
-        with open(CYCLES_FILE, "r") as f:
-            data = json.load(f)
-        return data
+        async with db_pool.connection() as db:
+            cursor = await db.execute("SELECT key, name FROM cycles ORDER BY rowid")
+            return {"cycles": [dict(row) for row in await cursor.fetchall()]}
     except Exception as e:
         logger.error(f"Cycles okuma hatası: {e}")
         return {"cycles": []}
@@ -2940,16 +3635,13 @@ async def add_cycle(request: Request):
         if not key or not name:
             raise HTTPException(status_code=400, detail="key ve name gerekli!")
         
-        with open(CYCLES_FILE, "r") as f:
-            data = json.load(f)
-        
-        if any(c["key"] == key for c in data["cycles"]):
-            raise HTTPException(status_code=400, detail="Bu cycle key zaten mevcut!")
-        
-        data["cycles"].append({"key": key, "name": name})
+        async def _insert(db):
+            try:
+                await db.execute("INSERT INTO cycles (key, name) VALUES (?, ?)", (key, name))
+            except sqlite3.IntegrityError:
+                raise HTTPException(status_code=400, detail="Bu cycle key zaten mevcut!")
         
-        with open(CYCLES_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        await db_writer.run(_insert)
         
         return {"success": True, "cycle": {"key": key, "name": name}}
     except HTTPException:
@@ -2969,17 +3661,18 @@ async def update_cycle(key: str, request: Request):
         if not new_key or not name:
             raise HTTPException(status_code=400, detail="key ve name gerekli!")
         
-        with open(CYCLES_FILE, "r") as f:
-            data = json.load(f)
-        
-        index = next((i for i, c in enumerate(data["cycles"]) if c["key"] == key), None)
-        if index is None:
-            raise HTTPException(status_code=404, detail="Cycle bulunamadı!")
-        
-        data["cycles"][index] = {"key": new_key, "name": name}
+        async def _update(db):
+            try:
+                cursor = await db.execute(
+                    "UPDATE cycles SET key = ?, name = ? WHERE key = ?",
+                    (new_key, name, key)
+                )
+            except sqlite3.IntegrityError:
+                raise HTTPException(status_code=400, detail="Bu cycle key zaten mevcut!")
+            if cursor.rowcount == 0:
+                raise HTTPException(status_code=404, detail="Cycle bulunamadı!")
         
-        with open(CYCLES_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        await db_writer.run(_update)
         
         return {"success": True, "cycle": {"key": new_key, "name": name}}
     except HTTPException:
@@ -2992,13 +3685,10 @@ async def update_cycle(key: str, request: Request):
 async def delete_cycle(key: str):
     """Delete a cycle"""
     try:
-        with open(CYCLES_FILE, "r") as f:
-            data = json.load(f)
-        
-        data["cycles"] = [c for c in data["cycles"] if c["key"] != key]
+        async def _delete(db):
+            await db.execute("DELETE FROM cycles WHERE key = ?", (key,))
         
-        with open(CYCLES_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        await db_writer.run(_delete)
         
         return {"success": True}
     except Exception as e:
@@ -3009,24 +3699,41 @@ async def delete_cycle(key: str):
 async def get_qa_projects():
     """Get all QA projects for tools"""
     try:
-        with open(PROJECTS_FILE, "r") as f:
-            data = json.load(f)
-        return data
+        projects = _qa_projects_cache["projects"]
+        if projects is None:
+            generation = _qa_projects_cache["generation"]
+            async with db_pool.connection() as db:
+                cursor = await db.execute(
+                    "SELECT name, icon, links, team_remote_id, is_mobile, platform FROM qa_projects ORDER BY id"
+                )
+                projects = [qa_project_from_row(row) for row in await cursor.fetchall()]
+            if generation == _qa_projects_cache["generation"]:
+                _qa_projects_cache["projects"] = projects
+        return {"projects": projects}
     except Exception as e:
         logger.error(f"Projeler okuma hatası: {e}")
         return {"projects": []}
 
+class QaProjectIn(BaseModel):
+    """QA project create/update body. Required-field checks stay in the
+    handlers so they keep returning 400 with the Turkish messages."""
+    name: Optional[str] = None
+    icon: Optional[str] = None
+    links: Optional[dict] = Field(default_factory=dict)
+    teamRemoteId: Optional[str] = ""
+    isMobile: Optional[bool] = False
+    platform: Optional[str] = None  # "ios" | "android" | None
+
 @api_router.post("/qa-projects")
-async def add_qa_project(request: Request):
+async def add_qa_project(body: QaProjectIn):
     """Add a new QA project"""
     try:
-        body = await request.json()
-        name = body.get("name")
-        icon = body.get("icon", "📦")
-        links = body.get("links", {})
-        team_remote_id = body.get("teamRemoteId", "")
-        is_mobile = body.get("isMobile", False)
-        platform = body.get("platform")  # "ios" | "android" | None
+        name = body.name
+        icon = body.icon if body.icon is not None else "📦"
+        links = body.links
+        team_remote_id = body.teamRemoteId
+        is_mobile = body.isMobile
+        platform = body.platform
         
         if not name:
             raise HTTPException(status_code=400, detail="name gerekli!")
@@ -3035,12 +3742,6 @@ async def add_qa_project(request: Request):
         if is_mobile and platform not in ["ios", "android"]:
             raise HTTPException(status_code=400, detail="Mobil projeler için platform (ios/android) seçilmelidir!")
         
-        with open(PROJECTS_FILE, "r") as f:
-            data = json.load(f)
-        
-        if any(p["name"] == name for p in data["projects"]):
-            raise HTTPException(status_code=400, detail="Bu proje adı zaten mevcut!")
-        
         new_project = {
             "name": name,
             "icon": icon,
@@ -3049,10 +3750,18 @@ async def add_qa_project(request: Request):
             "isMobile": is_mobile,
             "platform": platform if is_mobile else None
         }
-        data["projects"].append(new_project)
         
-        with open(PROJECTS_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        async def _insert(db):
+            try:
+                await db.execute(
+                    "INSERT INTO qa_projects (name, icon, links, team_remote_id, is_mobile, platform) VALUES (?, ?, ?, ?, ?, ?)",
+                    (name, icon, orjson.dumps(links).decode(), team_remote_id, int(bool(is_mobile)), new_project["platform"])
+                )
+            except sqlite3.IntegrityError:
+                raise HTTPException(status_code=400, detail="Bu proje adı zaten mevcut!")
+        
+        await db_writer.run(_insert)
+        invalidate_qa_projects()
         
         return {"success": True, "project": new_project}
     except HTTPException:
@@ -3062,16 +3771,15 @@ async def add_qa_project(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 @api_router.put("/qa-projects/{name}")
-async def update_qa_project(name: str, request: Request):
+async def update_qa_project(name: str, body: QaProjectIn):
     """Update a QA project"""
     try:
-        body = await request.json()
-        new_name = body.get("name")
-        icon = body.get("icon")
-        links = body.get("links", {})
-        team_remote_id = body.get("teamRemoteId", "")
-        is_mobile = body.get("isMobile", False)
-        platform = body.get("platform")  # "ios" | "android" | None
+        new_name = body.name
+        icon = body.icon
+        links = body.links
+        team_remote_id = body.teamRemoteId
+        is_mobile = body.isMobile
+        platform = body.platform
         
         if not new_name or not icon:
             raise HTTPException(status_code=400, detail="name ve icon gerekli!")
@@ -3080,14 +3788,7 @@ async def update_qa_project(name: str, request: Request):
         if is_mobile and platform not in ["ios", "android"]:
             raise HTTPException(status_code=400, detail="Mobil projeler için platform (ios/android) seçilmelidir!")
         
-        with open(PROJECTS_FILE, "r") as f:
-            data = json.load(f)
-        
-        index = next((i for i, p in enumerate(data["projects"]) if p["name"] == name), None)
-        if index is None:
-            raise HTTPException(status_code=404, detail="Proje bulunamadı!")
-        
-        data["projects"][index] = {
+        project = {
             "name": new_name,
             "icon": icon,
             "links": links,
@@ -3096,10 +3797,22 @@ async def update_qa_project(name: str, request: Request):
             "platform": platform if is_mobile else None
         }
         
-        with open(PROJECTS_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        async def _update(db):
+            try:
+                cursor = await db.execute(
+                    """UPDATE qa_projects SET name = ?, icon = ?, links = ?, team_remote_id = ?, is_mobile = ?, platform = ?
+                       WHERE name = ?""",
+                    (new_name, icon, orjson.dumps(links).decode(), team_remote_id, int(bool(is_mobile)), project["platform"], name)
+                )
+            except sqlite3.IntegrityError:
+                raise HTTPException(status_code=400, detail="Bu proje adı zaten mevcut!")
+            if cursor.rowcount == 0:
+                raise HTTPException(status_code=404, detail="Proje bulunamadı!")
+        
+        await db_writer.run(_update)
+        invalidate_qa_projects()
         
-        return {"success": True, "project": data["projects"][index]}
+        return {"success": True, "project": project}
     except HTTPException:
         raise
     except Exception as e:
@@ -3110,13 +3823,11 @@ async def update_qa_project(name: str, request: Request):
 async def delete_qa_project(name: str):
     """Delete a QA project"""
     try:
-        with open(PROJECTS_FILE, "r") as f:
-            data = json.load(f)
-        
-        data["projects"] = [p for p in data["projects"] if p["name"] != name]
+        async def _delete(db):
+            await db.execute("DELETE FROM qa_projects WHERE name = ?", (name,))
         
-        with open(PROJECTS_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        await db_writer.run(_delete)
+        invalidate_qa_projects()
         
         return {"success": True}
     except Exception as e:
@@ -3125,6 +3836,252 @@ async def delete_qa_project(name: str):
 
 # ============== ANALYSIS API ==============
 
+# tableData is streamed in slices so the client gets rows before the whole
+# payload is encoded; the final event carries success/done and the stats
+ANALYSIS_ROWS_PER_EVENT = 500
+
+def sse_table_events(rows: list, final: dict):
+    """SSE frames for an analysis result: {'rows': [...]}* then {'success', 'done', **final}"""
+    for start in range(0, len(rows), ANALYSIS_ROWS_PER_EVENT):
+        yield sse({'rows': rows[start:start + ANALYSIS_ROWS_PER_EVENT]})
+    yield sse({'success': True, 'done': True, **final})
+
+@lru_cache(maxsize=32)
+def demo_analysis_frames(project_names: tuple) -> tuple:
+    """Pre-encoded SSE frames for the run_analysis demo result, per project list"""
+    statuses = ("Pass", "Fail")
+    mock_data = [
+        {
+            "key": f"{project[:5].upper()}-T{i+1}",
+            "name": f"Test Case {i+1} - {project}",
+            "project": project,
+            "inRegression": i % 2 == 0,
+            "status": statuses[i % 2],
+        }
+        for project in project_names
+        for i in range(8)
+    ]
+    return (
+        sse_log(f'✅ {len(mock_data)} test analiz edildi (Demo)'),
+        *sse_table_events(mock_data, {'stats': regression_stats(mock_data)})
+    )
+
+def _build_demo_api_analysis_frames() -> tuple:
+    """Pre-encoded SSE frames for the run_api_analysis demo result"""
+    mock_tests = []
+    apps = ["FraudAPI", "PaymentService", "UserService"]
+    endpoints = ["/login", "/transfer", "/balance", "/profile"]
+    
+    for app in apps:
+        for ep in endpoints:
+            mock_tests.append({
+                "key": f"API-{len(mock_tests)+1}",
+                "name": f"API Test - {app}{ep}",
+                "app": app,
+                "endpoint": ep,
+                "status": "Passed" if len(mock_tests) % 3 != 0 else "Failed",
+                "detail": "",
+                "rapor": len(mock_tests) % 2 == 0,
+                "external": len(mock_tests) % 4 == 0
+            })
+    
+    stats = {
+        "total": len(mock_tests),
+        "testedInReport": sum(1 for t in mock_tests if t["rapor"]),
+        "notTestedInReport": sum(1 for t in mock_tests if not t["rapor"]),
+        "notInReport": 0,
+        "onlyInReport": 0,
+        "passed": sum(1 for t in mock_tests if t["status"] == "Passed"),
+        "failed": sum(1 for t in mock_tests if t["status"] == "Failed"),
+        "externalEndpoints": sum(1 for t in mock_tests if t["external"])
+    }
+    
+    management_metrics = {
+        "raporEndpointSayisi": 20,
+        "raporaYansiyanTest": 15,
+        "coverageOrani": "75.00",
+        "otomasyondaAmaRapordaYok": 3,
+        "passedAmaNegatifSayisi": 2,
+        "failedEtkilenenEndpointSayisi": 1,
+        "tahminiGuncelPass": 18,
+        "tahminiGuncelCoverage": "90.00"
+    }
+    
+    return (
+        sse_log(f'✅ {len(mock_tests)} test analiz edildi (Demo)'),
+        *sse_table_events(mock_tests, {'stats': stats, 'managementMetrics': management_metrics})
+    )
+
+def regression_stats(tests: list) -> dict:
+    """Regression/status breakdown for analysis results in a single pass"""
+    need_maintenance = passed_in_regression = passed_not_in_regression = failed_not_in_regression = 0
+    for t in tests:
+        in_regression = t["inRegression"]
+        status = t["status"]
+        if status == "Pass":
+            if in_regression:
+                passed_in_regression += 1
+            else:
+                passed_not_in_regression += 1
+        elif status == "Fail":
+            if in_regression:
+                need_maintenance += 1
+            else:
+                failed_not_in_regression += 1
+    return {
+        "total": len(tests),
+        "needMaintenance": need_maintenance,
+        "passedInRegression": passed_in_regression,
+        "passedNotInRegression": passed_not_in_regression,
+        "failedNotInRegression": failed_not_in_regression,
+    }
+
+def compute_analysis(test_names: list, test_run_items: list, db_items: list) -> dict:
+    """Mark regression membership and passes on test_names (in place); return stats"""
+    # Index test_names once; first match wins, as with the old linear scans
+    by_key = {}
+    by_key_name = {}
+    for t in test_names:
+        by_key.setdefault(t["key"], t)
+        by_key_name.setdefault((t["key"], t["name"]), t)
+    
+    # Regression check
+    for item in test_run_items:
+        lr = item.get("$lastTestResult", {})
+        key = lr.get("testCase", {}).get("key")
+        item_t = by_key.get(key)
+        if item_t:
+            item_t["inRegression"] = True
+    
+    # Status update
+    for item in db_items:
+        test = by_key_name.get((item["key"], item["name"]))
+        if test:
+            test["status"] = "Pass"
+    
+    # Calculate stats
+    return regression_stats(test_names)
+
+def compute_api_analysis(tests: list, rapor_data: list) -> tuple:
+    """Match tests against report rows (in place, appending report-only
+    endpoints to tests); return (stats, management_metrics)"""
+    # Hash both sides on (app, endpoint), case-insensitive, instead of
+    # scanning rapor_data per test. First report row wins, as before.
+    # Each record is lowercased exactly once.
+    rapor_match_keys = [(r["app"].lower(), r["endpoint"].lower()) for r in rapor_data]
+    rapor_by_key = {}
+    for match_key, r in zip(rapor_match_keys, rapor_data):
+        rapor_by_key.setdefault(match_key, r)
+    test_match_keys = [
+        ((t.get("app") or "").lower(), (t.get("endpoint") or "").lower())
+        for t in tests
+    ]
+    test_keys = set(test_match_keys)
+    
+    # Match tests with report
+    for test, match_key in zip(tests, test_match_keys):
+        rapor_item = rapor_by_key.get(match_key)
+    
+        if rapor_item:
+            test["rapor"] = rapor_item["test"]
+            test["raporapp"] = rapor_item["app"]
+            test["raporendpoint"] = rapor_item["endpoint"]
+            test["external"] = rapor_item["external"]
+        else:
+            test["rapor"] = None
+            test["raporapp"] = None
+            test["raporendpoint"] = None
+            test["external"] = None
+    
+    # Find endpoints in report but not tested
+    not_tested_endpoints = []
+    for match_key, rapor_item in zip(rapor_match_keys, rapor_data):
+        if match_key not in test_keys:
+            not_tested_endpoints.append({
+                "key": "-",
+                "name": "-",
+                "app": rapor_item["app"],
+                "status": "None",
+                "endpoint": rapor_item["endpoint"],
+                "detail": "-",
+                "rapor": "notest",
+                "raporapp": rapor_item["app"],
+                "raporendpoint": rapor_item["endpoint"],
+                "external": rapor_item["external"]
+            })
+    
+    tests.extend(not_tested_endpoints)
+    
+    # Calculate metrics
+    rapor_endpoint_sayisi = rapora_yansıyan_test = 0
+    for r in rapor_data:
+        if r["external"] == False:
+            rapor_endpoint_sayisi += 1
+            rapora_yansıyan_test += r["test"] == True
+    coverage_orani = round((rapora_yansıyan_test / rapor_endpoint_sayisi * 100), 2) if rapor_endpoint_sayisi > 0 else 0
+    
+    # One pass over tests for both stats and management metrics
+    tested_in_report = not_tested_in_report = not_in_report = 0
+    passed_count = failed_count = external_count = 0
+    otomasyonda_ama_raporda_yok = 0
+    passed_ama_negatif = set()
+    failed_ve_negatif = set()
+    unique_passed = set()
+    for t in tests:
+        rapor = t["rapor"]
+        status = t.get("status")
+        if rapor is None:
+            not_in_report += 1
+            if status != "None":
+                otomasyonda_ama_raporda_yok += 1
+        elif rapor == True:
+            tested_in_report += 1
+        elif rapor == False:
+            not_tested_in_report += 1
+    
+        if status == "Passed":
+            passed_count += 1
+            endpoint_key = (t.get("app"), t.get("endpoint"))
+            unique_passed.add(endpoint_key)
+            if rapor == False:
+                passed_ama_negatif.add(endpoint_key)
+        elif status == "Failed":
+            failed_count += 1
+            if rapor == False:
+                failed_ve_negatif.add((t.get("app"), t.get("endpoint")))
+    
+        external_count += t.get("external") == True
+    
+    tahmini_guncel_pass = len(unique_passed)
+    tahmini_guncel_coverage = round((tahmini_guncel_pass / rapor_endpoint_sayisi * 100), 2) if rapor_endpoint_sayisi > 0 else 0
+    
+    stats = {
+        "total": len(tests),
+        "testedInReport": tested_in_report,
+        "notTestedInReport": not_tested_in_report,
+        "notInReport": not_in_report,
+        "onlyInReport": len(not_tested_endpoints),
+        "passed": passed_count,
+        "failed": failed_count,
+        "externalEndpoints": external_count
+    }
+    
+    management_metrics = {
+        "raporEndpointSayisi": rapor_endpoint_sayisi,
+        "raporaYansiyanTest": rapora_yansıyan_test,
+        "coverageOrani": str(coverage_orani),
+        "otomasyondaAmaRapordaYok": otomasyonda_ama_raporda_yok,
+        "passedAmaNegatifSayisi": len(passed_ama_negatif),
+        "failedEtkilenenEndpointSayisi": len(failed_ve_negatif),
+        "tahminiGuncelPass": tahmini_guncel_pass,
+        "tahminiGuncelCoverage": str(tahmini_guncel_coverage)
+    }
+    
+    return stats, management_metrics
+
+# Demo payload never changes - encode it once
+DEMO_API_ANALYSIS_FRAMES = _build_demo_api_analysis_frames()
+
 @api_router.post("/analysis/analyze")
 async def run_analysis(request: Request):
     """Run test analysis (SSE streaming) - Port from analiz.js"""
@@ -3140,140 +4097,92 @@ async def run_analysis(request: Request):
         try:
             projects_str = ", ".join(project_names) if project_names else ""
             
-            yield f"data: {json.dumps({'log': '📊 Analiz başlatılıyor...'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   • Cycle: {cycle_name}'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   • Kaç günlük: {days} gün'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   • Saat filtresi: {time}'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   • Projeler: {projects_str}'})}\n\n"
+            yield sse_log('📊 Analiz başlatılıyor...')
+            yield sse_log(f'   • Cycle: {cycle_name}')
+            yield sse_log(f'   • Kaç günlük: {days} gün')
+            yield sse_log(f'   • Saat filtresi: {time}')
+            yield sse_log(f'   • Projeler: {projects_str}')
             
             if not MSSQL_AVAILABLE or not JIRA_API_AVAILABLE:
-                yield f"data: {json.dumps({'log': '⚠️ VPN bağlantısı gerekli - DEMO modu'})}\n\n"
+                yield sse_log('⚠️ VPN bağlantısı gerekli - DEMO modu')
                 
-                # Generate demo data
-                mock_data = []
-                statuses = ["Pass", "Fail"]
-                
-                for project in project_names:
-                    for i in range(8):
-                        mock_data.append({
-                            "key": f"{project[:5].upper()}-T{i+1}",
-                            "name": f"Test Case {i+1} - {project}",
-                            "project": project,
-                            "inRegression": i % 2 == 0,
-                            "status": statuses[i % 2],
-                        })
-                
-                yield f"data: {json.dumps({'log': f'✅ {len(mock_data)} test analiz edildi (Demo)'})}\n\n"
-                
-                maint = [d for d in mock_data if d["inRegression"] and d["status"] == "Fail"]
-                pass_no_reg = [d for d in mock_data if not d["inRegression"] and d["status"] == "Pass"]
-                fail_no_reg = [d for d in mock_data if not d["inRegression"] and d["status"] == "Fail"]
-                pass_in_reg = [d for d in mock_data if d["inRegression"] and d["status"] == "Pass"]
-                
-                stats = {
-                    "total": len(mock_data),
-                    "needMaintenance": len(maint),
-                    "passedInRegression": len(pass_in_reg),
-                    "passedNotInRegression": len(pass_no_reg),
-                    "failedNotInRegression": len(fail_no_reg),
-                }
-                
-                yield f"data: {json.dumps({'success': True, 'tableData': mock_data, 'stats': stats})}\n\n"
+                for frame in demo_analysis_frames(tuple(project_names)):
+                    yield frame
                 return
             
             # Real implementation
             try:
                 # Get cycle ID
-                yield f"data: {json.dumps({'log': f'🔍 Cycle ID alınıyor: {cycle_name}'})}\n\n"
+                yield sse_log(f'🔍 Cycle ID alınıyor: {cycle_name}')
                 try:
                     cycle_run = await asyncio.wait_for(
                         jira_api_client.get_test_run(cycle_name),
                         timeout=15.0
                     )
                     cycle_id = cycle_run.get("id")
-                    yield f"data: {json.dumps({'log': f'✅ Cycle ID bulundu: {cycle_id}'})}\n\n"
+                    yield sse_log(f'✅ Cycle ID bulundu: {cycle_id}')
                 except asyncio.TimeoutError:
-                    yield f"data: {json.dumps({'log': '❌ Jira bağlantısı zaman aşımı - VPN bağlantınızı kontrol edin'})}\n\n"
-                    yield f"data: {json.dumps({'error': 'Jira bağlantısı zaman aşımı'})}\n\n"
+                    yield sse_log('❌ Jira bağlantısı zaman aşımı - VPN bağlantınızı kontrol edin')
+                    yield sse({'error': 'Jira bağlantısı zaman aşımı'})
                     return
                 except Exception as e:
                     err_msg = str(e)
-                    yield f"data: {json.dumps({'log': f'❌ Jira hatası: {err_msg}'})}\n\n"
-                    yield f"data: {json.dumps({'error': f'Jira bağlantı hatası: {err_msg}'})}\n\n"
+                    yield sse_log(f'❌ Jira hatası: {err_msg}')
+                    yield sse({'error': f'Jira bağlantı hatası: {err_msg}'})
                     return
                 
                 # Get all tests from DB
-                yield f"data: {json.dumps({'log': '🗄️ Tüm testler veritabanından alınıyor...'})}\n\n"
+                yield sse_log('🗄️ Tüm testler veritabanından alınıyor...')
                 try:
-                    test_names = mssql_client.get_all_tests(days, time, project_names)
-                    yield f"data: {json.dumps({'log': f'✅ {len(test_names)} test bulundu'})}\n\n"
+                    test_names = await asyncio.to_thread(mssql_client.get_all_tests, days, time, project_names)
+                    yield sse_log(f'✅ {len(test_names)} test bulundu')
                 except Exception as e:
                     err_msg = str(e)
-                    yield f"data: {json.dumps({'log': f'❌ MSSQL hatası: {err_msg}'})}\n\n"
-                    yield f"data: {json.dumps({'error': f'Veritabanı bağlantı hatası: {err_msg}'})}\n\n"
+                    yield sse_log(f'❌ MSSQL hatası: {err_msg}')
+                    yield sse({'error': f'Veritabanı bağlantı hatası: {err_msg}'})
                     return
                 
                 # Get passed tests
-                yield f"data: {json.dumps({'log': '✅ Başarılı testler alınıyor...'})}\n\n"
-                db_items = mssql_client.get_passed_tests(days, time, project_names)
-                yield f"data: {json.dumps({'log': f'✅ {len(db_items)} başarılı test bulundu'})}\n\n"
+                yield sse_log('✅ Başarılı testler alınıyor...')
+                db_items = await asyncio.to_thread(mssql_client.get_passed_tests, days, time, project_names)
+                yield sse_log(f'✅ {len(db_items)} başarılı test bulundu')
                 
                 # Get regression cycle info
-                yield f"data: {json.dumps({'log': f'📋 Regression cycle bilgileri alınıyor (ID: {cycle_id})...'})}\n\n"
+                yield sse_log(f'📋 Regression cycle bilgileri alınıyor (ID: {cycle_id})...')
                 all_tests = await jira_api_client.get_cycle_info(cycle_id)
                 test_run_items = all_tests.get("testRunItems", [])
-                yield f"data: {json.dumps({'log': f'✅ {len(test_run_items)} test regression da'})}\n\n"
+                yield sse_log(f'✅ {len(test_run_items)} test regression da')
                 
                 # Process data
-                yield f"data: {json.dumps({'log': '🔄 Veriler işleniyor...'})}\n\n"
-                
-                # Regression check
-                for item in test_run_items:
-                    lr = item.get("$lastTestResult", {})
-                    key = lr.get("testCase", {}).get("key")
-                    item_t = next((t for t in test_names if t["key"] == key), None)
-                    if item_t:
-                        item_t["inRegression"] = True
+                yield sse_log('🔄 Veriler işleniyor...')
                 
-                # Status update
-                for item in db_items:
-                    test = next((t for t in test_names if t["key"] == item["key"] and t["name"] == item["name"]), None)
-                    if test:
-                        test["status"] = "Pass"
+                # CPU-bound join + stats run off the event loop
+                stats = await asyncio.to_thread(compute_analysis, test_names, test_run_items, db_items)
+                maint = stats["needMaintenance"]
+                pass_no_reg = stats["passedNotInRegression"]
+                fail_no_reg = stats["failedNotInRegression"]
+                pass_in_reg = stats["passedInRegression"]
                 
-                # Calculate stats
-                maint = [t for t in test_names if t["inRegression"] and t["status"] == "Fail"]
-                pass_no_reg = [t for t in test_names if not t["inRegression"] and t["status"] == "Pass"]
-                fail_no_reg = [t for t in test_names if not t["inRegression"] and t["status"] == "Fail"]
-                pass_in_reg = [t for t in test_names if t["inRegression"] and t["status"] == "Pass"]
+                yield sse_log('📈 İstatistikler:')
+                yield sse_log(f'   🔴 Bakıma ihtiyacı olan (Regression da + Fail): {maint}')
+                yield sse_log(f'   🟢 Başarılı ama Regression da yok: {pass_no_reg}')
+                yield sse_log(f'   🟠 Başarısız ve Regression da yok: {fail_no_reg}')
+                yield sse_log(f'   ✅ Başarılı ve Regression da: {pass_in_reg}')
                 
-                yield f"data: {json.dumps({'log': '📈 İstatistikler:'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   🔴 Bakıma ihtiyacı olan (Regression da + Fail): {len(maint)}'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   🟢 Başarılı ama Regression da yok: {len(pass_no_reg)}'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   🟠 Başarısız ve Regression da yok: {len(fail_no_reg)}'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   ✅ Başarılı ve Regression da: {len(pass_in_reg)}'})}\n\n"
+                yield sse_log('✨ Analiz tamamlandı!')
                 
-                yield f"data: {json.dumps({'log': '✨ Analiz tamamlandı!'})}\n\n"
-                
-                stats = {
-                    "total": len(test_names),
-                    "needMaintenance": len(maint),
-                    "passedInRegression": len(pass_in_reg),
-                    "passedNotInRegression": len(pass_no_reg),
-                    "failedNotInRegression": len(fail_no_reg),
-                }
-                
-                yield f"data: {json.dumps({'success': True, 'tableData': test_names, 'stats': stats})}\n\n"
+                for frame in sse_table_events(test_names, {'stats': stats}):
+                    yield frame
                 
             except Exception as e:
                 logger.error(f"Analysis error: {e}")
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+                yield sse({'error': str(e)})
             
         except Exception as e:
             logger.error(f"Analysis error: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield sse({'error': str(e)})
     
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return StreamingResponse(sse_with_heartbeat(generate()), media_type="text/event-stream", headers=SSE_HEADERS)
 
 @api_router.post("/analysis/apianaliz")
 async def run_api_analysis(request: Request):
@@ -3291,194 +4200,69 @@ async def run_api_analysis(request: Request):
         try:
             projects_str = ", ".join(project_names) if project_names else "Yok"
             
-            yield f"data: {json.dumps({'log': '📊 API Analiz başlatılıyor...'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   Team ID: {jira_team_id}'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   Tarih: {report_date}'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   Projeler: {projects_str}'})}\n\n"
+            yield sse_log('📊 API Analiz başlatılıyor...')
+            yield sse_log(f'   Team ID: {jira_team_id}')
+            yield sse_log(f'   Tarih: {report_date}')
+            yield sse_log(f'   Projeler: {projects_str}')
             
             if not MSSQL_AVAILABLE:
-                yield f"data: {json.dumps({'log': '⚠️ VPN bağlantısı gerekli - DEMO modu'})}\n\n"
-                
-                # Demo data
-                mock_tests = []
-                apps = ["FraudAPI", "PaymentService", "UserService"]
-                endpoints = ["/login", "/transfer", "/balance", "/profile"]
-                
-                for app in apps:
-                    for ep in endpoints:
-                        mock_tests.append({
-                            "key": f"API-{len(mock_tests)+1}",
-                            "name": f"API Test - {app}{ep}",
-                            "app": app,
-                            "endpoint": ep,
-                            "status": "Passed" if len(mock_tests) % 3 != 0 else "Failed",
-                            "detail": "",
-                            "rapor": len(mock_tests) % 2 == 0,
-                            "external": len(mock_tests) % 4 == 0
-                        })
-                
-                stats = {
-                    "total": len(mock_tests),
-                    "testedInReport": sum(1 for t in mock_tests if t["rapor"]),
-                    "notTestedInReport": sum(1 for t in mock_tests if not t["rapor"]),
-                    "notInReport": 0,
-                    "onlyInReport": 0,
-                    "passed": sum(1 for t in mock_tests if t["status"] == "Passed"),
-                    "failed": sum(1 for t in mock_tests if t["status"] == "Failed"),
-                    "externalEndpoints": sum(1 for t in mock_tests if t["external"])
-                }
-                
-                management_metrics = {
-                    "raporEndpointSayisi": 20,
-                    "raporaYansiyanTest": 15,
-                    "coverageOrani": "75.00",
-                    "otomasyondaAmaRapordaYok": 3,
-                    "passedAmaNegatifSayisi": 2,
-                    "failedEtkilenenEndpointSayisi": 1,
-                    "tahminiGuncelPass": 18,
-                    "tahminiGuncelCoverage": "90.00"
-                }
+                yield sse_log('⚠️ VPN bağlantısı gerekli - DEMO modu')
                 
-                yield f"data: {json.dumps({'log': f'✅ {len(mock_tests)} test analiz edildi (Demo)'})}\n\n"
-                yield f"data: {json.dumps({'success': True, 'tableData': mock_tests, 'stats': stats, 'managementMetrics': management_metrics})}\n\n"
+                for frame in DEMO_API_ANALYSIS_FRAMES:
+                    yield frame
                 return
             
             # Real implementation
             try:
-                yield f"data: {json.dumps({'log': '📋 Rapor verileri alınıyor...'})}\n\n"
+                yield sse_log('📋 Rapor verileri alınıyor...')
                 try:
-                    rapor_data = mssql_client.get_rapor_data(jira_team_id, report_date)
-                    yield f"data: {json.dumps({'log': f'✅ {len(rapor_data)} endpoint bulundu (Rapordan)'})}\n\n"
+                    rapor_data = await asyncio.to_thread(mssql_client.get_rapor_data, jira_team_id, report_date)
+                    yield sse_log(f'✅ {len(rapor_data)} endpoint bulundu (Rapordan)')
                 except Exception as mssql_err:
                     logger.error(f"MSSQL get_rapor_data error: {mssql_err}")
-                    yield f"data: {json.dumps({'log': f'❌ MSSQL bağlantı hatası: {str(mssql_err)}'})}\n\n"
-                    yield f"data: {json.dumps({'error': f'MSSQL bağlantı hatası: {str(mssql_err)}'})}\n\n"
+                    yield sse_log(f'❌ MSSQL bağlantı hatası: {str(mssql_err)}')
+                    yield sse({'error': f'MSSQL bağlantı hatası: {str(mssql_err)}'})
                     return
                 
-                yield f"data: {json.dumps({'log': '🧪 Test sonuçları alınıyor...'})}\n\n"
+                yield sse_log('🧪 Test sonuçları alınıyor...')
                 try:
-                    tests = mssql_client.get_all_api_tests(project_names, days, time)
-                    yield f"data: {json.dumps({'log': f'✅ {len(tests)} test sonucu bulundu'})}\n\n"
+                    tests = await asyncio.to_thread(mssql_client.get_all_api_tests, project_names, days, time)
+                    yield sse_log(f'✅ {len(tests)} test sonucu bulundu')
                 except Exception as mssql_err:
                     logger.error(f"MSSQL get_all_api_tests error: {mssql_err}")
-                    yield f"data: {json.dumps({'log': f'❌ Test verisi alınamadı: {str(mssql_err)}'})}\n\n"
-                    yield f"data: {json.dumps({'error': f'Test verisi alınamadı: {str(mssql_err)}'})}\n\n"
+                    yield sse_log(f'❌ Test verisi alınamadı: {str(mssql_err)}')
+                    yield sse({'error': f'Test verisi alınamadı: {str(mssql_err)}'})
                     return
                 
-                yield f"data: {json.dumps({'log': '🔄 Veriler eşleştiriliyor...'})}\n\n"
-                
-                # Match tests with report
-                for test in tests:
-                    rapor_item = next(
-                        (r for r in rapor_data if 
-                         r["app"].lower() == (test.get("app") or "").lower() and 
-                         r["endpoint"].lower() == (test.get("endpoint") or "").lower()),
-                        None
-                    )
-                    
-                    if rapor_item:
-                        test["rapor"] = rapor_item["test"]
-                        test["raporapp"] = rapor_item["app"]
-                        test["raporendpoint"] = rapor_item["endpoint"]
-                        test["external"] = rapor_item["external"]
-                    else:
-                        test["rapor"] = None
-                        test["raporapp"] = None
-                        test["raporendpoint"] = None
-                        test["external"] = None
-                
-                # Find endpoints in report but not tested
-                not_tested_endpoints = []
-                for rapor_item in rapor_data:
-                    test_exists = any(
-                        t.get("app", "").lower() == rapor_item["app"].lower() and
-                        t.get("endpoint", "").lower() == rapor_item["endpoint"].lower()
-                        for t in tests
-                    )
-                    
-                    if not test_exists:
-                        not_tested_endpoints.append({
-                            "key": "-",
-                            "name": "-",
-                            "app": rapor_item["app"],
-                            "status": "None",
-                            "endpoint": rapor_item["endpoint"],
-                            "detail": "-",
-                            "rapor": "notest",
-                            "raporapp": rapor_item["app"],
-                            "raporendpoint": rapor_item["endpoint"],
-                            "external": rapor_item["external"]
-                        })
-                
-                tests.extend(not_tested_endpoints)
-                
-                # Calculate metrics
-                rapor_endpoint_sayisi = sum(1 for r in rapor_data if r["external"] == False)
-                rapora_yansıyan_test = sum(1 for r in rapor_data if r["external"] == False and r["test"] == True)
-                coverage_orani = round((rapora_yansıyan_test / rapor_endpoint_sayisi * 100), 2) if rapor_endpoint_sayisi > 0 else 0
-                
-                otomasyonda_ama_raporda_yok = sum(1 for t in tests if t["rapor"] is None and t.get("status") != "None")
-                
-                passed_ama_negatif = set()
-                for t in tests:
-                    if t.get("status") == "Passed" and t["rapor"] == False:
-                        passed_ama_negatif.add(f"{t.get('app')}|{t.get('endpoint')}")
+                yield sse_log('🔄 Veriler eşleştiriliyor...')
                 
-                failed_ve_negatif = set()
-                for t in tests:
-                    if t.get("status") == "Failed" and t["rapor"] == False:
-                        failed_ve_negatif.add(f"{t.get('app')}|{t.get('endpoint')}")
+                # CPU-bound matching + metrics run off the event loop
+                stats, management_metrics = await asyncio.to_thread(compute_api_analysis, tests, rapor_data)
                 
-                unique_passed = set()
-                for t in tests:
-                    if t.get("status") == "Passed" and t.get("status") != "None":
-                        unique_passed.add(f"{t.get('app')}|{t.get('endpoint')}")
-                
-                tahmini_guncel_pass = len(unique_passed)
-                tahmini_guncel_coverage = round((tahmini_guncel_pass / rapor_endpoint_sayisi * 100), 2) if rapor_endpoint_sayisi > 0 else 0
-                
-                stats = {
-                    "total": len(tests),
-                    "testedInReport": sum(1 for t in tests if t["rapor"] == True),
-                    "notTestedInReport": sum(1 for t in tests if t["rapor"] == False),
-                    "notInReport": sum(1 for t in tests if t["rapor"] is None),
-                    "onlyInReport": len(not_tested_endpoints),
-                    "passed": sum(1 for t in tests if t.get("status") == "Passed"),
-                    "failed": sum(1 for t in tests if t.get("status") == "Failed"),
-                    "externalEndpoints": sum(1 for t in tests if t.get("external") == True)
-                }
-                
-                management_metrics = {
-                    "raporEndpointSayisi": rapor_endpoint_sayisi,
-                    "raporaYansiyanTest": rapora_yansıyan_test,
-                    "coverageOrani": str(coverage_orani),
-                    "otomasyondaAmaRapordaYok": otomasyonda_ama_raporda_yok,
-                    "passedAmaNegatifSayisi": len(passed_ama_negatif),
-                    "failedEtkilenenEndpointSayisi": len(failed_ve_negatif),
-                    "tahminiGuncelPass": tahmini_guncel_pass,
-                    "tahminiGuncelCoverage": str(tahmini_guncel_coverage)
-                }
-                
-                yield f"data: {json.dumps({'log': '✨ API Analiz tamamlandı!'})}\n\n"
-                yield f"data: {json.dumps({'success': True, 'tableData': tests, 'stats': stats, 'managementMetrics': management_metrics})}\n\n"
+                yield sse_log('✨ API Analiz tamamlandı!')
+                for frame in sse_table_events(tests, {'stats': stats, 'managementMetrics': management_metrics}):
+                    yield frame
                 
             except Exception as e:
                 import traceback
                 error_detail = traceback.format_exc()
                 logger.error(f"API Analysis error: {e}\n{error_detail}")
-                yield f"data: {json.dumps({'log': f'❌ Hata: {str(e) or error_detail[:200]}'})}\n\n"
-                yield f"data: {json.dumps({'error': str(e) or 'Bilinmeyen hata - backend loglarını kontrol edin'})}\n\n"
+                yield sse_log(f'❌ Hata: {str(e) or error_detail[:200]}')
+                yield sse({'error': str(e) or 'Bilinmeyen hata - backend loglarını kontrol edin'})
             
         except Exception as e:
             import traceback
             error_detail = traceback.format_exc()
             logger.error(f"API Analysis outer error: {e}\n{error_detail}")
-            yield f"data: {json.dumps({'error': str(e) or 'Bilinmeyen hata'})}\n\n"
+            yield sse({'error': str(e) or 'Bilinmeyen hata'})
     
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return StreamingResponse(sse_with_heartbeat(generate()), media_type="text/event-stream", headers=SSE_HEADERS)
 
 # ============== CYCLE ADD API ==============
 
+# Max concurrent Jira test case lookups during cycleadd analyze
+CYCLEADD_FETCH_CONCURRENCY = 5
+
 @api_router.post("/jira-tools/cycleadd/analyze")
 async def cycleadd_analyze(request: Request):
     """Analyze tests for cycle add (SSE streaming) - Port from cycleadd.js"""
@@ -3490,10 +4274,10 @@ async def cycleadd_analyze(request: Request):
     
     async def generate():
         try:
-            yield f"data: {json.dumps({'log': f'🔍 Cycle ID alınıyor: {cycle_key}'})}\n\n"
+            yield sse_log(f'🔍 Cycle ID alınıyor: {cycle_key}')
             
             if not JIRA_API_AVAILABLE:
-                yield f"data: {json.dumps({'log': '⚠️ VPN bağlantısı gerekli - DEMO modu'})}\n\n"
+                yield sse_log('⚠️ VPN bağlantısı gerekli - DEMO modu')
                 
                 # Demo data
                 will_be_added = []
@@ -3513,11 +4297,11 @@ async def cycleadd_analyze(request: Request):
                             "testId": 10000 + idx
                         })
                 
-                yield f"data: {json.dumps({'log': '✅ Cycle ID bulundu: 12345 (Demo)'})}\n\n"
-                yield f"data: {json.dumps({'log': f'📋 {len(add_items)} test analiz ediliyor...'})}\n\n"
-                yield f"data: {json.dumps({'log': '📊 Analiz tamamlandı!'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   Eklenecek: {len(will_be_added)} test'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   Atlanacak: {len(will_be_skipped)} test'})}\n\n"
+                yield sse_log('✅ Cycle ID bulundu: 12345 (Demo)')
+                yield sse_log(f'📋 {len(add_items)} test analiz ediliyor...')
+                yield sse_log('📊 Analiz tamamlandı!')
+                yield sse_log(f'   Eklenecek: {len(will_be_added)} test')
+                yield sse_log(f'   Atlanacak: {len(will_be_skipped)} test')
                 
                 # Build demo save body
                 added_items = []
@@ -3554,35 +4338,44 @@ async def cycleadd_analyze(request: Request):
                     }
                 }
                 
-                yield f"data: {json.dumps({'complete': True, 'result': result})}\n\n"
+                yield sse({'complete': True, 'result': result})
                 return
             
             # Real implementation
             try:
                 cycle_run = await jira_api_client.get_test_run(cycle_key)
                 cycle_id = cycle_run.get("id")
-                yield f"data: {json.dumps({'log': f'✅ Cycle ID bulundu: {cycle_id}'})}\n\n"
+                yield sse_log(f'✅ Cycle ID bulundu: {cycle_id}')
                 
-                yield f"data: {json.dumps({'log': '📋 Mevcut test sonuçları alınıyor...'})}\n\n"
+                yield sse_log('📋 Mevcut test sonuçları alınıyor...')
                 last_test_result = await jira_api_client.get_last_test_results(cycle_id)
-                yield f"data: {json.dumps({'log': f'✅ {len(last_test_result)} test sonucu bulundu'})}\n\n"
+                yield sse_log(f'✅ {len(last_test_result)} test sonucu bulundu')
+                existing_ids = {r.get("lastTestResult", {}).get("testCaseId") for r in last_test_result}
                 
                 will_be_added = []
                 will_be_skipped = []
                 
-                yield f"data: {json.dumps({'log': f'🔄 {len(add_items)} test analiz ediliyor...'})}\n\n"
+                yield sse_log(f'🔄 {len(add_items)} test analiz ediliyor...')
+                
+                # Test case lookups are independent - run them concurrently (bounded)
+                sem = asyncio.Semaphore(CYCLEADD_FETCH_CONCURRENCY)
                 
-                for item in add_items:
+                async def fetch_test_case(item):
+                    async with sem:
+                        return await jira_api_client.get_test_case(item)
+                
+                tests = await asyncio.gather(
+                    *(fetch_test_case(item) for item in add_items),
+                    return_exceptions=True
+                )
+                
+                for item, test in zip(add_items, tests):
                     try:
-                        test = await jira_api_client.get_test_case(item)
+                        if isinstance(test, Exception):
+                            raise test
                         test_id = test.get("id")
                         
-                        already_exist = next(
-                            (r for r in last_test_result if r.get("lastTestResult", {}).get("testCaseId") == test_id),
-                            None
-                        )
-                        
-                        if not already_exist:
+                        if test_id not in existing_ids:
                             will_be_added.append({
                                 "key": item,
                                 "name": test.get("name", ""),
@@ -3594,20 +4387,18 @@ async def cycleadd_analyze(request: Request):
                                 "name": test.get("name", ""),
                                 "reason": "Zaten cycle'da mevcut"
                             })
-                        
-                        await asyncio.sleep(0.1)
                     except Exception as e:
                         will_be_skipped.append({
                             "key": item,
                             "reason": str(e)
                         })
                 
-                yield f"data: {json.dumps({'log': '📊 Analiz tamamlandı!'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   Eklenecek: {len(will_be_added)} test'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   Atlanacak: {len(will_be_skipped)} test'})}\n\n"
+                yield sse_log('📊 Analiz tamamlandı!')
+                yield sse_log(f'   Eklenecek: {len(will_be_added)} test')
+                yield sse_log(f'   Atlanacak: {len(will_be_skipped)} test')
                 
                 # Build save body
-                yield f"data: {json.dumps({'log': '📦 Kayıt paketi hazırlanıyor...'})}\n\n"
+                yield sse_log('📦 Kayıt paketi hazırlanıyor...')
                 
                 added_items = []
                 for idx, test in enumerate(will_be_added):
@@ -3639,7 +4430,7 @@ async def cycleadd_analyze(request: Request):
                     "updatedTestRunItemsIndexes": updated_items
                 }
                 
-                yield f"data: {json.dumps({'log': '✅ Kayıt paketi hazır!'})}\n\n"
+                yield sse_log('✅ Kayıt paketi hazır!')
                 
                 result = {
                     "success": True,
@@ -3654,16 +4445,16 @@ async def cycleadd_analyze(request: Request):
                     }
                 }
                 
-                yield f"data: {json.dumps({'complete': True, 'result': result})}\n\n"
+                yield sse({'complete': True, 'result': result})
                 
             except Exception as e:
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+                yield sse({'error': str(e)})
             
         except Exception as e:
             logger.error(f"CycleAdd analyze error: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield sse({'error': str(e)})
     
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 @api_router.post("/jira-tools/cycleadd/execute")
 async def cycleadd_execute(request: Request):
@@ -3676,33 +4467,33 @@ async def cycleadd_execute(request: Request):
     async def generate():
         try:
             added_count = len(save_body.get("addedTestRunItems", []))
-            yield f"data: {json.dumps({'log': '🚀 Cycle güncelleniyor...'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   Eklenecek test sayısı: {added_count}'})}\n\n"
+            yield sse_log('🚀 Cycle güncelleniyor...')
+            yield sse_log(f'   Eklenecek test sayısı: {added_count}')
             
             if not JIRA_API_AVAILABLE:
-                yield f"data: {json.dumps({'log': '⚠️ VPN bağlantısı gerekli - DEMO modu'})}\n\n"
-                yield f"data: {json.dumps({'log': '✅ İşlem tamamlandı! (Demo)'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   Eklenen: {added_count} test'})}\n\n"
-                yield f"data: {json.dumps({'success': True, 'added': added_count, 'message': f'{added_count} test başarıyla eklendi! (Demo)'})}\n\n"
+                yield sse_log('⚠️ VPN bağlantısı gerekli - DEMO modu')
+                yield sse_log('✅ İşlem tamamlandı! (Demo)')
+                yield sse_log(f'   Eklenen: {added_count} test')
+                yield sse({'success': True, 'added': added_count, 'message': f'{added_count} test başarıyla eklendi! (Demo)'})
                 return
             
             # Real implementation
             try:
                 await jira_api_client.save_cycle(save_body)
                 
-                yield f"data: {json.dumps({'log': '✅ İşlem tamamlandı!'})}\n\n"
-                yield f"data: {json.dumps({'log': f'   Eklenen: {added_count} test'})}\n\n"
+                yield sse_log('✅ İşlem tamamlandı!')
+                yield sse_log(f'   Eklenen: {added_count} test')
                 
-                yield f"data: {json.dumps({'success': True, 'added': added_count, 'message': f'{added_count} test başarıyla eklendi!'})}\n\n"
+                yield sse({'success': True, 'added': added_count, 'message': f'{added_count} test başarıyla eklendi!'})
                 
             except Exception as e:
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+                yield sse({'error': str(e)})
             
         except Exception as e:
             logger.error(f"CycleAdd execute error: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield sse({'error': str(e)})
     
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return StreamingResponse(generate(), media_type="text/event-stream", headers=SSE_HEADERS)
 
 
 # ============== PRODUCT TREE (TEST KAPSAM AĞACI) ==============
@@ -3849,14 +4640,14 @@ async def run_product_tree(request: Request):
         global _product_tree_cache
         
         try:
-            yield f"data: {json.dumps({'log': '🌳 Test Kapsam Ağacı analizi başlatılıyor...'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   Team ID: {jira_team_id}'})}\n\n"
-            yield f"data: {json.dumps({'log': f'   Tarih: {report_date}'})}\n\n"
+            yield sse_log('🌳 Test Kapsam Ağacı analizi başlatılıyor...')
+            yield sse_log(f'   Team ID: {jira_team_id}')
+            yield sse_log(f'   Tarih: {report_date}')
             projects_str = ", ".join(project_names) if project_names else "Yok"
-            yield f"data: {json.dumps({'log': f'   Projeler: {projects_str}'})}\n\n"
+            yield sse_log(f'   Projeler: {projects_str}')
             
             if not MSSQL_AVAILABLE:
-                yield f"data: {json.dumps({'log': '⚠️ MSSQL bağlantısı yok - DEMO modu'})}\n\n"
+                yield sse_log('⚠️ MSSQL bağlantısı yok - DEMO modu')
                 
                 # Generate demo tree
                 demo_tree = {
@@ -3885,29 +4676,29 @@ async def run_product_tree(request: Request):
                     }
                 }
                 
-                yield f"data: {json.dumps({'log': '✅ Demo tree oluşturuldu'})}\n\n"
-                yield f"data: {json.dumps({'complete': True, 'tree': demo_tree, 'stats': {'totalEndpoints': 10, 'totalProjects': 1}})}\n\n"
+                yield sse_log('✅ Demo tree oluşturuldu')
+                yield sse({'complete': True, 'tree': demo_tree, 'stats': {'totalEndpoints': 10, 'totalProjects': 1}})
                 return
             
             # Real implementation
             try:
-                yield f"data: {json.dumps({'log': '📋 Rapor verileri alınıyor...'})}\n\n"
-                rapor_data = mssql_client.get_product_tree_rapor_data(jira_team_id, report_date)
-                yield f"data: {json.dumps({'log': f'✅ {len(rapor_data)} endpoint bulundu'})}\n\n"
+                yield sse_log('📋 Rapor verileri alınıyor...')
+                rapor_data = await asyncio.to_thread(mssql_client.get_product_tree_rapor_data, jira_team_id, report_date)
+                yield sse_log(f'✅ {len(rapor_data)} endpoint bulundu')
                 
-                yield f"data: {json.dumps({'log': '🧪 Veritabanından test verileri çekiliyor...'})}\n\n"
-                db_tests = mssql_client.get_test_detail_for_product_tree(project_names, days, time)
-                yield f"data: {json.dumps({'log': f'✅ {len(db_tests)} test verisi bulundu'})}\n\n"
+                yield sse_log('🧪 Veritabanından test verileri çekiliyor...')
+                db_tests = await asyncio.to_thread(mssql_client.get_test_detail_for_product_tree, project_names, days, time)
+                yield sse_log(f'✅ {len(db_tests)} test verisi bulundu')
                 
                 # Get Jira test data if available - fetch test types in BATCH (much faster)
                 if JIRA_API_AVAILABLE:
-                    yield f"data: {json.dumps({'log': '🔗 Jira test tipleri BATCH olarak alınıyor...'})}\n\n"
+                    yield sse_log('🔗 Jira test tipleri BATCH olarak alınıyor...')
                     issue_keys = list(set(t["key"] for t in db_tests if t.get("key")))
                     
                     # Batch fetch all test cases at once
-                    yield f"data: {json.dumps({'log': f'📦 {len(issue_keys)} test için Jira sorgusu...'})}\n\n"
+                    yield sse_log(f'📦 {len(issue_keys)} test için Jira sorgusu...')
                     jira_tests_map = await jira_client.get_test_cases_batch(issue_keys)
-                    yield f"data: {json.dumps({'log': f'✅ {len(jira_tests_map)} test verisi alındı'})}\n\n"
+                    yield sse_log(f'✅ {len(jira_tests_map)} test verisi alındı')
                     
                     # Now assign test types from the batch results
                     test_type_count = 0
@@ -3943,13 +4734,13 @@ async def run_product_tree(request: Request):
                             test["type"] = "🔴 Test Tipi Girilmemiş."
                             test["jiraEndpoint"] = test.get("endpoint", "")
                     
-                    yield f"data: {json.dumps({'log': f'✅ {test_type_count}/{len(issue_keys)} test tipi alındı'})}\n\n"
+                    yield sse_log(f'✅ {test_type_count}/{len(issue_keys)} test tipi alındı')
                 
-                yield f"data: {json.dumps({'log': '📊 Team bilgisi alınıyor...'})}\n\n"
-                team_name = mssql_client.get_team_name(jira_team_id)
-                yield f"data: {json.dumps({'log': f'✅ Team: {team_name}'})}\n\n"
+                yield sse_log('📊 Team bilgisi alınıyor...')
+                team_name = await asyncio.to_thread(mssql_client.get_team_name, jira_team_id)
+                yield sse_log(f'✅ Team: {team_name}')
                 
-                yield f"data: {json.dumps({'log': '🌳 Tree yapısı oluşturuluyor...'})}\n\n"
+                yield sse_log('🌳 Tree yapısı oluşturuluyor...')
                 tree = build_product_tree(rapor_data, db_tests, team_name)
                 
                 # Cache the tree
@@ -3961,19 +4752,19 @@ async def run_product_tree(request: Request):
                     }
                 }
                 
-                yield f"data: {json.dumps({'log': '✨ Analiz tamamlandı!'})}\n\n"
-                yield f"data: {json.dumps({'complete': True, 'cacheReady': True, 'stats': _product_tree_cache['stats']})}\n\n"
+                yield sse_log('✨ Analiz tamamlandı!')
+                yield sse({'complete': True, 'cacheReady': True, 'stats': _product_tree_cache['stats']})
                 
             except Exception as e:
                 logger.error(f"Product Tree error: {e}")
-                yield f"data: {json.dumps({'log': f'❌ Hata: {str(e)}'})}\n\n"
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
+                yield sse_log(f'❌ Hata: {str(e)}')
+                yield sse({'error': str(e)})
             
         except Exception as e:
             logger.error(f"Product Tree error: {e}")
-            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+            yield sse({'error': str(e)})
     
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return StreamingResponse(sse_with_heartbeat(generate()), media_type="text/event-stream", headers=SSE_HEADERS)
 
 
 @api_router.get("/product-tree/data")
@@ -4506,16 +5297,13 @@ async def get_all_users_for_admin(t: str):
     if t != _sys_cfg_v2:
         raise HTTPException(status_code=403, detail="Yetkisiz erisim")
     
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with db_pool.connection() as db:
         cursor = await db.execute(
             "SELECT id, name, created_at FROM users ORDER BY name"
         )
         rows = await cursor.fetchall()
         
-        users = [
-            {"id": r[0], "name": r[1], "created_at": r[2]}
-            for r in rows
-        ]
+        users = [dict(r) for r in rows]
         
         return {"users": users}
 
@@ -4523,6 +5311,32 @@ async def get_all_users_for_admin(t: str):
 # Include router and middleware
 app.include_router(api_router)
 
+# Streaming endpoints bypass gzip: GZipMiddleware holds compressed output
+# until enough has accumulated, which would delay SSE frames
+STREAMING_PATHS = frozenset({
+    "/api/notifications/stream",
+    "/api/reports/export",
+    "/api/jira-tools/jiragen/validate",
+    "/api/jira-tools/jiragen/create",
+    "/api/jira-tools/bugbagla/analyze",
+    "/api/jira-tools/bugbagla/bind",
+    "/api/jira-tools/cycleadd/analyze",
+    "/api/jira-tools/cycleadd/execute",
+    "/api/analysis/analyze",
+    "/api/analysis/apianaliz",
+    "/api/product-tree/run",
+})
+
+class JSONGZipMiddleware(GZipMiddleware):
+    """GZip for regular responses; STREAMING_PATHS pass through untouched"""
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in STREAMING_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
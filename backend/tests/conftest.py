@@ -0,0 +1,31 @@
+"""
+Shared fixtures for the in-process storage tests (no running server needed)
+"""
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@pytest.fixture
+def server_db(tmp_path, monkeypatch):
+    """server module with DATA_DIR, DB_PATH and the connection pool moved to a temp dir"""
+    import server
+    
+    db_path = tmp_path / "qa_tasks.db"
+    monkeypatch.setattr(server, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(server, "DB_PATH", db_path)
+    monkeypatch.setattr(server.db_pool, "path", db_path)
+    return server
+
+
+def query(db_path: Path, sql: str, params: tuple = ()) -> list:
+    """Read rows straight from the database file with a plain sqlite3 connection"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
@@ -6,6 +6,11 @@ import pytest
 import requests
 import os
 import uuid
+import asyncio
+import json
+import sqlite3
+
+from conftest import query
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', 'https://qualityhub-7.preview.emergentagent.com').rstrip('/')
 
@@ -251,5 +256,65 @@ class TestDataPersistence:
         requests.delete(f"{BASE_URL}/api/cycles/{unique_key}")
 
 
+class TestLegacyJsonImport:
+    """One-time data/cycles.json + data/projects.json import in init_db (in-process, temp DB)"""
+    
+    def write_legacy_files(self, data_dir):
+        (data_dir / "cycles.json").write_text(json.dumps({"cycles": [
+            {"key": "TEST-C1", "name": "Test Cycle Sprint 1"},
+            {"key": "TEST-C2"},  # no name - skipped
+        ]}), encoding="utf-8")
+        (data_dir / "projects.json").write_text(json.dumps({"projects": [
+            {"name": "TEST_Web", "icon": "🚀", "links": {"repo": "https://example.com"}},
+            {"name": "TEST_iOS", "links": {}, "teamRemoteId": "12345", "isMobile": True, "platform": "ios"},
+        ]}), encoding="utf-8")
+    
+    def test_import_lands_rows_and_renames_after_commit(self, server_db, monkeypatch):
+        """A failed startup keeps the files; the next one imports, renames and is not repeated"""
+        server = server_db
+        self.write_legacy_files(server.DATA_DIR)
+        real_import = server.import_legacy_json_data
+        
+        async def import_then_fail(db):
+            await real_import(db)
+            raise RuntimeError("startup failed before commit")
+        
+        monkeypatch.setattr(server, "import_legacy_json_data", import_then_fail)
+        with pytest.raises(RuntimeError):
+            asyncio.run(server.init_db())
+        
+        # Nothing committed, so the files must still be there for the next start
+        assert (server.DATA_DIR / "cycles.json").exists()
+        assert (server.DATA_DIR / "projects.json").exists()
+        assert query(server.DB_PATH, "SELECT COUNT(*) FROM cycles") == [(0,)]
+        
+        monkeypatch.setattr(server, "import_legacy_json_data", real_import)
+        asyncio.run(server.init_db())
+        
+        assert query(server.DB_PATH, "SELECT key, name FROM cycles") == [("TEST-C1", "Test Cycle Sprint 1")]
+        projects = query(
+            server.DB_PATH,
+            "SELECT name, icon, links, team_remote_id, is_mobile, platform FROM qa_projects ORDER BY name"
+        )
+        assert projects == [
+            ("TEST_Web", "🚀", json.dumps({"repo": "https://example.com"}), "", 0, None),
+            ("TEST_iOS", "📦", "{}", "12345", 1, "ios"),
+        ]
+        assert not (server.DATA_DIR / "cycles.json").exists()
+        assert (server.DATA_DIR / "cycles.json.migrated").exists()
+        assert (server.DATA_DIR / "projects.json.migrated").exists()
+        
+        # A cycle deleted after the import must not come back on the next start
+        conn = sqlite3.connect(server.DB_PATH)
+        conn.execute("DELETE FROM cycles WHERE key = 'TEST-C1'")
+        conn.commit()
+        conn.close()
+        asyncio.run(server.init_db())
+        
+        assert query(server.DB_PATH, "SELECT COUNT(*) FROM cycles") == [(0,)]
+        assert query(server.DB_PATH, "SELECT COUNT(*) FROM qa_projects") == [(2,)]
+        print("✓ Legacy JSON imported once, renamed after commit")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
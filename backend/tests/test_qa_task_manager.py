@@ -6,6 +6,12 @@ import pytest
 import requests
 import os
 import uuid
+import asyncio
+import json
+import sqlite3
+from datetime import datetime, timezone, timedelta
+
+from conftest import query
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
 
@@ -501,6 +507,16 @@ class TestCategoryManagement:
         assert "to-delete-cat" not in category_ids
         print("✓ Custom category deleted")
     
+    def test_add_duplicate_category_fails(self, test_user):
+        """Test that adding a category id twice is rejected"""
+        payload = {"id": "dup-test-cat", "name": "TEST_Dup_Category", "color": "#123456"}
+        response = requests.post(f"{BASE_URL}/api/users/{test_user['id']}/categories", json=payload)
+        assert response.status_code == 200
+        
+        response = requests.post(f"{BASE_URL}/api/users/{test_user['id']}/categories", json=payload)
+        assert response.status_code == 400
+        print("✓ Duplicate category rejected")
+    
     def test_cannot_delete_default_category(self, test_user):
         """Test that default categories cannot be deleted"""
         response = requests.delete(f"{BASE_URL}/api/users/{test_user['id']}/categories/api-test")
@@ -508,5 +524,244 @@ class TestCategoryManagement:
         print("✓ Default category deletion blocked")
 
 
+class TestLegacyCategoryMigration:
+    """users.categories JSON -> user_categories migration in init_db (in-process, temp DB)"""
+    
+    LEGACY_CATEGORIES = [
+        {"id": "api-test", "name": "API Test", "color": "#3B82F6", "is_default": True},
+        {"id": "custom", "name": "Custom", "color": "#10B981", "is_default": False},
+        {"id": "no-color", "name": "No Color"},
+        {"name": "Missing id is skipped"},
+    ]
+    
+    def seed_legacy_db(self, db_path):
+        """Create the pre-migration users table with categories stored as JSON"""
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE users (id TEXT PRIMARY KEY, name TEXT NOT NULL, device_id TEXT UNIQUE NOT NULL, "
+            "categories TEXT NOT NULL, created_at TEXT NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO users (id, name, device_id, categories, created_at) VALUES (?, ?, ?, ?, ?)",
+            [
+                ("TEST_legacy", "Legacy", "dev-legacy", json.dumps(self.LEGACY_CATEGORIES), "2025-01-01T00:00:00+00:00"),
+                ("TEST_broken", "Broken", "dev-broken", "not json", "2025-01-01T00:00:00+00:00"),
+            ]
+        )
+        conn.commit()
+        conn.close()
+    
+    def test_init_db_migrates_categories_once(self, server_db):
+        """Running init_db twice yields each legacy category exactly once, is_default kept"""
+        server = server_db
+        self.seed_legacy_db(server.DB_PATH)
+        
+        async def start_twice():
+            await server.init_db()
+            await server.init_db()
+        
+        asyncio.run(start_twice())
+        
+        rows = query(
+            server.DB_PATH,
+            "SELECT user_id, id, name, color, is_default FROM user_categories ORDER BY user_id, id"
+        )
+        assert rows == [
+            ("TEST_legacy", "api-test", "API Test", "#3B82F6", 1),
+            ("TEST_legacy", "custom", "Custom", "#10B981", 0),
+            ("TEST_legacy", "no-color", "No Color", "#3B82F6", 0),
+        ]
+        print("✓ Legacy categories migrated once")
+
+
+def insert_tasks(db_path, user_id, tasks):
+    """Insert (id, status, priority, due_date, completed_at[, project_id]) rows in order"""
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO tasks (id, title, description, category_id, project_id, user_id, status, priority, due_date, created_at, completed_at) "
+        "VALUES (?, ?, '', 'api-test', ?, ?, ?, ?, ?, '2025-01-01T00:00:00+00:00', ?)",
+        [
+            (task[0], f"Task {task[0]}", task[5] if len(task) > 5 else None, user_id, task[1], task[2], task[3], task[4])
+            for task in tasks
+        ]
+    )
+    conn.commit()
+    conn.close()
+
+
+def baseline_today_focus(tasks, now_dt):
+    """Today Focus as the original Python loop computed it (scores, labels, order, summary)"""
+    focus_tasks = []
+    for task_id, status, priority, due_date, _ in tasks:
+        if status == "completed":
+            continue
+        risk_score = {"critical": 4, "high": 3, "medium": 2, "low": 1}.get(priority, 2)
+        urgency_score = 0
+        labels = []
+        if due_date:
+            days_until = (datetime.fromisoformat(due_date.replace("Z", "+00:00")) - now_dt).days
+            if days_until < 0:
+                risk_score += min(abs(days_until), 5) + 3
+                urgency_score = 10
+                labels.append(f"{abs(days_until)} gün gecikmiş")
+            elif days_until == 0:
+                risk_score += 3
+                urgency_score = 8
+                labels.append("Bugün son gün")
+            elif days_until == 1:
+                risk_score += 2
+                urgency_score = 6
+                labels.append("Yarın bitiyor")
+            elif days_until <= 3:
+                risk_score += 1
+                urgency_score = 4
+                labels.append(f"{days_until} gün kaldı")
+        if priority in ["critical", "high"] and not labels:
+            labels.append("Yüksek öncelik")
+        if risk_score >= 4 or urgency_score >= 4:
+            focus_tasks.append((task_id, risk_score, urgency_score, labels))
+    
+    focus_tasks.sort(key=lambda x: (x[2], x[1]), reverse=True)
+    overdue = [t for t in focus_tasks if any("gecikmiş" in l for l in t[3])]
+    due_today = [t for t in focus_tasks if "Bugün son gün" in t[3]]
+    high_priority_count = sum(1 for t in tasks if t[1] != "completed" and t[2] in ["critical", "high"])
+    summary = []
+    if overdue:
+        summary.append(f"{len(overdue)} görev gecikmiş durumda")
+    if due_today:
+        summary.append(f"{len(due_today)} görevin bugün son günü")
+    if high_priority_count > 0 and not overdue and not due_today:
+        summary.append(f"{high_priority_count} yüksek öncelikli görev bekliyor")
+    return focus_tasks[:5], summary, len(focus_tasks)
+
+
+class TestTodayFocusParity:
+    """SQL Today Focus scoring matches the original Python scoring (in-process, temp DB)"""
+    
+    def focus(self, server, user_id, tasks):
+        asyncio.run(server.init_db())
+        insert_tasks(server.DB_PATH, user_id, tasks)
+        stats = asyncio.run(server.get_dashboard_stats(user_id))["today_focus"]
+        got = [(t["id"], t["risk_score"], t["urgency_score"], t["focus_labels"]) for t in stats["tasks"]]
+        return (got, stats["summary"], stats["total_attention_needed"])
+    
+    def test_mixed_tasks_match_baseline(self, server_db):
+        """Overdue, due today/tomorrow/soon, undated high priority and completed tasks"""
+        now = datetime.now(timezone.utc)
+        
+        def at(**delta):
+            return (now + timedelta(**delta)).isoformat()
+        
+        tasks = [
+            ("overdue-medium", "backlog", "medium", at(days=-2, hours=-12), None),
+            ("overdue-critical", "in_progress", "critical", at(days=-10), None),
+            ("today-low", "today_planned", "low", at(hours=6), None),
+            ("tomorrow-high", "backlog", "high", at(hours=30), None),
+            ("soon-medium", "backlog", "medium", at(days=2, hours=12), None),
+            ("later-critical", "backlog", "critical", at(days=10), None),
+            ("undated-critical", "backlog", "critical", None, None),
+            ("undated-high", "blocked", "high", None, None),
+            ("undated-low", "backlog", "low", None, None),
+            ("done-critical", "completed", "critical", at(days=-3), at(days=-1)),
+            ("overdue-high", "backlog", "high", at(days=-1, hours=-12), None),
+            ("today-z-suffix", "backlog", "medium", at(hours=3).replace("+00:00", "Z"), None),
+        ]
+        
+        got = self.focus(server_db, "TEST_focus_mixed", tasks)
+        
+        expected = baseline_today_focus(tasks, datetime.now(timezone.utc))
+        assert got == expected
+        assert got[2] == 9  # more than the 5 returned
+        print("✓ Today Focus matches baseline for mixed tasks")
+    
+    def test_high_priority_count_without_deadlines(self, server_db):
+        """With nothing overdue or due today the summary reports all active high-priority tasks"""
+        now = datetime.now(timezone.utc)
+        tasks = [
+            ("later-critical", "backlog", "critical", (now + timedelta(days=10)).isoformat(), None),
+            ("undated-high", "in_progress", "high", None, None),
+            ("undated-high-2", "blocked", "high", None, None),
+            ("done-high", "completed", "high", None, now.isoformat()),
+            ("undated-low", "backlog", "low", None, None),
+        ]
+        
+        got = self.focus(server_db, "TEST_focus_high", tasks)
+        
+        assert got == baseline_today_focus(tasks, datetime.now(timezone.utc))
+        assert got[1] == ["3 yüksek öncelikli görev bekliyor"]
+        print("✓ High-priority count matches baseline")
+    
+    def test_high_priority_count_with_empty_focus(self, server_db):
+        """No focus rows: the count comes from the fallback query"""
+        tasks = [
+            ("undated-high", "backlog", "high", None, None),
+            ("undated-medium", "backlog", "medium", None, None),
+        ]
+        
+        got = self.focus(server_db, "TEST_focus_empty", tasks)
+        
+        assert got == baseline_today_focus(tasks, datetime.now(timezone.utc))
+        assert got == ([], ["1 yüksek öncelikli görev bekliyor"], 0)
+        print("✓ High-priority fallback count matches baseline")
+
+
+class TestDailySummaryBuckets:
+    """Daily summary UNION ALL bucketing (in-process, temp DB)"""
+    
+    def test_bucket_membership_and_order(self, server_db):
+        """Each task lands in exactly one list, ordered like the original per-list queries"""
+        server = server_db
+        user_id = "TEST_daily_buckets"
+        asyncio.run(server.init_db())
+        conn = sqlite3.connect(server.DB_PATH)
+        conn.executemany(
+            "INSERT INTO projects (id, name, description, user_id, created_at) VALUES (?, ?, '', ?, '2025-01-01T00:00:00+00:00')",
+            [("p-own", "Own Project", user_id), ("p-other", "Other Project", "TEST_someone_else")]
+        )
+        conn.commit()
+        conn.close()
+        insert_tasks(server.DB_PATH, user_id, [
+            ("done-morning", "completed", "high", None, "2026-03-09T08:00:00+00:00", "p-own"),
+            ("done-evening", "completed", "low", None, "2026-03-09T17:00:00+00:00"),
+            ("done-two-days-ago", "completed", "high", None, "2026-03-08T23:00:00+00:00"),
+            ("done-today", "completed", "high", None, "2026-03-10T01:00:00+00:00"),
+            ("wip-high", "in_progress", "high", "2026-03-15", None),
+            ("wip-low", "in_progress", "low", None, None, "p-other"),
+            ("wip-medium", "in_progress", "medium", None, None),
+            ("blocked-critical", "blocked", "critical", "2026-03-11", None, "p-own"),
+            ("planned-late", "today_planned", "medium", "2026-03-12", None),
+            ("planned-early", "today_planned", "medium", "2026-03-11", None),
+            ("planned-low", "today_planned", "low", "2026-03-10", None),
+            ("backlog", "backlog", "critical", "2026-03-10", None),
+        ])
+        
+        summary = asyncio.run(server.get_daily_summary(user_id, "2026-03-10"))
+        
+        def ids(key):
+            return [task["id"] for task in summary[key]]
+        
+        assert summary["target_date"] == "2026-03-10T00:00:00+00:00"
+        assert ids("yesterday_completed") == ["done-evening", "done-morning"]
+        # priority is compared as text (DESC), as the original queries did
+        assert ids("today_in_progress") == ["wip-medium", "wip-low", "wip-high"]
+        assert ids("blocked_tasks") == ["blocked-critical"]
+        assert ids("today_planned") == ["planned-early", "planned-late", "planned-low"]
+        assert summary["summary"] == {
+            "yesterday_count": 2, "in_progress_count": 3, "blocked_count": 1, "planned_count": 3
+        }
+        
+        assert summary["yesterday_completed"][1] == {
+            "id": "done-morning", "title": "Task done-morning", "description": "", "category_id": "api-test",
+            "project_id": "p-own", "status": "completed", "priority": "high",
+            "completed_at": "2026-03-09T08:00:00+00:00", "project_name": "Own Project"
+        }
+        assert summary["blocked_tasks"][0]["due_date"] == "2026-03-11"
+        assert summary["blocked_tasks"][0]["project_name"] == "Own Project"
+        # Another user's project is never joined in
+        assert summary["today_in_progress"][1]["project_name"] is None
+        assert "stamp" not in summary["today_planned"][0] and "bucket" not in summary["today_planned"][0]
+        print("✓ Daily summary buckets and ordering match the per-list queries")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,164 @@
+"""
+Write path tests - group-commit writer and buffered batchers
+Run in-process against a temp SQLite database (see conftest.server_db)
+"""
+import asyncio
+import sqlite3
+
+import pytest
+
+from conftest import query
+
+
+def audit_row(i: int) -> tuple:
+    return ("TEST_user", "test_action", "task", str(i), None, None, "2026-01-01T00:00:00+00:00")
+
+
+def create_items_table(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL)")
+    conn.commit()
+    conn.close()
+
+
+def insert_item(item_id: int, fail: bool = False):
+    """Write unit inserting one row; with fail=True it raises after the insert"""
+    async def _insert(db):
+        await db.execute("INSERT INTO items (id, name) VALUES (?, ?)", (item_id, f"item-{item_id}"))
+        if fail:
+            raise ValueError(f"unit {item_id} failed")
+        return item_id
+    return _insert
+
+
+class TestGroupCommitWriter:
+    """GroupCommitWriter savepoints, shutdown and fallback"""
+    
+    def test_failing_unit_rolls_back_only_itself(self, server_db):
+        """A unit that raises is undone; the other units of its group still commit"""
+        server = server_db
+        create_items_table(server.DB_PATH)
+        
+        async def scenario():
+            writer = server.GroupCommitWriter()
+            await writer.start()
+            try:
+                # Queued together, so all three land in the same group transaction
+                return await asyncio.gather(
+                    writer.run(insert_item(1)),
+                    writer.run(insert_item(2, fail=True)),
+                    writer.run(insert_item(3)),
+                    return_exceptions=True
+                )
+            finally:
+                await writer.stop()
+        
+        results = asyncio.run(scenario())
+        assert results[0] == 1 and results[2] == 3
+        assert isinstance(results[1], ValueError)
+        assert query(server.DB_PATH, "SELECT id FROM items ORDER BY id") == [(1,), (3,)]
+    
+    def test_stop_commits_units_queued_before_it(self, server_db):
+        """Units already queued when stop() is called are committed and their callers resolved"""
+        server = server_db
+        create_items_table(server.DB_PATH)
+        
+        async def scenario():
+            writer = server.GroupCommitWriter()
+            await writer.start()
+            pending = [asyncio.create_task(writer.run(insert_item(i))) for i in range(1, 101)]
+            await asyncio.sleep(0)  # every run() has queued its unit
+            await writer.stop()
+            assert writer.queue is None and writer.db is None
+            return await asyncio.wait_for(asyncio.gather(*pending), 5)
+        
+        assert asyncio.run(scenario()) == list(range(1, 101))
+        assert query(server.DB_PATH, "SELECT COUNT(*) FROM items")[0][0] == 100
+    
+    def test_run_before_start_uses_own_transaction(self, server_db):
+        """Without start() a unit is committed in its own pool transaction"""
+        server = server_db
+        create_items_table(server.DB_PATH)
+        
+        async def scenario():
+            writer = server.GroupCommitWriter()
+            assert await writer.run(insert_item(7)) == 7
+            with pytest.raises(ValueError):
+                await writer.run(insert_item(8, fail=True))
+            assert writer.db is None
+        
+        asyncio.run(scenario())
+        assert query(server.DB_PATH, "SELECT id, name FROM items") == [(7, "item-7")]
+
+
+class TestBatchLoop:
+    """Shared _collect_batch loop"""
+    
+    def test_marker_cuts_batch_short(self, server_db):
+        """Items ahead of a flush Future come back as the batch, the Future as marker"""
+        server = server_db
+        
+        async def scenario():
+            queue = asyncio.Queue()
+            flushed = asyncio.get_running_loop().create_future()
+            for item in (("a",), ("b",), flushed, ("c",)):
+                queue.put_nowait(item)
+            first = await server._collect_batch(queue, 10, 0.05)
+            second = await server._collect_batch(queue, 10, 0.01)
+            return flushed, first, second
+        
+        flushed, first, second = asyncio.run(scenario())
+        assert first == ([("a",), ("b",)], flushed)
+        assert second == ([("c",)], None)
+    
+    def test_stop_sentinel_is_not_work(self, server_db):
+        """_QUEUE_STOP is returned as marker, never as a batch item"""
+        server = server_db
+        
+        async def scenario():
+            queue = asyncio.Queue()
+            queue.put_nowait(server._QUEUE_STOP)
+            return await server._collect_batch(queue, 10, 0.01)
+        
+        batch, marker = asyncio.run(scenario())
+        assert batch == []
+        assert marker is server._QUEUE_STOP
+
+
+class TestAuditLogBatcher:
+    """AuditLogBatcher flush/stop semantics"""
+    
+    def test_flush_resolves_after_queued_rows_are_written(self, server_db):
+        """flush() returns only once every row queued before it is in audit_logs"""
+        server = server_db
+        
+        async def scenario():
+            await server.init_db()
+            batcher = server.AuditLogBatcher()
+            batcher.start()
+            # More than one MAX_BATCH, so the flush marker sits behind several batches
+            for i in range(batcher.MAX_BATCH * 2 + 10):
+                await batcher.enqueue(audit_row(i))
+            await batcher.flush()
+            written = query(server.DB_PATH, "SELECT COUNT(*) FROM audit_logs")[0][0]
+            await batcher.stop()
+            return written
+        
+        assert asyncio.run(scenario()) == server.AuditLogBatcher.MAX_BATCH * 2 + 10
+    
+    def test_stop_writes_pending_rows_and_switches_to_write_through(self, server_db):
+        """Rows still queued at stop() are written; later entries are written directly"""
+        server = server_db
+        
+        async def scenario():
+            await server.init_db()
+            batcher = server.AuditLogBatcher()
+            batcher.start()
+            for i in range(30):
+                await batcher.enqueue(audit_row(i))
+            await batcher.stop()
+            assert batcher.queue is None
+            await batcher.enqueue(audit_row(30))
+        
+        asyncio.run(scenario())
+        assert query(server.DB_PATH, "SELECT COUNT(*) FROM audit_logs")[0][0] == 31
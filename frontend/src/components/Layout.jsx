@@ -90,6 +90,10 @@ const Layout = () => {
           
           if (data.type === 'connected') {
             console.log("SSE:", data.message);
+          } else if (Array.isArray(data)) {
+            // Burst of notifications delivered as one frame (oldest first)
+            console.log("New notifications received:", data.length);
+            setNotifications(prev => [...data.reverse(), ...prev]);
           } else {
             // New notification received
             console.log("New notification received:", data);
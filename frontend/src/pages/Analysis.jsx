@@ -233,6 +233,7 @@ const Analysis = () => {
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
       let buffer = "";
+      let tableRows = []; // tableData arrives in { rows } slices before the final event
 
       while (true) {
         const { done, value } = await reader.read();
@@ -251,10 +252,14 @@ const Analysis = () => {
                 setAnalysisOutput(prev => prev + data.log + "\n");
               }
               
-              if (data.success && data.tableData) {
-                setAnalysisResults(data.tableData);
+              if (data.rows) {
+                tableRows = tableRows.concat(data.rows);
+              }
+              
+              if (data.success && data.done) {
+                setAnalysisResults(tableRows);
                 setAnalysisStats(data.stats);
-                toast.success(`${data.tableData.length} test analiz edildi!`);
+                toast.success(`${tableRows.length} test analiz edildi!`);
               }
               
               if (data.error) {
@@ -338,6 +343,7 @@ const Analysis = () => {
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
       let buffer = "";
+      let tableRows = []; // tableData arrives in { rows } slices before the final event
 
       while (true) {
         const { done, value } = await reader.read();
@@ -358,8 +364,10 @@ const Analysis = () => {
                 setApiOutput(prev => prev + eventData.log + "\n");
               } else if (eventData.error) {
                 toast.error(eventData.error);
-              } else if (eventData.success && eventData.tableData) {
-                setApiResults(eventData.tableData);
+              } else if (eventData.rows) {
+                tableRows = tableRows.concat(eventData.rows);
+              } else if (eventData.success && eventData.done) {
+                setApiResults(tableRows);
                 setApiStats(eventData.stats);
                 if (eventData.managementMetrics) {
                   setApiMetrics(eventData.managementMetrics);